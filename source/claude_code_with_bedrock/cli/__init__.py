@@ -3,80 +3,69 @@
 
 """Command-line interface for Claude Code with Bedrock."""
 
+from importlib import import_module
+
 from cleo.application import Application
+from cleo.commands.command import Command
+from cleo.loaders.factory_command_loader import FactoryCommandLoader
 
-from .commands.builds import BuildsCommand
-from .commands.cleanup import CleanupCommand
-from .commands.context import (
-    ConfigExportCommand,
-    ConfigImportCommand,
-    ConfigValidateCommand,
-    ContextCurrentCommand,
-    ContextListCommand,
-    ContextShowCommand,
-    ContextUseCommand,
-)
-from .commands.deploy import DeployCommand
-from .commands.destroy import DestroyCommand
-from .commands.distribute import DistributeCommand
-from .commands.init import InitCommand
-from .commands.package import PackageCommand
-from .commands.quota import (
-    QuotaDeleteCommand,
-    QuotaExportCommand,
-    QuotaImportCommand,
-    QuotaListCommand,
-    QuotaSetDefaultCommand,
-    QuotaSetGroupCommand,
-    QuotaSetUserCommand,
-    QuotaShowCommand,
-    QuotaUnblockCommand,
-    QuotaUsageCommand,
-)
-from .commands.status import StatusCommand
-from .commands.test import TestCommand
-
-# TokenCommand temporarily disabled - not implemented
+# Command name -> (module under .commands, class name)
+# Command modules are imported only when the command is run, so one command
+# does not pay the import cost (boto3, rich, questionary) of every other one.
+COMMANDS = {
+    "init": ("init", "InitCommand"),
+    "deploy": ("deploy", "DeployCommand"),
+    "status": ("status", "StatusCommand"),
+    "test": ("test", "TestCommand"),
+    "package": ("package", "PackageCommand"),
+    "builds": ("builds", "BuildsCommand"),
+    "distribute": ("distribute", "DistributeCommand"),
+    "destroy": ("destroy", "DestroyCommand"),
+    "cleanup": ("cleanup", "CleanupCommand"),
+    # "token": ("token", "TokenCommand"),  # Temporarily disabled - not implemented
+    # Context management commands
+    "context list": ("context", "ContextListCommand"),
+    "context current": ("context", "ContextCurrentCommand"),
+    "context use": ("context", "ContextUseCommand"),
+    "context show": ("context", "ContextShowCommand"),
+    # Config management commands
+    "config validate": ("context", "ConfigValidateCommand"),
+    "config export": ("context", "ConfigExportCommand"),
+    "config import": ("context", "ConfigImportCommand"),
+    # Quota management commands
+    "quota set-user": ("quota", "QuotaSetUserCommand"),
+    "quota set-group": ("quota", "QuotaSetGroupCommand"),
+    "quota set-default": ("quota", "QuotaSetDefaultCommand"),
+    "quota list": ("quota", "QuotaListCommand"),
+    "quota delete": ("quota", "QuotaDeleteCommand"),
+    "quota show": ("quota", "QuotaShowCommand"),
+    "quota usage": ("quota", "QuotaUsageCommand"),
+    "quota unblock": ("quota", "QuotaUnblockCommand"),
+    "quota export": ("quota", "QuotaExportCommand"),
+    "quota import": ("quota", "QuotaImportCommand"),
+}
 
 
-def create_application() -> Application:
-    """Create the CLI application."""
-    application = Application("claude-code-with-bedrock", "1.0.0")
+def _command_factory(module_name: str, class_name: str):
+    """Create a factory that imports and instantiates a command on first use."""
 
-    # Add commands
-    application.add(InitCommand())
-    application.add(DeployCommand())
-    application.add(StatusCommand())
-    application.add(TestCommand())
-    application.add(PackageCommand())
-    application.add(BuildsCommand())
-    application.add(DistributeCommand())
-    application.add(DestroyCommand())
-    application.add(CleanupCommand())
-    # application.add(TokenCommand())  # Temporarily disabled
+    def factory() -> Command:
+        module = import_module(f".commands.{module_name}", __name__)
+        return getattr(module, class_name)()
 
-    # Context management commands
-    application.add(ContextListCommand())
-    application.add(ContextCurrentCommand())
-    application.add(ContextUseCommand())
-    application.add(ContextShowCommand())
+    return factory
 
-    # Config management commands
-    application.add(ConfigValidateCommand())
-    application.add(ConfigExportCommand())
-    application.add(ConfigImportCommand())
 
-    # Quota management commands
-    application.add(QuotaSetUserCommand())
-    application.add(QuotaSetGroupCommand())
-    application.add(QuotaSetDefaultCommand())
-    application.add(QuotaListCommand())
-    application.add(QuotaDeleteCommand())
-    application.add(QuotaShowCommand())
-    application.add(QuotaUsageCommand())
-    application.add(QuotaUnblockCommand())
-    application.add(QuotaExportCommand())
-    application.add(QuotaImportCommand())
+def create_application() -> Application:
+    """Create the CLI application."""
+    application = Application("claude-code-with-bedrock", "1.0.0")
+
+    # Register commands lazily
+    application.set_command_loader(
+        FactoryCommandLoader(
+            {name: _command_factory(module_name, class_name) for name, (module_name, class_name) in COMMANDS.items()}
+        )
+    )
 
     return application
 
@@ -3,13 +3,19 @@
 
 """CLI commands for Claude Code with Bedrock."""
 
-from .builds import BuildsCommand
-from .deploy import DeployCommand
-from .destroy import DestroyCommand
-from .init import InitCommand
-from .package import PackageCommand
-from .status import StatusCommand
-from .test import TestCommand
+from importlib import import_module
+
+# Command class -> submodule; resolved on first attribute access (PEP 562) so that
+# importing one command module does not import all of them.
+_COMMAND_MODULES = {
+    "InitCommand": ".init",
+    "DeployCommand": ".deploy",
+    "StatusCommand": ".status",
+    "TestCommand": ".test",
+    "PackageCommand": ".package",
+    "BuildsCommand": ".builds",
+    "DestroyCommand": ".destroy",
+}
 
 __all__ = [
     "InitCommand",
@@ -20,3 +26,9 @@ __all__ = [
     "BuildsCommand",
     "DestroyCommand",
 ]
+
+
+def __getattr__(name: str):
+    if name in _COMMAND_MODULES:
+        return getattr(import_module(_COMMAND_MODULES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
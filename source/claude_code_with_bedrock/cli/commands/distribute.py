@@ -8,6 +8,7 @@ import json
 import shutil
 import tempfile
 import threading
+import zipfile
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -23,6 +24,21 @@ from rich.progress import BarColumn, DownloadColumn, Progress, SpinnerColumn, Te
 from claude_code_with_bedrock.cli.utils.aws import get_stack_outputs
 from claude_code_with_bedrock.config import Config
 
+# Package archives are written through a 1 MiB buffer instead of the default 8 KiB, so the
+# multi-megabyte binaries reach disk in a few large writes
+ARCHIVE_WRITE_BUFFER_SIZE = 1 << 20
+
+
+def archive_compress_type(path: Path) -> int:
+    """Pick the zip compression for a package file.
+
+    The credential-process and otel-helper binaries are already compressed by PyInstaller or
+    Nuitka, so deflating them again costs CPU for no size gain; they are stored as-is.
+    """
+    if path.name.startswith(("credential-process-", "otel-helper-")):
+        return zipfile.ZIP_STORED
+    return zipfile.ZIP_DEFLATED
+
 
 class S3UploadProgress:
     """Track S3 upload progress."""
@@ -422,8 +438,6 @@ class DistributeCommand(Command):
 
     def _upload_landing_page_packages(self, profile, console: Console, package_path: Path) -> int:
         """Upload platform-specific packages to S3 for the landing page."""
-        import zipfile
-
         import boto3
 
         # Validate package directory
@@ -595,12 +609,19 @@ class DistributeCommand(Command):
                 # Create platform-specific ZIP
                 zip_path = temp_dir / f"{platform}.zip"
 
-                with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zipf:
+                with (
+                    open(zip_path, "wb", buffering=ARCHIVE_WRITE_BUFFER_SIZE) as zip_file,
+                    zipfile.ZipFile(zip_file, "w", zipfile.ZIP_DEFLATED) as zipf,
+                ):
                     # Create claude-code-package directory in the ZIP
                     for source_file, archive_name in files:
                         source_path = package_path / source_file
                         if source_path.exists():
-                            zipf.write(source_path, f"claude-code-package/{archive_name}")
+                            zipf.write(
+                                source_path,
+                                f"claude-code-package/{archive_name}",
+                                compress_type=archive_compress_type(source_path),
+                            )
 
                     # Include claude-settings if it exists
                     settings_dir = package_path / "claude-settings"
@@ -1086,8 +1107,6 @@ class DistributeCommand(Command):
 
     def _create_archive(self, package_path: Path) -> Path:
         """Create a zip archive of the package directory."""
-        import zipfile
-
         # Create temp directory for archive
         temp_dir = Path(tempfile.mkdtemp())
         archive_path = temp_dir / "claude-code-package.zip"
@@ -1131,14 +1150,17 @@ class DistributeCommand(Command):
 
         # Create zip archive with contents at root level
         # When extracted, it will create claude-code-package/ with files directly inside
-        with zipfile.ZipFile(archive_path, "w", zipfile.ZIP_DEFLATED) as zf:
+        with (
+            open(archive_path, "wb", buffering=ARCHIVE_WRITE_BUFFER_SIZE) as archive_file,
+            zipfile.ZipFile(archive_file, "w", zipfile.ZIP_DEFLATED) as zf,
+        ):
             # Add all files from the package directory
             for file in package_temp_dir.rglob("*"):
                 if file.is_file():
                     # Get relative path from package_temp_dir (not temp_dir) to avoid nested directories
                     # This creates paths like "config.json", "install.sh" instead of "claude-code-package/config.json"
                     arcname = f"claude-code-package/{file.relative_to(package_temp_dir)}"
-                    zf.write(file, arcname)
+                    zf.write(file, arcname, compress_type=archive_compress_type(file))
 
         # Clean up temp package directory
         shutil.rmtree(package_temp_dir)
@@ -1147,9 +1169,12 @@ class DistributeCommand(Command):
 
     def _calculate_checksum(self, file_path: Path) -> str:
         """Calculate SHA256 checksum of a file."""
-        sha256_hash = hashlib.sha256()
-        with open(file_path, "rb") as f:
-            for byte_block in iter(lambda: f.read(4096), b""):
+        with open(file_path, "rb", buffering=0) as f:
+            # hashlib.file_digest (Python 3.11+) reads and hashes in C, outside the GIL
+            if hasattr(hashlib, "file_digest"):
+                return hashlib.file_digest(f, "sha256").hexdigest()
+            sha256_hash = hashlib.sha256()
+            for byte_block in iter(lambda: f.read(1 << 20), b""):
                 sha256_hash.update(byte_block)
         return sha256_hash.hexdigest()
 
@@ -1211,8 +1236,6 @@ class DistributeCommand(Command):
 
     def _download_windows_artifacts(self, profile, package_path: Path, console: Console) -> bool:
         """Download Windows build artifacts from S3."""
-        import zipfile
-
         from botocore.exceptions import ClientError
 
         from claude_code_with_bedrock.cli.utils.aws import get_stack_outputs
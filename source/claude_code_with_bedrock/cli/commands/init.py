@@ -5,12 +5,19 @@
 
 import json
 import re
-import subprocess
+import shutil
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from functools import cache
 from pathlib import Path
 from typing import Any
+from urllib.parse import urlparse
 
 import boto3
+import cfn_flip
 import questionary
+from botocore.exceptions import ClientError
 from cleo.commands.command import Command
 from cleo.helpers import option
 from rich import box
@@ -20,16 +27,178 @@ from rich.table import Table
 
 from claude_code_with_bedrock.cli.utils.aws import (
     check_bedrock_access,
+    detect_cognito_stack,
     get_account_id,
+    get_all_vpcs_and_subnets,
     get_current_region,
-    get_subnets,
-    get_vpcs,
+    validate_cognito_stack_for_distribution,
 )
+from claude_code_with_bedrock.cli.utils.cloudformation import CloudFormationManager
 from claude_code_with_bedrock.cli.utils.progress import WizardProgress
 from claude_code_with_bedrock.cli.utils.validators import (
     validate_oidc_provider_domain,
 )
-from claude_code_with_bedrock.config import Config, Profile
+from claude_code_with_bedrock.config import Config, Profile, atomic_write_text
+from claude_code_with_bedrock.models import (
+    CLAUDE_MODELS,
+    get_available_profiles_for_model,
+    get_destination_regions_for_model_profile,
+    get_model_id_for_profile,
+    get_model_key_for_model_id,
+    get_profile_description,
+    get_source_regions_for_model_profile,
+)
+from claude_code_with_bedrock.utils.url_validation import get_known_provider_type
+
+# Common AWS regions offered for infrastructure deployment (in display order)
+COMMON_REGIONS = (
+    "us-east-1",
+    "us-east-2",
+    "us-west-1",
+    "us-west-2",
+    "us-gov-west-1",
+    "us-gov-east-1",
+    "eu-west-1",
+    "eu-west-2",
+    "eu-west-3",
+    "eu-central-1",
+    "ap-northeast-1",
+    "ap-northeast-2",
+    "ap-southeast-1",
+    "ap-southeast-2",
+    "ap-south-1",
+    "ca-central-1",
+    "sa-east-1",
+)
+COMMON_REGIONS_SET = frozenset(COMMON_REGIONS)
+
+# Validation patterns (compiled once; questionary validators run on every keystroke)
+IDENTITY_POOL_NAME_PATTERN = re.compile(r"^[a-zA-Z0-9_-]+$")
+COGNITO_USER_POOL_ID_PATTERN = re.compile(r"^[\w-]+_[0-9a-zA-Z]+$")
+
+# Cognito region detection patterns (handles both .auth. and .auth-fips. hosted UI domains)
+COGNITO_DOMAIN_REGION_PATTERN = re.compile(r"\.auth(?:-fips)?\.([^.]+)\.amazoncognito\.com")
+REGION_IN_DOMAIN_PATTERN = re.compile(r"\.([a-z]{2}-(?:gov-)?[a-z]+-\d+)\.")
+
+# Wizard sections that can be re-run on their own when updating a profile (key, label)
+CONFIG_SECTIONS = (
+    ("oidc", "OIDC provider"),
+    ("aws", "AWS infrastructure"),
+    ("monitoring", "Monitoring and quotas"),
+    ("features", "Windows builds and package distribution"),
+    ("bedrock", "Bedrock model selection"),
+)
+
+# Display names for saved Bedrock model IDs
+MODEL_DISPLAY_NAMES = {
+    "global.anthropic.claude-opus-4-6-v1": "Claude Opus 4.6 (Global)",
+    "us.anthropic.claude-opus-4-6-v1": "Claude Opus 4.6",
+    "eu.anthropic.claude-opus-4-6-v1": "Claude Opus 4.6 (EU)",
+    "au.anthropic.claude-opus-4-6-v1": "Claude Opus 4.6 (AU)",
+    "us.anthropic.claude-opus-4-1-20250805-v1:0": "Claude Opus 4.1",
+    "us.anthropic.claude-opus-4-20250514-v1:0": "Claude Opus 4",
+    "us.anthropic.claude-3-7-sonnet-20250219-v1:0": "Claude 3.7 Sonnet",
+    "us.anthropic.claude-sonnet-4-20250514-v1:0": "Claude Sonnet 4",
+}
+
+# Cross-region profile descriptions shown in the configuration review
+CROSS_REGION_PROFILE_DETAILS = {
+    "us": "US Cross-Region (us-east-1, us-east-2, us-west-2)",
+    "europe": "Europe Cross-Region (eu-west-1, eu-west-3, eu-central-1, eu-north-1)",
+    "apac": "APAC Cross-Region (ap-northeast-1, ap-southeast-1/2, ap-south-1)",
+}
+
+# Short cross-region profile names shown for an existing deployment
+CROSS_REGION_PROFILE_NAMES = {
+    "us": "US Cross-Region (us-east-1, us-east-2, us-west-2)",
+    "europe": "Europe Cross-Region",
+    "apac": "APAC Cross-Region",
+}
+
+# Regions where Bedrock is currently available.
+# This list should be updated as AWS expands Bedrock availability.
+BEDROCK_REGIONS = (
+    "us-east-1",  # N. Virginia
+    "us-east-2",  # Ohio
+    "us-west-2",  # Oregon
+    "ap-northeast-1",  # Tokyo
+    "ap-southeast-1",  # Singapore
+    "ap-southeast-2",  # Sydney
+    "eu-central-1",  # Frankfurt
+    "eu-west-1",  # Ireland
+    "eu-west-3",  # Paris
+    "ap-south-1",  # Mumbai
+    "ca-central-1",  # Canada
+)
+
+# The CLI requires Python 3.10+; the interpreter cannot change while running
+PYTHON_VERSION_SUPPORTED = sys.version_info >= (3, 10)
+
+# CloudFormation templates and the shared parameters file (same location deploy uses)
+INFRASTRUCTURE_DIR = Path(__file__).parents[4] / "deployment" / "infrastructure"
+
+# Cross-region profile labels shown next to each model in the model picker (in display order)
+PROFILE_DISPLAY_LABELS = (("global", "Global"), ("us", "US"), ("europe", "Europe"), ("apac", "APAC"))
+
+
+@cache
+def get_model_choice_titles() -> tuple[tuple[str, str], ...]:
+    """Build the (title, model_key) pairs for the model picker.
+
+    CLAUDE_MODELS is static, so the titles are computed once per process.
+
+    Returns:
+        Tuple of (display title, model key) pairs in CLAUDE_MODELS order
+    """
+    titles = []
+    for model_key, model_info in CLAUDE_MODELS.items():
+        available_profiles = get_available_profiles_for_model(model_key)
+        regions_text = ", ".join(label for key, label in PROFILE_DISPLAY_LABELS if key in available_profiles)
+        titles.append((f"{model_info['name']} ({regions_text})", model_key))
+    return tuple(titles)
+
+
+@dataclass
+class ProviderInfo:
+    """OIDC provider details derived from the domain the user entered."""
+
+    hostname: str | None
+    provider_type: str | None  # None when the domain is not a recognised provider
+    region: str | None  # AWS region embedded in the hostname, if any
+
+
+def parse_provider_domain(provider_domain: str) -> ProviderInfo:
+    """Parse a provider domain once into its hostname, provider type and region.
+
+    Args:
+        provider_domain: Domain or URL as entered by the user
+
+    Returns:
+        ProviderInfo for the domain (all fields None if it cannot be parsed)
+    """
+    # Handle both full URLs and domain-only inputs
+    url_to_parse = (
+        provider_domain if provider_domain.startswith(("http://", "https://")) else f"https://{provider_domain}"
+    )
+    try:
+        hostname = urlparse(url_to_parse).hostname
+    except ValueError:
+        hostname = None
+    if not hostname:
+        return ProviderInfo(hostname=None, provider_type=None, region=None)
+
+    hostname = hostname.lower()
+    # Exact domain or subdomain match only, which prevents bypass attacks
+    provider_type = get_known_provider_type(hostname)
+    if provider_type is None and hostname.startswith("cognito-idp.") and ".amazonaws.com" in hostname:
+        # Handle cognito-idp.{region}.amazonaws.com format (commercial and GovCloud)
+        provider_type = "cognito"
+
+    # Detect region from the hostname (handles both .auth. and .auth-fips.)
+    region_match = COGNITO_DOMAIN_REGION_PATTERN.search(hostname) or REGION_IN_DOMAIN_PATTERN.search(hostname)
+    return ProviderInfo(
+        hostname=hostname, provider_type=provider_type, region=region_match.group(1) if region_match else None
+    )
 
 
 def validate_identity_pool_name(value: str) -> bool | str:
@@ -41,7 +210,7 @@ def validate_identity_pool_name(value: str) -> bool | str:
     Returns:
         True if valid, error message if invalid
     """
-    if value and re.match(r"^[a-zA-Z0-9_-]+$", value):
+    if value and IDENTITY_POOL_NAME_PATTERN.match(value):
         return True
     return "Invalid pool name (alphanumeric, underscore, hyphen only)"
 
@@ -55,11 +224,42 @@ def validate_cognito_user_pool_id(value: str) -> bool | str:
     Returns:
         True if valid, error message if invalid
     """
-    if re.match(r"^[\w-]+_[0-9a-zA-Z]+$", value):
+    if COGNITO_USER_POOL_ID_PATTERN.match(value):
         return True
     return "Invalid User Pool ID format"
 
 
+def validate_section_selection(value: list[str]) -> bool | str:
+    """Validate that at least one configuration section was selected.
+
+    Args:
+        value: The selected section keys
+
+    Returns:
+        True if valid, error message if invalid
+    """
+    if value:
+        return True
+    return "Select at least one section to update"
+
+
+def build_vpc_choice(vpc: dict[str, Any]) -> questionary.Choice:
+    """Build the VPC picker entry for a VPC returned by get_all_vpcs_and_subnets()."""
+    label = f"{vpc['id']} - {vpc['cidr']}"
+    if vpc["name"]:
+        label = f"{vpc['name']} ({label})"
+    default_marker = " [DEFAULT]" if vpc["is_default"] else ""
+    return questionary.Choice(f"{label}{default_marker}", value=vpc["id"])
+
+
+def build_subnet_choice(subnet: dict[str, Any]) -> questionary.Choice:
+    """Build the subnet picker entry for a subnet; public subnets are preselected."""
+    name_prefix = f"{subnet['name']} - " if subnet["name"] else ""
+    public_marker = " [PUBLIC]" if subnet["is_public"] else ""
+    label = f"{name_prefix}{subnet['id']} - {subnet['cidr']} ({subnet['availability_zone']}){public_marker}"
+    return questionary.Choice(label, value=subnet["id"], checked=subnet["is_public"])
+
+
 class InitCommand(Command):
     name = "init"
     description = "Interactive setup wizard for first-time deployment"
@@ -74,9 +274,27 @@ class InitCommand(Command):
         )
     ]
 
+    def __init__(self) -> None:
+        super().__init__()
+        # CloudFormation managers (one boto3 client each), memoized per region
+        self._cf_managers: dict[str, CloudFormationManager] = {}
+        # describe_stacks results keyed by (stack name, region); None means the stack does not exist
+        self._stack_cache: dict[tuple[str, str], dict[str, Any] | None] = {}
+        # Prerequisite check results, resolved on first use
+        self._aws_cli_ok: bool | None = None
+        self._aws_credentials_ok: bool | None = None
+        # One console for the whole wizard, so the terminal is probed once
+        self._console = Console()
+
+    def _cf_manager(self, region: str) -> CloudFormationManager:
+        """Get the CloudFormation manager for a region, creating it on first use."""
+        if region not in self._cf_managers:
+            self._cf_managers[region] = CloudFormationManager(region=region)
+        return self._cf_managers[region]
+
     def handle(self) -> int:
         """Execute the init command."""
-        console = Console()
+        console = self._console
         progress = WizardProgress("init")
 
         try:
@@ -104,7 +322,11 @@ class InitCommand(Command):
 
         # If user explicitly chose "Update existing profile", skip the second prompt
         if existing_config and user_action == "update":
-            config = self._gather_configuration(progress, existing_config, profile_name)
+            fields_to_update = self._select_sections_to_update()
+            if fields_to_update is None:
+                console.print("\n[yellow]Setup cancelled.[/yellow]")
+                return 1
+            config = self._gather_configuration(progress, existing_config, profile_name, fields_to_update)
             if not config:
                 return 1
             if not self._review_configuration(config):
@@ -145,7 +367,11 @@ class InitCommand(Command):
                 self._review_configuration(existing_config)
                 return 0
             elif action == "Update configuration":
-                config = self._gather_configuration(progress, existing_config, profile_name)
+                fields_to_update = self._select_sections_to_update()
+                if fields_to_update is None:
+                    console.print("\n[yellow]Setup cancelled.[/yellow]")
+                    return 1
+                config = self._gather_configuration(progress, existing_config, profile_name, fields_to_update)
                 if not config:
                     return 1
                 if not self._review_configuration(config):
@@ -225,7 +451,7 @@ class InitCommand(Command):
 
     def _check_prerequisites(self) -> bool:
         """Check system prerequisites."""
-        console = Console()
+        console = self._console
 
         console.print("[bold cyan]Prerequisites Check:[/bold cyan]")
 
@@ -267,9 +493,34 @@ class InitCommand(Command):
         console.print("")
         return True
 
-    def _gather_configuration(self, progress: WizardProgress, existing_config: dict[str, Any] = None, profile_name: str | None = None) -> dict[str, Any]:
-        """Gather configuration from user."""
-        console = Console()
+    def _select_sections_to_update(self) -> set[str] | None:
+        """Ask which configuration sections to re-run when updating a profile.
+
+        Returns:
+            Set of CONFIG_SECTIONS keys to update, or None if the user cancelled
+        """
+        selected = questionary.checkbox(
+            "Which sections would you like to update?",
+            choices=[questionary.Choice(label, value=key) for key, label in CONFIG_SECTIONS],
+            validate=validate_section_selection,
+        ).ask()
+        if selected is None:  # User cancelled
+            return None
+        return set(selected)
+
+    def _gather_configuration(
+        self,
+        progress: WizardProgress,
+        existing_config: dict[str, Any] = None,
+        profile_name: str | None = None,
+        fields_to_update: set[str] | None = None,
+    ) -> dict[str, Any]:
+        """Gather configuration from user.
+
+        When updating an existing config, only the CONFIG_SECTIONS named in
+        fields_to_update are prompted for (all of them if it is None).
+        """
+        console = self._console
         # Use existing config as base if provided, otherwise use saved progress
         if existing_config:
             config = existing_config.copy()
@@ -279,17 +530,21 @@ class InitCommand(Command):
 
         # Skip completed steps only if we're not updating existing config
         if existing_config:
-            # When updating existing config, don't skip any steps
-            skip_okta = False
-            skip_aws = False
-            skip_monitoring = False
-            skip_bedrock = False
+            # When updating existing config, only run the sections the user asked to change
+            if fields_to_update is None:
+                fields_to_update = {key for key, _label in CONFIG_SECTIONS}
+            skip_okta = "oidc" not in fields_to_update
+            skip_aws = "aws" not in fields_to_update
+            skip_monitoring = "monitoring" not in fields_to_update
+            skip_features = "features" not in fields_to_update
+            skip_bedrock = "bedrock" not in fields_to_update
         else:
             # Normal progress-based skipping for new installations
             skip_okta = last_step in ["okta_complete", "aws_complete", "monitoring_complete", "bedrock_complete"]
             skip_aws = last_step in ["aws_complete", "monitoring_complete", "bedrock_complete"]
             skip_monitoring = last_step in ["monitoring_complete", "bedrock_complete"]
             skip_bedrock = last_step in ["bedrock_complete"]
+            skip_features = False
 
         # OIDC Provider Configuration
         if not skip_okta:
@@ -313,69 +568,38 @@ class InitCommand(Command):
                 return None
 
             # Strip https:// or http:// if provided
-            provider_domain = provider_domain.replace("https://", "").replace("http://", "").strip("/")
+            provider_domain = provider_domain.removeprefix("https://").removeprefix("http://").strip("/")
 
-            # Auto-detect provider type
-            provider_type = None
+            # Auto-detect provider type and region from a single parse of the domain
+            provider_info = parse_provider_domain(provider_domain)
+            provider_type = provider_info.provider_type
             cognito_user_pool_id = None
 
-            # Secure provider detection using proper URL parsing
-            from urllib.parse import urlparse
-
-            # Handle both full URLs and domain-only inputs
-            url_to_parse = (
-                provider_domain if provider_domain.startswith(("http://", "https://")) else f"https://{provider_domain}"
-            )
-
-            try:
-                parsed = urlparse(url_to_parse)
-                hostname = parsed.hostname
-
-                if hostname:
-                    hostname_lower = hostname.lower()
-
-                    # Check for exact domain match or subdomain match
-                    # Using endswith with leading dot prevents bypass attacks
-                    if hostname_lower.endswith(".okta.com") or hostname_lower == "okta.com":
-                        provider_type = "okta"
-                    elif hostname_lower.endswith(".auth0.com") or hostname_lower == "auth0.com":
-                        provider_type = "auth0"
-                    elif hostname_lower.endswith(".microsoftonline.com") or hostname_lower == "microsoftonline.com":
-                        provider_type = "azure"
-                    elif hostname_lower.endswith(".windows.net") or hostname_lower == "windows.net":
-                        provider_type = "azure"
-                    elif hostname_lower.endswith(".amazoncognito.com") or hostname_lower == "amazoncognito.com":
-                        provider_type = "cognito"
-                    elif hostname_lower.startswith("cognito-idp.") and ".amazonaws.com" in hostname_lower:
-                        # Handle cognito-idp.{region}.amazonaws.com format (commercial and GovCloud)
-                        provider_type = "cognito"
-                    elif questionary.confirm("Is this a custom domain for AWS Cognito User Pool?", default=False).ask():
-                        provider_type = "cognito"
-            except Exception:
-                pass  # Continue to manual selection if parsing fails
+            if (
+                provider_type is None
+                and provider_info.hostname
+                and questionary.confirm("Is this a custom domain for AWS Cognito User Pool?", default=False).ask()
+            ):
+                provider_type = "cognito"
 
             # For Cognito, we must ask for the User Pool ID
             # Cannot reliably extract from domain due to case sensitivity
             if provider_type == "cognito":
-                # Try to detect region from domain (handles both .auth. and .auth-fips.)
-                region_match = re.search(r"\.auth(?:-fips)?\.([^.]+)\.amazoncognito\.com", provider_domain)
-                if not region_match:
-                    region_match = re.search(r"\.([a-z]{2}-(?:gov-)?[a-z]+-\d+)\.", provider_domain)
+                detected_region = provider_info.region
 
                 # Auto-correct domain for GovCloud regions (must use auth-fips instead of auth)
-                if region_match:
-                    detected_region = region_match.group(1)
-                    if (
-                        detected_region.startswith("us-gov-")
-                        and ".auth." in provider_domain
-                        and ".auth-fips." not in provider_domain
-                    ):
-                        corrected_domain = provider_domain.replace(".auth.", ".auth-fips.")
-                        console.print("\n[yellow]GovCloud detected: Correcting domain to use FIPS endpoint[/yellow]")
-                        console.print(f"[dim]  {provider_domain} → {corrected_domain}[/dim]")
-                        provider_domain = corrected_domain
-
-                region_hint = f" for {region_match.group(1)}" if region_match else ""
+                if (
+                    detected_region
+                    and detected_region.startswith("us-gov-")
+                    and ".auth." in provider_domain
+                    and ".auth-fips." not in provider_domain
+                ):
+                    corrected_domain = provider_domain.replace(".auth.", ".auth-fips.")
+                    console.print("\n[yellow]GovCloud detected: Correcting domain to use FIPS endpoint[/yellow]")
+                    console.print(f"[dim]  {provider_domain} → {corrected_domain}[/dim]")
+                    provider_domain = corrected_domain
+
+                region_hint = f" for {detected_region}" if detected_region else ""
 
                 # Always ask for User Pool ID to ensure correct case
                 cognito_user_pool_id = questionary.text(
@@ -486,10 +710,7 @@ class InitCommand(Command):
                 return None
 
             # Preserve existing okta settings, only update domain/client_id
-            if "okta" not in config:
-                config["okta"] = {}
-            config["okta"]["domain"] = provider_domain
-            config["okta"]["client_id"] = client_id
+            config.setdefault("okta", {}).update({"domain": provider_domain, "client_id": client_id})
             config["credential_storage"] = credential_storage
             config["provider_type"] = provider_type
             if cognito_user_pool_id:
@@ -528,70 +749,60 @@ class InitCommand(Command):
 
             current_region = get_current_region()
 
-            # Get list of common AWS regions
-            common_regions = [
-                "us-east-1",
-                "us-east-2",
-                "us-west-1",
-                "us-west-2",
-                "us-gov-west-1",
-                "us-gov-east-1",
-                "eu-west-1",
-                "eu-west-2",
-                "eu-west-3",
-                "eu-central-1",
-                "ap-northeast-1",
-                "ap-northeast-2",
-                "ap-southeast-1",
-                "ap-southeast-2",
-                "ap-south-1",
-                "ca-central-1",
-                "sa-east-1",
-            ]
-
             # Check for saved region
             saved_region = config.get("aws", {}).get("region", current_region)
 
-            region = questionary.select(
-                "Select AWS Region for infrastructure deployment (Cognito, IAM, monitoring):",
-                choices=common_regions,
-                default=saved_region if saved_region in common_regions else "us-east-1",
-                instruction="(This is where your authentication and monitoring resources will be created)",
-            ).ask()
-
-            if not region:
-                return None
-
             # For Direct STS, we use a stack name instead of Identity Pool Name
             # But we keep the same field for backward compatibility
             federation_type = config.get("federation_type", "cognito")
-            if federation_type == "direct":
-                stack_base_name = questionary.text(
-                    "Stack base name (for CloudFormation):",
-                    default=config.get("aws", {}).get("identity_pool_name", "claude-code-auth"),
-                    validate=validate_identity_pool_name,
-                ).ask()
-            else:
-                stack_base_name = questionary.text(
-                    "Identity Pool Name:",
-                    default=config.get("aws", {}).get("identity_pool_name", "claude-code-auth"),
-                    validate=validate_identity_pool_name,
-                ).ask()
 
-            if not stack_base_name:
+            # Region and name are independent, so ask both in a single prompt session
+            answers = questionary.prompt(
+                [
+                    {
+                        "type": "select",
+                        "name": "region",
+                        "message": "Select AWS Region for infrastructure deployment (Cognito, IAM, monitoring):",
+                        "choices": COMMON_REGIONS,
+                        "default": saved_region if saved_region in COMMON_REGIONS_SET else "us-east-1",
+                        "instruction": "(This is where your authentication and monitoring resources will be created)",
+                    },
+                    {
+                        "type": "text",
+                        "name": "stack_base_name",
+                        "message": (
+                            "Stack base name (for CloudFormation):"
+                            if federation_type == "direct"
+                            else "Identity Pool Name:"
+                        ),
+                        "default": config.get("aws", {}).get("identity_pool_name", "claude-code-auth"),
+                        "validate": validate_identity_pool_name,
+                    },
+                ]
+            )
+
+            region = answers.get("region")
+            stack_base_name = answers.get("stack_base_name")
+            if not region or not stack_base_name:
                 return None
 
             # Preserve existing AWS settings, only update region/identity_pool_name/stacks
-            if "aws" not in config:
-                config["aws"] = {}
-            config["aws"]["region"] = region
-            config["aws"]["identity_pool_name"] = stack_base_name  # Keep same field name for compatibility
-            config["aws"]["stacks"] = {
-                "auth": f"{stack_base_name}-stack",
-                "monitoring": f"{stack_base_name}-monitoring",
-                "dashboard": f"{stack_base_name}-dashboard",
-                "analytics": f"{stack_base_name}-analytics",
-            }
+            aws_config = config.setdefault("aws", {})
+            aws_config.update(
+                {
+                    "region": region,
+                    "identity_pool_name": stack_base_name,  # Keep same field name for compatibility
+                }
+            )
+            # Merge so stack names for other components (quota, codebuild, ...) survive an update
+            aws_config.setdefault("stacks", {}).update(
+                {
+                    "auth": f"{stack_base_name}-stack",
+                    "monitoring": f"{stack_base_name}-monitoring",
+                    "dashboard": f"{stack_base_name}-dashboard",
+                    "analytics": f"{stack_base_name}-analytics",
+                }
+            )
 
             # Save progress
             progress.save_step("aws_complete", config)
@@ -609,9 +820,7 @@ class InitCommand(Command):
             ).ask()
 
             # Preserve existing monitoring settings, only update enabled flag
-            if "monitoring" not in config:
-                config["monitoring"] = {}
-            config["monitoring"]["enabled"] = enable_monitoring
+            config.setdefault("monitoring", {})["enabled"] = enable_monitoring
 
             # If monitoring is enabled, configure VPC
             if enable_monitoring:
@@ -648,7 +857,7 @@ class InitCommand(Command):
                     hosted_zones = self._get_hosted_zones()
                     if hosted_zones:
                         zone_choices = [
-                            f"{zone['Name'].rstrip('.')} ({zone['Id'].split('/')[-1]})" for zone in hosted_zones
+                            f"{zone['Name'].rstrip('.')} ({zone['Id'].rpartition('/')[2]})" for zone in hosted_zones
                         ]
 
                         # Pre-select existing zone if available
@@ -666,7 +875,7 @@ class InitCommand(Command):
                         ).ask()
 
                         # Extract zone ID
-                        zone_id = selected_zone.split("(")[-1].rstrip(")")
+                        zone_id = selected_zone.rpartition("(")[2].rstrip(")")
 
                         config["monitoring"]["custom_domain"] = custom_domain
                         config["monitoring"]["hosted_zone_id"] = zone_id
@@ -688,9 +897,7 @@ class InitCommand(Command):
                 ).ask()
 
                 # Preserve existing analytics settings, only update enabled flag
-                if "analytics" not in config:
-                    config["analytics"] = {}
-                config["analytics"]["enabled"] = enable_analytics
+                config.setdefault("analytics", {})["enabled"] = enable_analytics
 
                 if enable_analytics:
                     console.print("[green]✓[/green] Analytics pipeline will be deployed with your monitoring stack")
@@ -707,9 +914,7 @@ class InitCommand(Command):
                 ).ask()
 
                 # Preserve existing quota settings, only update enabled flag
-                if "quota" not in config:
-                    config["quota"] = {}
-                config["quota"]["enabled"] = enable_quota_monitoring
+                config.setdefault("quota", {})["enabled"] = enable_quota_monitoring
 
                 if enable_quota_monitoring:
                     console.print("\n[yellow]Configure quota limits and thresholds[/yellow]")
@@ -824,318 +1029,278 @@ class InitCommand(Command):
             progress.save_step("monitoring_complete", config)
 
         # Additional optional features
-        console.print("\n[bold]Windows Build Support[/bold]")
-        console.print("Build Windows binaries using AWS CodeBuild")
-        enable_codebuild = questionary.confirm(
-            "Enable Windows builds?", default=config.get("codebuild", {}).get("enabled", False)
-        ).ask()
-
-        # Preserve existing codebuild settings, only update enabled flag
-        if "codebuild" not in config:
-            config["codebuild"] = {}
-        config["codebuild"]["enabled"] = enable_codebuild
-
-        if enable_codebuild:
-            console.print("[green]✓[/green] CodeBuild for Windows builds will be deployed")
-
-        # Package distribution support
-        console.print("\n[bold]Package Distribution[/bold]")
-        console.print("Choose how to distribute Claude Code packages to end users:")
-        console.print("  • Presigned S3 URLs: Simple, no authentication (good for < 20 users)")
-        console.print("  • Landing Page: IdP authentication with web UI (good for 20-100 users)")
+        if not skip_features:
+            # A features-only update skips the AWS section, so take the region from the saved configuration
+            region = config.get("aws", {}).get("region") or get_current_region()
+
+            console.print("\n[bold]Windows Build Support[/bold]")
+            console.print("Build Windows binaries using AWS CodeBuild")
+            enable_codebuild = questionary.confirm(
+                "Enable Windows builds?", default=config.get("codebuild", {}).get("enabled", False)
+            ).ask()
 
-        distribution_choices = [
-            questionary.Choice("Presigned S3 URLs (simple, no authentication)", value="presigned-s3"),
-            questionary.Choice("Authenticated Landing Page (IdP + ALB)", value="landing-page"),
-            questionary.Choice("Disabled", value=None),
-        ]
+            # Preserve existing codebuild settings, only update enabled flag
+            config.setdefault("codebuild", {})["enabled"] = enable_codebuild
 
-        # Get saved value or default to None
-        saved_dist_type = config.get("distribution", {}).get("type")
-        default_choice = saved_dist_type if saved_dist_type else None
+            if enable_codebuild:
+                console.print("[green]✓[/green] CodeBuild for Windows builds will be deployed")
 
-        distribution_type = questionary.select(
-            "Distribution method:",
-            choices=distribution_choices,
-            default=default_choice,
-        ).ask()
+            # Package distribution support
+            console.print("\n[bold]Package Distribution[/bold]")
+            console.print("Choose how to distribute Claude Code packages to end users:")
+            console.print("  • Presigned S3 URLs: Simple, no authentication (good for < 20 users)")
+            console.print("  • Landing Page: IdP authentication with web UI (good for 20-100 users)")
 
-        # Preserve existing distribution settings, only update enabled/type
-        if "distribution" not in config:
-            config["distribution"] = {}
-        config["distribution"]["enabled"] = distribution_type is not None
-        config["distribution"]["type"] = distribution_type
-
-        # If landing-page selected, prompt for additional configuration
-        if distribution_type == "landing-page":
-            console.print("\n[bold]Landing Page Configuration[/bold]")
-            console.print("Configure IdP authentication for the distribution landing page")
-
-            # IdP provider selection
-            idp_choices = [
-                questionary.Choice("Okta", value="okta"),
-                questionary.Choice("Azure AD / Entra ID", value="azure"),
-                questionary.Choice("Auth0", value="auth0"),
-                questionary.Choice("AWS Cognito User Pool", value="cognito"),
+            distribution_choices = [
+                questionary.Choice("Presigned S3 URLs (simple, no authentication)", value="presigned-s3"),
+                questionary.Choice("Authenticated Landing Page (IdP + ALB)", value="landing-page"),
+                questionary.Choice("Disabled", value=None),
             ]
 
-            idp_provider = questionary.select(
-                "Identity provider for web authentication:",
-                choices=idp_choices,
-                default=config.get("distribution", {}).get("idp_provider", "okta"),
-            ).ask()
+            # Get saved value or default to None
+            saved_dist_type = config.get("distribution", {}).get("type")
+            default_choice = saved_dist_type if saved_dist_type else None
 
-            # Auto-detection for Cognito User Pool
-            cognito_auto_configured = False
-            if idp_provider == "cognito":
-                from claude_code_with_bedrock.cli.utils.aws import (
-                    detect_cognito_stack,
-                    validate_cognito_stack_for_distribution,
-                )
+            distribution_type = questionary.select(
+                "Distribution method:",
+                choices=distribution_choices,
+                default=default_choice,
+            ).ask()
 
-                console.print("\n[bold]Cognito Configuration Detection[/bold]")
-                console.print("Searching for deployed Cognito User Pool stack...")
+            # Preserve existing distribution settings, only update enabled/type
+            config.setdefault("distribution", {}).update(
+                {"enabled": distribution_type is not None, "type": distribution_type}
+            )
 
-                # Try to auto-detect Cognito stack
-                cognito_stack_info = detect_cognito_stack(region)
+            # If landing-page selected, prompt for additional configuration
+            if distribution_type == "landing-page":
+                console.print("\n[bold]Landing Page Configuration[/bold]")
+                console.print("Configure IdP authentication for the distribution landing page")
+
+                # IdP provider selection
+                idp_choices = [
+                    questionary.Choice("Okta", value="okta"),
+                    questionary.Choice("Azure AD / Entra ID", value="azure"),
+                    questionary.Choice("Auth0", value="auth0"),
+                    questionary.Choice("AWS Cognito User Pool", value="cognito"),
+                ]
+
+                idp_provider = questionary.select(
+                    "Identity provider for web authentication:",
+                    choices=idp_choices,
+                    default=config.get("distribution", {}).get("idp_provider", "okta"),
+                ).ask()
 
-                if cognito_stack_info:
-                    console.print(f"[green]✓[/green] Found Cognito stack: {cognito_stack_info['stack_name']}")
+                # Auto-detection for Cognito User Pool
+                cognito_auto_configured = False
+                if idp_provider == "cognito":
+                    console.print("\n[bold]Cognito Configuration Detection[/bold]")
+                    console.print("Searching for deployed Cognito User Pool stack...")
 
-                    # Validate it has distribution support
-                    is_valid, message = validate_cognito_stack_for_distribution(
-                        cognito_stack_info["stack_name"], region
-                    )
+                    # Try to auto-detect Cognito stack
+                    cognito_stack_info = detect_cognito_stack(region)
 
-                    if is_valid:
-                        console.print(f"[green]✓[/green] {message}")
-
-                        # Show detected values
-                        outputs = cognito_stack_info["outputs"]
-                        console.print("\n[cyan]Detected Configuration:[/cyan]")
-                        console.print(f"  • User Pool ID: {outputs.get('UserPoolId', 'N/A')}")
-
-                        # Extract domain prefix from full domain
-                        full_domain = outputs.get("UserPoolDomain", "")
-                        domain_prefix = full_domain.split(".")[0] if full_domain else "N/A"
-                        console.print(f"  • Domain: {domain_prefix}")
-
-                        console.print(f"  • Client ID: {outputs.get('DistributionWebClientId', 'N/A')}")
-                        console.print(f"  • Secret ARN: {outputs.get('DistributionWebClientSecretArn', 'N/A')}")
-
-                        use_detected = questionary.confirm("\nUse these detected values?", default=True).ask()
-
-                        if use_detected:
-                            # Auto-populate configuration
-                            idp_domain = domain_prefix
-                            idp_client_id = outputs["DistributionWebClientId"]
-                            secret_arn = outputs["DistributionWebClientSecretArn"]
-
-                            # Store in config immediately
-                            config.setdefault("distribution", {}).update(
-                                {
-                                    "idp_provider": "cognito",
-                                    "idp_domain": idp_domain,
-                                    "idp_client_id": idp_client_id,
-                                    "idp_client_secret_arn": secret_arn,
-                                }
-                            )
+                    if cognito_stack_info:
+                        console.print(f"[green]✓[/green] Found Cognito stack: {cognito_stack_info['stack_name']}")
 
-                            # Also store Cognito User Pool ID for auth
-                            if "cognito_user_pool_id" not in config:
-                                config["cognito_user_pool_id"] = outputs["UserPoolId"]
+                        # Validate it has distribution support
+                        is_valid, message = validate_cognito_stack_for_distribution(
+                            cognito_stack_info["stack_name"], region
+                        )
 
-                            console.print("[green]✓[/green] Configuration auto-populated from stack outputs")
-                            cognito_auto_configured = True
+                        if is_valid:
+                            console.print(f"[green]✓[/green] {message}")
+
+                            # Show detected values
+                            outputs = cognito_stack_info["outputs"]
+                            console.print("\n[cyan]Detected Configuration:[/cyan]")
+                            console.print(f"  • User Pool ID: {outputs.get('UserPoolId', 'N/A')}")
+
+                            # Extract domain prefix from full domain
+                            full_domain = outputs.get("UserPoolDomain", "")
+                            domain_prefix = full_domain.split(".")[0] if full_domain else "N/A"
+                            console.print(f"  • Domain: {domain_prefix}")
+
+                            console.print(f"  • Client ID: {outputs.get('DistributionWebClientId', 'N/A')}")
+                            console.print(f"  • Secret ARN: {outputs.get('DistributionWebClientSecretArn', 'N/A')}")
+
+                            use_detected = questionary.confirm("\nUse these detected values?", default=True).ask()
+
+                            if use_detected:
+                                # Auto-populate configuration
+                                idp_domain = domain_prefix
+                                idp_client_id = outputs["DistributionWebClientId"]
+                                secret_arn = outputs["DistributionWebClientSecretArn"]
+
+                                # Store in config immediately
+                                config.setdefault("distribution", {}).update(
+                                    {
+                                        "idp_provider": "cognito",
+                                        "idp_domain": idp_domain,
+                                        "idp_client_id": idp_client_id,
+                                        "idp_client_secret_arn": secret_arn,
+                                    }
+                                )
+
+                                # Also store Cognito User Pool ID for auth
+                                if "cognito_user_pool_id" not in config:
+                                    config["cognito_user_pool_id"] = outputs["UserPoolId"]
+
+                                console.print("[green]✓[/green] Configuration auto-populated from stack outputs")
+                                cognito_auto_configured = True
+                            else:
+                                console.print("[yellow]Manual configuration selected[/yellow]")
                         else:
-                            console.print("[yellow]Manual configuration selected[/yellow]")
+                            console.print(f"[yellow]⚠[/yellow] {message}")
+                            console.print("[yellow]Falling back to manual configuration...[/yellow]")
                     else:
-                        console.print(f"[yellow]⚠[/yellow] {message}")
-                        console.print("[yellow]Falling back to manual configuration...[/yellow]")
-                else:
-                    console.print("[yellow]No Cognito User Pool stack detected[/yellow]")
-                    console.print("You can either:")
-                    console.print("  1. Deploy the Cognito stack first")
-                    console.print("  2. Enter configuration manually")
-
-            # Only prompt for manual configuration if not auto-configured
-            if not cognito_auto_configured:
-                # IdP domain
-                idp_domain = questionary.text(
-                    "IdP domain (e.g., company.okta.com for Okta, company.auth0.com for Auth0):",
-                    default=config.get("distribution", {}).get("idp_domain", ""),
-                ).ask()
-
-                # Web app client ID
-                idp_client_id = questionary.text(
-                    "Web application client ID (separate from CLI native app):",
-                    default=config.get("distribution", {}).get("idp_client_id", ""),
-                ).ask()
+                        console.print("[yellow]No Cognito User Pool stack detected[/yellow]")
+                        console.print("You can either:")
+                        console.print("  1. Deploy the Cognito stack first")
+                        console.print("  2. Enter configuration manually")
+
+                # Only prompt for manual configuration if not auto-configured
+                if not cognito_auto_configured:
+                    # IdP domain
+                    idp_domain = questionary.text(
+                        "IdP domain (e.g., company.okta.com for Okta, company.auth0.com for Auth0):",
+                        default=config.get("distribution", {}).get("idp_domain", ""),
+                    ).ask()
 
-                # Web app client secret
-                idp_client_secret = questionary.password(
-                    "Web application client secret:",
-                ).ask()
+                    # Web app client ID
+                    idp_client_id = questionary.text(
+                        "Web application client ID (separate from CLI native app):",
+                        default=config.get("distribution", {}).get("idp_client_id", ""),
+                    ).ask()
 
-            # Store secret in AWS Secrets Manager (only if not auto-configured)
-            import boto3
+                    # Web app client secret
+                    idp_client_secret = questionary.password(
+                        "Web application client secret:",
+                    ).ask()
 
-            if not cognito_auto_configured:
-                try:
-                    secrets_client = boto3.client("secretsmanager", region_name=region)
-                    account_id = boto3.client("sts").get_caller_identity()["Account"]
+                # Store secret in AWS Secrets Manager (only if not auto-configured)
+                if not cognito_auto_configured:
+                    try:
+                        secrets_client = boto3.client("secretsmanager", region_name=region)
+                        account_id = boto3.client("sts").get_caller_identity()["Account"]
+
+                        secret_name = f"{config['aws']['identity_pool_name']}-distribution-idp-secret"
+
+                        # Try to create or update secret
+                        try:
+                            secret_response = secrets_client.create_secret(
+                                Name=secret_name,
+                                SecretString=idp_client_secret,
+                                Description=f"IdP client secret for "
+                                f"{config['aws']['identity_pool_name']} distribution landing page",
+                            )
+                            secret_arn = secret_response["ARN"]
+                        except secrets_client.exceptions.ResourceExistsException:
+                            # Secret already exists, update it
+                            secret_response = secrets_client.update_secret(
+                                SecretId=secret_name,
+                                SecretString=idp_client_secret,
+                            )
+                            secret_arn = f"arn:aws:secretsmanager:{region}:{account_id}:secret:{secret_name}"
 
-                    secret_name = f"{config['aws']['identity_pool_name']}-distribution-idp-secret"
+                        console.print(f"[green]✓[/green] IdP client secret stored in Secrets Manager: {secret_name}")
 
-                    # Try to create or update secret
-                    try:
-                        secret_response = secrets_client.create_secret(
-                            Name=secret_name,
-                            SecretString=idp_client_secret,
-                            Description=f"IdP client secret for "
-                            f"{config['aws']['identity_pool_name']} distribution landing page",
-                        )
-                        secret_arn = secret_response["ARN"]
-                    except secrets_client.exceptions.ResourceExistsException:
-                        # Secret already exists, update it
-                        secret_response = secrets_client.update_secret(
-                            SecretId=secret_name,
-                            SecretString=idp_client_secret,
-                        )
+                    except Exception as e:
+                        console.print(f"[red]Error storing secret in Secrets Manager: {e}[/red]")
+                        console.print("[yellow]You'll need to configure the secret manually before deployment[/yellow]")
                         secret_arn = f"arn:aws:secretsmanager:{region}:{account_id}:secret:{secret_name}"
 
-                    console.print(f"[green]✓[/green] IdP client secret stored in Secrets Manager: {secret_name}")
+                # Custom domain (REQUIRED for authenticated landing page)
+                console.print("\n[bold]Custom Domain Configuration (REQUIRED)[/bold]")
+                console.print("[yellow]⚠️  Custom domain with HTTPS is required for ALB OIDC authentication[/yellow]")
+                console.print("You will need:")
+                console.print("  • A custom domain (e.g., downloads.company.com)")
+                console.print("  • An ACM certificate for this domain in the same region")
+
+                custom_domain = questionary.text(
+                    "Custom domain (e.g., downloads.company.com):",
+                    default=config.get("distribution", {}).get("custom_domain", ""),
+                    validate=lambda text: len(text.strip()) > 0
+                    or "Custom domain is required for authenticated landing page",
+                ).ask()
 
-                except Exception as e:
-                    console.print(f"[red]Error storing secret in Secrets Manager: {e}[/red]")
-                    console.print("[yellow]You'll need to configure the secret manually before deployment[/yellow]")
-                    secret_arn = f"arn:aws:secretsmanager:{region}:{account_id}:secret:{secret_name}"
-
-            # Custom domain (REQUIRED for authenticated landing page)
-            console.print("\n[bold]Custom Domain Configuration (REQUIRED)[/bold]")
-            console.print("[yellow]⚠️  Custom domain with HTTPS is required for ALB OIDC authentication[/yellow]")
-            console.print("You will need:")
-            console.print("  • A custom domain (e.g., downloads.company.com)")
-            console.print("  • An ACM certificate for this domain in the same region")
-
-            custom_domain = questionary.text(
-                "Custom domain (e.g., downloads.company.com):",
-                default=config.get("distribution", {}).get("custom_domain", ""),
-                validate=lambda text: len(text.strip()) > 0
-                or "Custom domain is required for authenticated landing page",
-            ).ask()
+                # Check for Route53 hosted zones
+                console.print("\n[bold]Route53 Configuration[/bold]")
+                console.print("Looking for Route53 hosted zones...")
 
-            # Check for Route53 hosted zones
-            console.print("\n[bold]Route53 Configuration[/bold]")
-            console.print("Looking for Route53 hosted zones...")
+                hosted_zone_id = None
+                try:
+                    route53_client = boto3.client("route53")
+                    zones_response = route53_client.list_hosted_zones()
+                    hosted_zones = zones_response.get("HostedZones", [])
 
-            hosted_zone_id = None
-            try:
-                route53_client = boto3.client("route53")
-                zones_response = route53_client.list_hosted_zones()
-                hosted_zones = zones_response.get("HostedZones", [])
+                    if hosted_zones:
+                        console.print(f"Found {len(hosted_zones)} hosted zone(s)")
 
-                if hosted_zones:
-                    console.print(f"Found {len(hosted_zones)} hosted zone(s)")
+                        # Get existing hosted zone if configured
+                        existing_zone_id = config.get("distribution", {}).get("hosted_zone_id")
 
-                    # Get existing hosted zone if configured
-                    existing_zone_id = config.get("distribution", {}).get("hosted_zone_id")
+                        # Create zone choices
+                        zone_choices = [
+                            questionary.Choice(
+                                f"{zone['Name']} (ID: {zone['Id'].rpartition('/')[2]})",
+                                value=zone["Id"].rpartition("/")[2],
+                            )
+                            for zone in hosted_zones
+                        ]
+                        zone_choices.append(questionary.Choice("Skip (no Route53 managed domain)", value=None))
 
-                    # Create zone choices
-                    zone_choices = [
-                        questionary.Choice(
-                            f"{zone['Name']} (ID: {zone['Id'].split('/')[-1]})", value=zone["Id"].split("/")[-1]
-                        )
-                        for zone in hosted_zones
-                    ]
-                    zone_choices.append(questionary.Choice("Skip (no Route53 managed domain)", value=None))
-
-                    # Find the default choice based on existing zone
-                    default_choice = None
-                    if existing_zone_id:
-                        for choice in zone_choices:
-                            if choice.value == existing_zone_id:
-                                default_choice = choice
-                                break
-
-                    hosted_zone_id = questionary.select(
-                        "Select Route53 hosted zone:",
-                        choices=zone_choices,
-                        default=default_choice if default_choice else zone_choices[0],
-                    ).ask()
-                else:
-                    console.print("[yellow]No Route53 hosted zones found in this account[/yellow]")
-                    console.print("You can still use custom domain if it's managed externally")
-                    hosted_zone_id = None
+                        # Find the default choice based on existing zone
+                        default_choice = None
+                        if existing_zone_id:
+                            for choice in zone_choices:
+                                if choice.value == existing_zone_id:
+                                    default_choice = choice
+                                    break
 
-            except Exception as e:
-                console.print(f"[yellow]Could not list Route53 zones: {e}[/yellow]")
-                hosted_zone_id = None
+                        hosted_zone_id = questionary.select(
+                            "Select Route53 hosted zone:",
+                            choices=zone_choices,
+                            default=default_choice if default_choice else zone_choices[0],
+                        ).ask()
+                    else:
+                        console.print("[yellow]No Route53 hosted zones found in this account[/yellow]")
+                        console.print("You can still use custom domain if it's managed externally")
+                        hosted_zone_id = None
 
-            # Save landing page configuration
-            config["distribution"].update(
-                {
-                    "idp_provider": idp_provider,
-                    "idp_domain": idp_domain,
-                    "idp_client_id": idp_client_id,
-                    "idp_client_secret_arn": secret_arn,
-                    "custom_domain": custom_domain,
-                    "hosted_zone_id": hosted_zone_id,
-                }
-            )
+                except Exception as e:
+                    console.print(f"[yellow]Could not list Route53 zones: {e}[/yellow]")
+                    hosted_zone_id = None
+
+                # Save landing page configuration
+                config["distribution"].update(
+                    {
+                        "idp_provider": idp_provider,
+                        "idp_domain": idp_domain,
+                        "idp_client_id": idp_client_id,
+                        "idp_client_secret_arn": secret_arn,
+                        "custom_domain": custom_domain,
+                        "hosted_zone_id": hosted_zone_id,
+                    }
+                )
 
-            console.print("\n[green]✓[/green] Landing page distribution will be deployed with IdP authentication")
+                console.print("\n[green]✓[/green] Landing page distribution will be deployed with IdP authentication")
 
-        elif distribution_type == "presigned-s3":
-            console.print("[green]✓[/green] Presigned S3 distribution will be deployed")
+            elif distribution_type == "presigned-s3":
+                console.print("[green]✓[/green] Presigned S3 distribution will be deployed")
 
         # Bedrock model and cross-region configuration
         if not skip_bedrock:
             console.print("\n[bold blue]Step 3: Bedrock Model Selection[/bold blue]")
             console.print("─" * 40)
 
-            # Import centralized model configuration
-            from claude_code_with_bedrock.models import (
-                CLAUDE_MODELS,
-                get_available_profiles_for_model,
-                get_destination_regions_for_model_profile,
-                get_model_id_for_profile,
-                get_profile_description,
-                get_source_regions_for_model_profile,
-            )
-
             # Check for saved model
             saved_model = config.get("aws", {}).get("selected_model")
-            saved_model_key = None
-            if saved_model:
-                # Find the key for the saved model by checking all model IDs
-                for key, model_info in CLAUDE_MODELS.items():
-                    for _profile_key, profile_config in model_info["profiles"].items():
-                        if profile_config["model_id"] == saved_model:
-                            saved_model_key = key
-                            break
-                    if saved_model_key:
-                        break
+            saved_model_key = get_model_key_for_model_id(saved_model) if saved_model else None
 
             # Step 1: Select Claude model
-            model_choices = []
             default_model_key = saved_model_key or "sonnet-4-5"
-            for model_key, model_info in CLAUDE_MODELS.items():
-                # Build region list from available profiles
-                available_profiles = get_available_profiles_for_model(model_key)
-                regions = []
-                if "global" in available_profiles:
-                    regions.append("Global")
-                if "us" in available_profiles:
-                    regions.append("US")
-                if "europe" in available_profiles:
-                    regions.append("Europe")
-                if "apac" in available_profiles:
-                    regions.append("APAC")
-                regions_text = ", ".join(regions)
-
-                choice_text = f"{model_info['name']} ({regions_text})"
-                model_choices.append(questionary.Choice(title=choice_text, value=model_key))
+            model_choices = [questionary.Choice(title=title, value=key) for title, key in get_model_choice_titles()]
 
             selected_model_key = questionary.select(
                 "Select Claude model:",
@@ -1263,7 +1428,7 @@ class InitCommand(Command):
 
     def _review_configuration(self, config: dict[str, Any]) -> bool:
         """Review configuration with user."""
-        console = Console()
+        console = self._console
 
         console.print("\n[bold blue]Step 4: Review Configuration[/bold blue]")
         console.print("─" * 30)
@@ -1274,27 +1439,27 @@ class InitCommand(Command):
         table.add_column("Setting", style="white", no_wrap=True)
         table.add_column("Value", style="green")
 
-        table.add_row("OIDC Provider", config["okta"]["domain"])
-        table.add_row(
-            "OIDC Client ID",
-            (
-                config["okta"]["client_id"][:20] + "..."
-                if len(config["okta"]["client_id"]) > 20
-                else config["okta"]["client_id"]
-            ),
-        )
-        table.add_row(
-            "Credential Storage",
+        okta = config["okta"]
+        aws = config["aws"]
+        monitoring = config.get("monitoring", {})
+
+        client_id = okta["client_id"]
+        rows: list[tuple[str, str]] = [
+            ("OIDC Provider", okta["domain"]),
+            ("OIDC Client ID", client_id[:20] + "..." if len(client_id) > 20 else client_id),
             (
-                "Keyring (OS secure storage)"
-                if config.get("credential_storage") == "keyring"
-                else "Session Files (temporary)"
+                "Credential Storage",
+                (
+                    "Keyring (OS secure storage)"
+                    if config.get("credential_storage") == "keyring"
+                    else "Session Files (temporary)"
+                ),
             ),
-        )
-        table.add_row("Infrastructure Region", f"{config['aws']['region']} (Cognito, IAM, Monitoring)")
-        table.add_row("Identity Pool", config["aws"]["identity_pool_name"])
-        table.add_row("Monitoring", "✓ Enabled" if config["monitoring"]["enabled"] else "✗ Disabled")
-        if config.get("monitoring", {}).get("enabled"):
+            ("Infrastructure Region", f"{aws['region']} (Cognito, IAM, Monitoring)"),
+            ("Identity Pool", aws["identity_pool_name"]),
+            ("Monitoring", "✓ Enabled" if config["monitoring"]["enabled"] else "✗ Disabled"),
+        ]
+        if monitoring.get("enabled"):
             quota_config = config.get("quota", {})
             if quota_config.get("enabled", False):
                 monthly = quota_config.get("monthly_limit", 225000000)
@@ -1306,91 +1471,88 @@ class InitCommand(Command):
                 if daily:
                     quota_status += f"\n  Daily: {daily:,} ({daily_mode})"
                 quota_status += f"\n  Re-check: {check_interval} min"
-                table.add_row("Quota Monitoring", quota_status)
+                rows.append(("Quota Monitoring", quota_status))
             else:
-                table.add_row("Quota Monitoring", "✗ Disabled")
-            table.add_row(
-                "Analytics Pipeline", "✓ Enabled" if config.get("analytics", {}).get("enabled", True) else "✗ Disabled"
-            )
+                rows.append(("Quota Monitoring", "✗ Disabled"))
+            analytics_enabled = config.get("analytics", {}).get("enabled", True)
+            rows.append(("Analytics Pipeline", "✓ Enabled" if analytics_enabled else "✗ Disabled"))
 
-        # Show VPC config if monitoring is enabled
-        if config.get("monitoring", {}).get("enabled"):
-            vpc_config = config.get("monitoring", {}).get("vpc_config", {})
+            # Show VPC config if monitoring is enabled
+            vpc_config = monitoring.get("vpc_config", {})
             if vpc_config.get("create_vpc"):
-                table.add_row("Monitoring VPC", "New VPC will be created")
+                rows.append(("Monitoring VPC", "New VPC will be created"))
             else:
                 vpc_info = f"Existing: {vpc_config.get('vpc_id', 'Unknown')}"
                 if vpc_config.get("subnet_ids"):
                     vpc_info += f"\n{len(vpc_config['subnet_ids'])} subnets selected"
-                table.add_row("Monitoring VPC", vpc_info)
+                rows.append(("Monitoring VPC", vpc_info))
 
         # Show selected model
-        selected_model = config["aws"].get("selected_model", "")
-        model_display = {
-            "global.anthropic.claude-opus-4-6-v1": "Claude Opus 4.6 (Global)",
-            "us.anthropic.claude-opus-4-6-v1": "Claude Opus 4.6",
-            "eu.anthropic.claude-opus-4-6-v1": "Claude Opus 4.6 (EU)",
-            "au.anthropic.claude-opus-4-6-v1": "Claude Opus 4.6 (AU)",
-            "us.anthropic.claude-opus-4-1-20250805-v1:0": "Claude Opus 4.1",
-            "us.anthropic.claude-opus-4-20250514-v1:0": "Claude Opus 4",
-            "us.anthropic.claude-3-7-sonnet-20250219-v1:0": "Claude 3.7 Sonnet",
-            "us.anthropic.claude-sonnet-4-20250514-v1:0": "Claude Sonnet 4",
-        }
+        selected_model = aws.get("selected_model", "")
         if selected_model:
-            table.add_row("Claude Model", model_display.get(selected_model, selected_model))
+            rows.append(("Claude Model", MODEL_DISPLAY_NAMES.get(selected_model, selected_model)))
 
         # Show cross-region profile
-        cross_region_profile = config["aws"].get("cross_region_profile", "us")
-        profile_display = {
-            "us": "US Cross-Region (us-east-1, us-east-2, us-west-2)",
-            "europe": "Europe Cross-Region (eu-west-1, eu-west-3, eu-central-1, eu-north-1)",
-            "apac": "APAC Cross-Region (ap-northeast-1, ap-southeast-1/2, ap-south-1)",
-        }
-        table.add_row("Bedrock Regions", profile_display.get(cross_region_profile, cross_region_profile))
+        cross_region_profile = aws.get("cross_region_profile", "us")
+        rows.append(("Bedrock Regions", CROSS_REGION_PROFILE_DETAILS.get(cross_region_profile, cross_region_profile)))
 
         # Show AWS account ID
         account_id = get_account_id()
-        if account_id:
-            table.add_row("AWS Account", account_id)
-        else:
-            table.add_row("AWS Account", "[yellow]Unable to determine[/yellow]")
+        rows.append(("AWS Account", account_id or "[yellow]Unable to determine[/yellow]"))
+
+        for setting, value in rows:
+            table.add_row(setting, value)
 
         console.print(table)
 
         # Show what will be created
-        console.print("\n[bold yellow]Resources to be created:[/bold yellow]")
-        if config.get("federation_type") == "direct":
-            console.print("• IAM OIDC Provider for authentication")
-        else:
-            console.print("• Cognito Identity Pool for authentication")
-        console.print("• IAM roles and policies for Bedrock access")
-        if config.get("monitoring", {}).get("enabled"):
-            console.print("• CloudWatch dashboards for usage monitoring")
-            console.print("• OpenTelemetry collector for metrics aggregation")
-            console.print("• ECS cluster and load balancer for collector")
+        resources = [
+            (
+                "IAM OIDC Provider for authentication"
+                if config.get("federation_type") == "direct"
+                else "Cognito Identity Pool for authentication"
+            ),
+            "IAM roles and policies for Bedrock access",
+        ]
+        if monitoring.get("enabled"):
+            resources += [
+                "CloudWatch dashboards for usage monitoring",
+                "OpenTelemetry collector for metrics aggregation",
+                "ECS cluster and load balancer for collector",
+            ]
             if config.get("analytics", {}).get("enabled", True):
-                console.print("• Kinesis Firehose for analytics data streaming")
-                console.print("• S3 bucket for analytics data storage")
-                console.print("• Glue catalog and Athena tables for analytics")
+                resources += [
+                    "Kinesis Firehose for analytics data streaming",
+                    "S3 bucket for analytics data storage",
+                    "Glue catalog and Athena tables for analytics",
+                ]
             if config.get("quota", {}).get("enabled", False):
-                console.print("• DynamoDB tables for quota tracking")
-                console.print("• Lambda function for quota checking")
-                console.print("• API Gateway for real-time quota API")
+                resources += [
+                    "DynamoDB tables for quota tracking",
+                    "Lambda function for quota checking",
+                    "API Gateway for real-time quota API",
+                ]
         if config.get("codebuild", {}).get("enabled", False):
-            console.print("• CodeBuild project for Windows binary builds")
-            console.print("• S3 bucket for build artifacts")
-        if config.get("distribution", {}).get("enabled", False):
-            dist_type = config.get("distribution", {}).get("type")
+            resources += ["CodeBuild project for Windows binary builds", "S3 bucket for build artifacts"]
+        distribution = config.get("distribution", {})
+        if distribution.get("enabled", False):
+            dist_type = distribution.get("type")
             if dist_type == "landing-page":
-                console.print("• Authenticated landing page distribution (ALB + Lambda + S3)")
-                idp_provider = config.get("distribution", {}).get("idp_provider", "")
-                console.print(f"• IdP authentication: {idp_provider.upper() if idp_provider else 'configured'}")
-                if config.get("distribution", {}).get("custom_domain"):
-                    console.print(f"• Custom domain: {config['distribution']['custom_domain']}")
+                resources.append("Authenticated landing page distribution (ALB + Lambda + S3)")
+                idp_provider = distribution.get("idp_provider", "")
+                resources.append(f"IdP authentication: {idp_provider.upper() if idp_provider else 'configured'}")
+                if distribution.get("custom_domain"):
+                    resources.append(f"Custom domain: {distribution['custom_domain']}")
             elif dist_type == "presigned-s3":
-                console.print("• Presigned S3 URL distribution")
-                console.print("• IAM user for presigned URL generation")
-                console.print("• Secrets Manager secret for credentials")
+                resources += [
+                    "Presigned S3 URL distribution",
+                    "IAM user for presigned URL generation",
+                    "Secrets Manager secret for credentials",
+                ]
+
+        # Render the whole list in one print
+        console.print("\n[bold yellow]Resources to be created:[/bold yellow]")
+        console.print("\n".join(f"• {resource}" for resource in resources))
 
         return True
 
@@ -1404,7 +1566,7 @@ class InitCommand(Command):
         Returns:
             Exit code
         """
-        console = Console()
+        console = self._console
 
         # Save configuration first
         self._save_configuration(config, profile_name)
@@ -1416,24 +1578,14 @@ class InitCommand(Command):
         with console.status("[yellow]Deploying authentication stack...[/yellow]"):
             try:
                 # Get the parameters file path
-                params_file = (
-                    Path(__file__).parent.parent.parent.parent.parent.parent
-                    / "deployment"
-                    / "infrastructure"
-                    / "parameters.json"
-                )
+                params_file = INFRASTRUCTURE_DIR / "parameters.json"
 
                 # Update parameters with our configuration
                 self._update_parameters_file(params_file, config)
 
                 # Deploy the stack
                 stack_name = config["aws"]["stacks"]["auth"]
-                template_file = (
-                    Path(__file__).parent.parent.parent.parent.parent.parent
-                    / "deployment"
-                    / "infrastructure"
-                    / "cognito-identity-pool.yaml"
-                )
+                template_file = INFRASTRUCTURE_DIR / "cognito-identity-pool.yaml"
 
                 if self._deploy_stack(stack_name, template_file, params_file, config["aws"]["region"]):
                     console.print("  [green]✓[/green] Authentication stack deployed")
@@ -1444,40 +1596,38 @@ class InitCommand(Command):
                 console.print(f"  [red]✗[/red] Authentication stack deployment failed: {e}")
                 return 1
 
-        # Deploy monitoring stack if enabled
+        # Deploy monitoring stacks if enabled
         if config["monitoring"]["enabled"]:
-            with console.status("[yellow]Deploying monitoring stack...[/yellow]"):
-                try:
-                    # Deploy OTel collector
-                    collector_stack = config["aws"]["stacks"]["monitoring"]
-                    collector_template = (
-                        Path(__file__).parent.parent.parent.parent.parent.parent
-                        / "deployment"
-                        / "infrastructure"
-                        / "otel-collector.yaml"
-                    )
-
-                    if self._deploy_stack(collector_stack, collector_template, params_file, config["aws"]["region"]):
-                        console.print("  [green]✓[/green] Monitoring collector deployed")
-                    else:
-                        console.print("  [yellow]![/yellow] Monitoring deployment skipped or failed")
-
-                    # Deploy dashboard
-                    dashboard_stack = config["aws"]["stacks"]["dashboard"]
-                    dashboard_template = (
-                        Path(__file__).parent.parent.parent.parent.parent.parent
-                        / "deployment"
-                        / "infrastructure"
-                        / "monitoring-dashboard.yaml"
-                    )
-
-                    if self._deploy_stack(dashboard_stack, dashboard_template, params_file, config["aws"]["region"]):
-                        console.print("  [green]✓[/green] Monitoring dashboard deployed")
-                    else:
-                        console.print("  [yellow]![/yellow] Dashboard deployment skipped or failed")
+            region = config["aws"]["region"]
+            monitoring_stacks = {
+                "Monitoring collector": (
+                    config["aws"]["stacks"]["monitoring"],
+                    INFRASTRUCTURE_DIR / "otel-collector.yaml",
+                ),
+                "Monitoring dashboard": (
+                    config["aws"]["stacks"]["dashboard"],
+                    INFRASTRUCTURE_DIR / "monitoring-dashboard.yaml",
+                ),
+            }
 
-                except Exception as e:
-                    console.print(f"  [yellow]![/yellow] Monitoring deployment partially failed: {e}")
+            # The collector and dashboard only depend on the auth stack, so deploy them concurrently
+            with (
+                console.status("[yellow]Deploying monitoring stacks...[/yellow]"),
+                ThreadPoolExecutor(max_workers=len(monitoring_stacks)) as executor,
+            ):
+                futures = {
+                    executor.submit(self._deploy_stack, stack_name, template_file, params_file, region): label
+                    for label, (stack_name, template_file) in monitoring_stacks.items()
+                }
+                for future in as_completed(futures):
+                    label = futures[future]
+                    try:
+                        if future.result():
+                            console.print(f"  [green]✓[/green] {label} deployed")
+                        else:
+                            console.print(f"  [yellow]![/yellow] {label} deployment skipped or failed")
+                    except Exception as e:
+                        console.print(f"  [yellow]![/yellow] {label} deployment failed: {e}")
 
         console.print("  [green]✓[/green] Configuration saved")
 
@@ -1565,68 +1715,39 @@ class InitCommand(Command):
             quota_check_interval=config_data.get("quota", {}).get("check_interval", 30),
         )
 
+        # Set as active profile when creating/updating; the global config is written once below
+        config.active_profile = profile_name
         config.add_profile(profile)
-        # Set as active profile when creating/updating
-        config.set_active_profile(profile_name)
         config.save()
 
     def _check_aws_cli(self) -> bool:
-        """Check if AWS CLI is installed."""
-        try:
-            import subprocess
-
-            result = subprocess.run(["aws", "--version"], capture_output=True)
-            return result.returncode == 0
-        except Exception:
-            return False
+        """Check if AWS CLI is installed (PATH lookup, without starting the CLI)."""
+        if self._aws_cli_ok is None:
+            self._aws_cli_ok = shutil.which("aws") is not None
+        return self._aws_cli_ok
 
     def _check_aws_credentials(self) -> bool:
-        """Check if AWS credentials are configured."""
-        try:
-            boto3.client("sts").get_caller_identity()
-            return True
-        except Exception:
-            return False
+        """Check if AWS credentials are configured.
+
+        Only resolves the credential chain locally; the credentials are validated
+        against STS when the account ID is looked up for the review step.
+        """
+        if self._aws_credentials_ok is None:
+            try:
+                self._aws_credentials_ok = boto3.Session().get_credentials() is not None
+            except Exception:
+                self._aws_credentials_ok = False
+        return self._aws_credentials_ok
 
     def _check_python_version(self) -> bool:
         """Check Python version."""
-        import sys
+        return PYTHON_VERSION_SUPPORTED
 
-        return sys.version_info >= (3, 10)
-
-    def _get_bedrock_regions(self) -> list[str]:
-        """Get list of regions where Bedrock is available."""
-        try:
-            # These are the regions where Bedrock is currently available
-            # This list should be updated as AWS expands Bedrock availability
-            bedrock_regions = [
-                "us-east-1",  # N. Virginia
-                "us-east-2",  # Ohio
-                "us-west-2",  # Oregon
-                "ap-northeast-1",  # Tokyo
-                "ap-southeast-1",  # Singapore
-                "ap-southeast-2",  # Sydney
-                "eu-central-1",  # Frankfurt
-                "eu-west-1",  # Ireland
-                "eu-west-3",  # Paris
-                "ap-south-1",  # Mumbai
-                "ca-central-1",  # Canada
-            ]
-
-            # For now, return the known list without checking each one
-            # (checking each region takes time and requires permissions)
-            return bedrock_regions
-        except Exception:
-            # Return default list if we can't check
-            return [
-                "us-east-1",
-                "us-west-2",
-                "eu-west-1",
-                "eu-central-1",
-                "ap-northeast-1",
-                "ap-southeast-1",
-                "ap-southeast-2",
-            ]
+    def _get_bedrock_regions(self) -> tuple[str, ...]:
+        """Get the regions where Bedrock is available."""
+        # For now, return the known list without checking each one
+        # (checking each region takes time and requires permissions)
+        return BEDROCK_REGIONS
 
     def _update_parameters_file(self, params_file: Path, config: dict[str, Any]) -> None:
         """Update the CloudFormation parameters file with our configuration."""
@@ -1657,95 +1778,49 @@ class InitCommand(Command):
                 param_map["VpcId"] = vpc_config.get("vpc_id", "")
                 param_map["SubnetIds"] = ",".join(vpc_config.get("subnet_ids", []))
 
-        # Update or add parameters
+        # Update or add parameters by key, keeping the existing order; duplicate entries collapse into one
+        params_by_key = {param["ParameterKey"]: param for param in params}
         for key, value in param_map.items():
-            found = False
-            for param in params:
-                if param["ParameterKey"] == key:
-                    param["ParameterValue"] = value
-                    found = True
-                    break
-            if not found:
-                params.append({"ParameterKey": key, "ParameterValue": value})
-
-        # Save updated parameters
+            params_by_key.setdefault(key, {"ParameterKey": key})["ParameterValue"] = value
+
+        # Save updated parameters in one write, replacing the file atomically
         params_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(params_file, "w") as f:
-            json.dump(params, f, indent=2)
+        atomic_write_text(params_file, json.dumps(list(params_by_key.values()), indent=2))
 
     def _deploy_stack(self, stack_name: str, template_file: Path, params_file: Path, region: str) -> bool:
         """Deploy a CloudFormation stack."""
+        console = self._console
         try:
-            console = Console()
-
             # Check if template exists
             if not template_file.exists():
                 console.print(f"[yellow]Template not found: {template_file.name}[/yellow]")
                 return False
 
-            # Build the AWS CLI command
-            cmd = [
-                "aws",
-                "cloudformation",
-                "deploy",
-                "--template-file",
-                str(template_file),
-                "--stack-name",
-                stack_name,
-                "--parameter-overrides",
-                f"file://{params_file}",
-                "--capabilities",
-                "CAPABILITY_IAM",
-                "CAPABILITY_NAMED_IAM",
-                "--region",
-                region,
-                "--no-fail-on-empty-changeset",
-            ]
+            # The parameters file is shared by all stacks; pass only what this template declares
+            template = cfn_flip.load_yaml(template_file.read_text())
+            declared_parameters = template.get("Parameters") or {}
+            with open(params_file) as f:
+                parameters = [p for p in json.load(f) if p["ParameterKey"] in declared_parameters]
 
-            # Show command in verbose mode
             if self.io.is_verbose():
-                console.print(f"[dim]Running: {' '.join(cmd)}[/dim]")
-
-            # Run the deployment
-            result = subprocess.run(cmd, capture_output=True, text=True)
+                console.print(f"[dim]Deploying {stack_name} from {template_file.name} in {region}[/dim]")
 
-            if result.returncode == 0:
+            result = self._cf_manager(region).deploy_stack(
+                stack_name,
+                template_file,
+                parameters=parameters,
+                capabilities=["CAPABILITY_IAM", "CAPABILITY_NAMED_IAM"],
+            )
+            # The stack's status and outputs have changed; describe it again on next use
+            self._stack_cache.pop((stack_name, region), None)
+            if result.success:
                 return True
-            else:
-                console = Console()
-                # Check for common issues
-                if "No changes to deploy" in result.stderr:
-                    return True  # Stack already up to date
-                elif "does not exist" in result.stderr and "CREATE_IN_PROGRESS" not in result.stderr:
-                    # Stack doesn't exist, but we're trying to update
-                    console.print(f"[yellow]Creating new stack: {stack_name}[/yellow]")
-                    # Try create instead of deploy
-                    create_cmd = cmd.copy()
-                    create_cmd[2] = "create-stack"
-                    create_result = subprocess.run(create_cmd, capture_output=True, text=True)
-                    if create_result.returncode == 0:
-                        # Wait for stack to complete
-                        wait_cmd = [
-                            "aws",
-                            "cloudformation",
-                            "wait",
-                            "stack-create-complete",
-                            "--stack-name",
-                            stack_name,
-                            "--region",
-                            region,
-                        ]
-                        subprocess.run(wait_cmd)
-                        return True
 
-                # Show the actual error
-                error_msg = result.stderr if result.stderr else result.stdout
-                console.print("[red]Deployment error:[/red]")
-                console.print(f"[dim]{error_msg}[/dim]")
-                return False
+            console.print("[red]Deployment error:[/red]")
+            console.print(f"[dim]{result.error}[/dim]")
+            return False
 
         except Exception as e:
-            console = Console()
             console.print(f"[red]Deployment error: {e}[/red]")
             return False
 
@@ -1771,7 +1846,7 @@ class InitCommand(Command):
             auth_stack = profile.stack_names.get("auth", f"{profile.identity_pool_name}-stack")
 
             # Only check stack if we have AWS credentials
-            console = Console()
+            console = self._console
             stacks_found = False
             try:
                 console.print("\n[dim]Checking deployment status in current AWS account...[/dim]")
@@ -1821,28 +1896,34 @@ class InitCommand(Command):
             }
 
             # Add provider type if present (critical to preserve during updates)
-            if hasattr(profile, "provider_type") and profile.provider_type:
-                existing_config["provider_type"] = profile.provider_type
+            provider_type = getattr(profile, "provider_type", None)
+            if provider_type:
+                existing_config["provider_type"] = provider_type
 
             # Add federation type if present (critical to preserve during updates)
-            if hasattr(profile, "federation_type") and profile.federation_type:
-                existing_config["federation_type"] = profile.federation_type
+            federation_type = getattr(profile, "federation_type", None)
+            if federation_type:
+                existing_config["federation_type"] = federation_type
 
             # Add max session duration if present
-            if hasattr(profile, "max_session_duration") and profile.max_session_duration:
-                existing_config["max_session_duration"] = profile.max_session_duration
+            max_session_duration = getattr(profile, "max_session_duration", None)
+            if max_session_duration:
+                existing_config["max_session_duration"] = max_session_duration
 
             # Add Cognito User Pool ID if present
-            if hasattr(profile, "cognito_user_pool_id") and profile.cognito_user_pool_id:
-                existing_config["cognito_user_pool_id"] = profile.cognito_user_pool_id
+            cognito_user_pool_id = getattr(profile, "cognito_user_pool_id", None)
+            if cognito_user_pool_id:
+                existing_config["cognito_user_pool_id"] = cognito_user_pool_id
 
             # Add selected model if present
-            if hasattr(profile, "selected_model") and profile.selected_model:
-                existing_config["aws"]["selected_model"] = profile.selected_model
+            selected_model = getattr(profile, "selected_model", None)
+            if selected_model:
+                existing_config["aws"]["selected_model"] = selected_model
 
             # Add cross-region profile if present
-            if hasattr(profile, "cross_region_profile") and profile.cross_region_profile:
-                existing_config["aws"]["cross_region_profile"] = profile.cross_region_profile
+            cross_region_profile = getattr(profile, "cross_region_profile", None)
+            if cross_region_profile:
+                existing_config["aws"]["cross_region_profile"] = cross_region_profile
 
             # Add CodeBuild configuration if present
             if hasattr(profile, "enable_codebuild"):
@@ -1883,8 +1964,9 @@ class InitCommand(Command):
                 existing_config["client_certificate_key_path"] = profile.client_certificate_key_path
 
             # Add selected source region if present
-            if hasattr(profile, "selected_source_region") and profile.selected_source_region:
-                existing_config["aws"]["selected_source_region"] = profile.selected_source_region
+            selected_source_region = getattr(profile, "selected_source_region", None)
+            if selected_source_region:
+                existing_config["aws"]["selected_source_region"] = selected_source_region
 
             return existing_config
 
@@ -1893,7 +1975,7 @@ class InitCommand(Command):
 
     def _show_existing_deployment(self, config: dict[str, Any]) -> None:
         """Show summary of existing deployment."""
-        console = Console()
+        console = self._console
 
         console.print(f"• OIDC Provider: [cyan]{config['okta']['domain']}[/cyan]")
 
@@ -1911,90 +1993,54 @@ class InitCommand(Command):
         # Show selected model if present
         selected_model = config["aws"].get("selected_model")
         if selected_model:
-            model_names = {
-                "global.anthropic.claude-opus-4-6-v1": "Claude Opus 4.6 (Global)",
-                "us.anthropic.claude-opus-4-6-v1": "Claude Opus 4.6",
-                "eu.anthropic.claude-opus-4-6-v1": "Claude Opus 4.6 (EU)",
-                "au.anthropic.claude-opus-4-6-v1": "Claude Opus 4.6 (AU)",
-                "us.anthropic.claude-opus-4-1-20250805-v1:0": "Claude Opus 4.1",
-                "us.anthropic.claude-opus-4-20250514-v1:0": "Claude Opus 4",
-                "us.anthropic.claude-3-7-sonnet-20250219-v1:0": "Claude 3.7 Sonnet",
-                "us.anthropic.claude-sonnet-4-20250514-v1:0": "Claude Sonnet 4",
-            }
-            console.print(f"• Claude Model: [cyan]{model_names.get(selected_model, selected_model)}[/cyan]")
+            console.print(f"• Claude Model: [cyan]{MODEL_DISPLAY_NAMES.get(selected_model, selected_model)}[/cyan]")
 
         # Show cross-region profile
         cross_region_profile = config["aws"].get("cross_region_profile", "us")
-        profile_names = {
-            "us": "US Cross-Region (us-east-1, us-east-2, us-west-2)",
-            "europe": "Europe Cross-Region",
-            "apac": "APAC Cross-Region",
-        }
-        console.print(
-            f"• Bedrock Regions: [cyan]{profile_names.get(cross_region_profile, cross_region_profile)}[/cyan]"
-        )
+        profile_name = CROSS_REGION_PROFILE_NAMES.get(cross_region_profile, cross_region_profile)
+        console.print(f"• Bedrock Regions: [cyan]{profile_name}[/cyan]")
         console.print(f"• Monitoring: [cyan]{'Enabled' if config['monitoring']['enabled'] else 'Disabled'}[/cyan]")
 
+    def _describe_stack(self, stack_name: str, region: str) -> dict[str, Any] | None:
+        """Describe a CloudFormation stack once per wizard run.
+
+        Returns:
+            The stack description, or None if the stack does not exist
+        """
+        key = (stack_name, region)
+        if key not in self._stack_cache:
+            try:
+                response = self._cf_manager(region).cf_client.describe_stacks(StackName=stack_name)
+                self._stack_cache[key] = response["Stacks"][0] if response["Stacks"] else None
+            except ClientError as e:
+                if e.response["Error"]["Code"] != "ValidationError":
+                    raise
+                self._stack_cache[key] = None
+        return self._stack_cache[key]
+
     def _stack_exists(self, stack_name: str, region: str) -> bool:
         """Check if a CloudFormation stack exists."""
         try:
-            cmd = [
-                "aws",
-                "cloudformation",
-                "describe-stacks",
-                "--stack-name",
-                stack_name,
-                "--region",
-                region,
-                "--query",
-                "Stacks[0].StackStatus",
-                "--output",
-                "text",
-            ]
-
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            if result.returncode == 0:
-                status = result.stdout.strip()
-                # Stack exists if it's in any valid state
-                valid_statuses = ["CREATE_COMPLETE", "UPDATE_COMPLETE", "UPDATE_ROLLBACK_COMPLETE"]
-                return status in valid_statuses
-            return False
+            stack = self._describe_stack(stack_name, region)
+            # Stack exists if it's in any valid state
+            valid_statuses = ["CREATE_COMPLETE", "UPDATE_COMPLETE", "UPDATE_ROLLBACK_COMPLETE"]
+            return stack is not None and stack["StackStatus"] in valid_statuses
         except Exception:
             return False
 
     def _get_stack_outputs(self, stack_name: str, region: str) -> dict[str, str]:
         """Get outputs from a CloudFormation stack."""
         try:
-            cmd = [
-                "aws",
-                "cloudformation",
-                "describe-stacks",
-                "--stack-name",
-                stack_name,
-                "--region",
-                region,
-                "--query",
-                "Stacks[0].Outputs",
-                "--output",
-                "json",
-            ]
-
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            if result.returncode == 0 and result.stdout:
-                outputs_list = json.loads(result.stdout)
-                outputs = {}
-                for output in outputs_list:
-                    outputs[output["OutputKey"]] = output["OutputValue"]
-                return outputs
-            return {}
+            stack = self._describe_stack(stack_name, region)
+            if not stack:
+                return {}
+            return {output["OutputKey"]: output["OutputValue"] for output in stack.get("Outputs", [])}
         except Exception:
             return {}
 
     def _get_hosted_zones(self) -> list[dict[str, Any]]:
         """Get available Route53 hosted zones."""
         try:
-            import boto3
-
             client = boto3.client("route53")
             response = client.list_hosted_zones()
             return response.get("HostedZones", [])
@@ -2003,7 +2049,7 @@ class InitCommand(Command):
 
     def _configure_vpc(self, region: str, existing_vpc_config: dict[str, Any] = None) -> dict[str, Any]:
         """Configure VPC for monitoring stack."""
-        console = Console()
+        console = self._console
 
         console.print("\n[bold]VPC Configuration for Monitoring[/bold]")
         console.print("The monitoring stack requires a VPC for the OpenTelemetry collector.")
@@ -2029,13 +2075,12 @@ class InitCommand(Command):
             # Check for existing monitoring stack
             config = Config.load()
             profile = config.get_profile()
-            if profile and profile.stack_names:
+            # A profile that never enabled monitoring has no monitoring stack to look up
+            if profile and profile.monitoring_enabled and profile.stack_names:
                 monitoring_stack = profile.stack_names.get("monitoring")
                 if monitoring_stack:
-                    from claude_code_with_bedrock.cli.utils.aws import check_stack_exists, get_stack_outputs
-
-                    if check_stack_exists(monitoring_stack, region):
-                        outputs = get_stack_outputs(monitoring_stack, region)
+                    if self._stack_exists(monitoring_stack, region):
+                        outputs = self._get_stack_outputs(monitoring_stack, region)
                         if outputs.get("VpcSource") == "stack-created":
                             stack_vpc_info = {
                                 "vpc_id": outputs.get("VpcId"),
@@ -2060,34 +2105,25 @@ class InitCommand(Command):
                 return {"create_vpc": True}  # Keep CreateVPC=true to maintain the stack-created VPC
 
         # Check for existing VPCs
+        # Subnets are fetched alongside the VPCs so choosing a VPC needs no second lookup
         console.print("\n[yellow]Searching for existing VPCs...[/yellow]")
-        vpcs = get_vpcs(region)
+        vpcs_and_subnets = get_all_vpcs_and_subnets(region)
+        vpcs = [vpc for vpc, _subnets in vpcs_and_subnets.values()]
 
         if vpcs:
             # Found existing VPCs
-            vpc_choices = []
-            vpc_choices.append(questionary.Choice("Create new VPC", value="create_new"))
-
-            for vpc in vpcs:
-                label = f"{vpc['id']} - {vpc['cidr']}"
-                if vpc["name"]:
-                    label = f"{vpc['name']} ({label})"
-                if vpc["is_default"]:
-                    label = f"{label} [DEFAULT]"
-                vpc_choices.append(questionary.Choice(label, value=vpc["id"]))
+            vpc_choices = [questionary.Choice("Create new VPC", value="create_new"), *map(build_vpc_choice, vpcs)]
 
             vpc_choice = questionary.select("Select VPC for monitoring infrastructure:", choices=vpc_choices).ask()
 
+            if vpc_choice is None:  # User cancelled
+                return None
             if vpc_choice == "create_new":
                 return {"create_vpc": True}
             else:
                 # User selected an existing VPC
-                next(v for v in vpcs if v["id"] == vpc_choice)
                 console.print(f"\n[green]Selected VPC: {vpc_choice}[/green]")
-
-                # Get subnets
-                console.print("\n[yellow]Searching for subnets...[/yellow]")
-                subnets = get_subnets(region, vpc_choice)
+                _vpc, subnets = vpcs_and_subnets[vpc_choice]
 
                 if len(subnets) < 2:
                     console.print("[red]Error: ALB requires at least 2 subnets in different availability zones[/red]")
@@ -2098,14 +2134,7 @@ class InitCommand(Command):
                         return None
 
                 # Let user select subnets
-                subnet_choices = []
-                for subnet in subnets:
-                    label = f"{subnet['id']} - {subnet['cidr']} ({subnet['availability_zone']})"
-                    if subnet["name"]:
-                        label = f"{subnet['name']} - {label}"
-                    if subnet["is_public"]:
-                        label = f"{label} [PUBLIC]"
-                    subnet_choices.append(questionary.Choice(label, value=subnet["id"], checked=subnet["is_public"]))
+                subnet_choices = [build_subnet_choice(subnet) for subnet in subnets]
 
                 selected_subnets = questionary.checkbox(
                     "Select at least 2 subnets for the ALB (in different AZs):",
@@ -3,10 +3,18 @@
 
 """Package command - Build distribution packages."""
 
-import json
+import hashlib
 import os
 import platform
+import shutil
 import subprocess
+import sys
+import tempfile
+import threading
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 
@@ -17,12 +25,528 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
-from claude_code_with_bedrock.cli.utils.aws import get_stack_outputs
+from claude_code_with_bedrock.cli.utils.aws import fetch_stack_outputs, get_stack_outputs
 from claude_code_with_bedrock.cli.utils.display import display_configuration_info
-from claude_code_with_bedrock.config import Config
+from claude_code_with_bedrock.config import Config, atomic_write_text, dumps_json
 from claude_code_with_bedrock.models import (
     get_source_region_for_profile,
 )
+from claude_code_with_bedrock.utils.url_validation import detect_provider_type_secure
+
+# The source/ directory of the repository checkout, holding credential_provider and otel_helper
+SOURCE_DIR = Path(__file__).resolve().parents[3]
+
+# Files left out when a package is copied into a Docker build context: bytecode from local runs is
+# never used by PyInstaller inside the image, and the shell wrapper is shipped next to the binary
+DOCKER_CONTEXT_IGNORE = shutil.ignore_patterns("__pycache__", "*.pyc", "*.sh")
+
+# How much of a build's output is kept for error messages; earlier output is discarded as it streams
+BUILD_OUTPUT_TAIL_BYTES = 65536
+
+# First stage of the Linux Docker builds: Python 3.12 and PyInstaller on Ubuntu. It is identical for
+# every binary of a platform, so BuildKit's layer cache reuses it across builds and package runs.
+# It stays a stage rather than a separately built image because the docker-container buildx driver
+# cannot see images in the local image store.
+BUILDER_DOCKERFILE = """FROM --platform={docker_platform} ubuntu:22.04 AS builder
+
+# Set non-interactive to avoid tzdata prompts
+ENV DEBIAN_FRONTEND=noninteractive
+ENV TZ=UTC
+
+# Install Python 3.12 and build dependencies
+RUN apt-get update && apt-get install -y \
+    software-properties-common \
+    build-essential \
+    binutils \
+    curl \
+    && add-apt-repository -y ppa:deadsnakes/ppa \
+    && apt-get update \
+    && apt-get install -y python3.12 python3.12-dev python3.12-venv \
+    && python3.12 -m ensurepip \
+    && python3.12 -m pip install --upgrade pip \
+    && rm -rf /var/lib/apt/lists/*
+
+# Set Python 3.12 as default python3
+RUN update-alternatives --install /usr/bin/python3 python3 /usr/bin/python3.12 1
+
+# Install PyInstaller (target-specific packages are installed by each build)
+RUN python3 -m pip install --no-cache-dir pyinstaller==6.3.0
+"""
+
+
+# install.sh for macOS/Linux; filled in by _create_installer
+INSTALLER_TEMPLATE = """#!/bin/bash
+# Claude Code Authentication Installer
+# Organization: {provider_domain}
+# Generated: {generated}
+
+set -e
+
+echo "======================================"
+echo "Claude Code Authentication Installer"
+echo "======================================"
+echo
+echo "Organization: {provider_domain}"
+echo
+
+
+# Check prerequisites
+echo "Checking prerequisites..."
+
+if ! command -v aws &> /dev/null; then
+    echo "❌ AWS CLI is not installed"
+    echo "   Please install from https://aws.amazon.com/cli/"
+    exit 1
+fi
+
+echo "✓ Prerequisites found"
+
+# Detect platform and architecture
+echo
+echo "Detecting platform and architecture..."
+if [[ "$OSTYPE" == "darwin"* ]]; then
+    PLATFORM="macos"
+    ARCH=$(uname -m)
+    if [[ "$ARCH" == "arm64" ]]; then
+        echo "✓ Detected macOS ARM64 (Apple Silicon)"
+        BINARY_SUFFIX="macos-arm64"
+    else
+        echo "✓ Detected macOS Intel"
+        BINARY_SUFFIX="macos-intel"
+    fi
+elif [[ "$OSTYPE" == "linux-gnu"* ]]; then
+    PLATFORM="linux"
+    ARCH=$(uname -m)
+    if [[ "$ARCH" == "aarch64" ]] || [[ "$ARCH" == "arm64" ]]; then
+        echo "✓ Detected Linux ARM64"
+        BINARY_SUFFIX="linux-arm64"
+    else
+        echo "✓ Detected Linux x64"
+        BINARY_SUFFIX="linux-x64"
+    fi
+else
+    echo "❌ Unsupported platform: $OSTYPE"
+    echo "   This installer supports macOS and Linux only."
+    exit 1
+fi
+
+# Check if binary for platform exists
+CREDENTIAL_BINARY="credential-process-$BINARY_SUFFIX"
+OTEL_BINARY="otel-helper-$BINARY_SUFFIX"
+
+if [ ! -f "$CREDENTIAL_BINARY" ]; then
+    echo "❌ Binary not found for your platform: $CREDENTIAL_BINARY"
+    echo "   Please ensure you have the correct package for your architecture."
+    exit 1
+fi
+
+# Create directory
+echo
+echo "Installing authentication tools..."
+mkdir -p ~/claude-code-with-bedrock
+
+# Copy appropriate binary
+cp "$CREDENTIAL_BINARY" ~/claude-code-with-bedrock/credential-process
+
+# Copy config
+cp config.json ~/claude-code-with-bedrock/
+chmod +x ~/claude-code-with-bedrock/credential-process
+
+# macOS Gatekeeper + Keychain notices
+if [[ "$OSTYPE" == "darwin"* ]]; then
+    # Remove quarantine flag added by macOS when downloading unsigned binaries.
+    # Without this, Gatekeeper blocks execution with "Apple could not verify..." dialog.
+    xattr -d com.apple.quarantine ~/claude-code-with-bedrock/credential-process 2>/dev/null || true
+    echo
+    echo "⚠️  macOS Keychain Access:"
+    echo "   On first use, macOS will ask for permission to access the keychain."
+    echo "   This is normal and required for secure credential storage."
+    echo "   Click 'Always Allow' when prompted."
+fi
+
+# Copy Claude Code settings if present
+if [ -d "claude-settings" ]; then
+    echo
+    echo "Installing Claude Code settings..."
+    mkdir -p ~/.claude
+
+    # Copy settings and replace placeholders
+    if [ -f "claude-settings/settings.json" ]; then
+        # Check if settings file already exists
+        if [ -f ~/.claude/settings.json ]; then
+            echo "Existing Claude Code settings found"
+            read -p "Overwrite with new settings? (Y/n): " -n 1 -r
+            echo
+            # Default to Yes if user just presses enter (empty REPLY)
+            if [[ -z "$REPLY" ]]; then
+                REPLY="y"
+            fi
+            if [[ ! $REPLY =~ ^[Yy]$ ]]; then
+                echo "Skipping Claude Code settings..."
+                SKIP_SETTINGS=true
+            fi
+        fi
+
+        if [ "$SKIP_SETTINGS" != "true" ]; then
+            # Replace placeholders and write settings
+            sed -e "s|__OTEL_HELPER_PATH__|$HOME/claude-code-with-bedrock/otel-helper|g" \
+                -e "s|__CREDENTIAL_PROCESS_PATH__|$HOME/claude-code-with-bedrock/credential-process|g" \
+                "claude-settings/settings.json" > ~/.claude/settings.json
+            echo "✓ Claude Code settings configured"
+        fi
+    fi
+fi
+
+# Copy OTEL helper executable and shell wrapper if present
+if [ -f "$OTEL_BINARY" ]; then
+    echo
+    echo "Installing OTEL helper..."
+    # Install PyInstaller binary as otel-helper-bin (fallback for cache miss)
+    cp "$OTEL_BINARY" ~/claude-code-with-bedrock/otel-helper-bin
+    chmod +x ~/claude-code-with-bedrock/otel-helper-bin
+    xattr -d com.apple.quarantine ~/claude-code-with-bedrock/otel-helper-bin 2>/dev/null || true
+    # Install shell wrapper as otel-helper (fast cache check, avoids PyInstaller startup)
+    if [ -f "otel-helper.sh" ]; then
+        cp "otel-helper.sh" ~/claude-code-with-bedrock/otel-helper
+        chmod +x ~/claude-code-with-bedrock/otel-helper
+    else
+        # Fallback: if shell wrapper not in package, point directly to binary
+        cp "$OTEL_BINARY" ~/claude-code-with-bedrock/otel-helper
+        chmod +x ~/claude-code-with-bedrock/otel-helper
+    fi
+    echo "✓ OTEL helper installed"
+fi
+
+# Add debug info if OTEL helper was installed
+if [ -f ~/claude-code-with-bedrock/otel-helper ]; then
+    echo "The OTEL helper will extract user attributes from authentication tokens"
+    echo "and include them in metrics. To test the helper, run:"
+    echo "  ~/claude-code-with-bedrock/otel-helper-bin --test"
+fi
+
+# Update AWS config
+echo
+echo "Configuring AWS profiles..."
+mkdir -p ~/.aws
+
+# Read all profiles from config.json
+PROFILES=$(python3 -c "import json; profiles = list(json.load(open('config.json')).keys()); print(' '.join(profiles))")
+
+if [ -z "$PROFILES" ]; then
+    echo "❌ No profiles found in config.json"
+    exit 1
+fi
+
+echo "Found profiles: $PROFILES"
+echo
+
+# Get region from package settings (for Bedrock calls, not infrastructure)
+if [ -f "claude-settings/settings.json" ]; then
+    DEFAULT_REGION=$(python3 -c "import json; print(json.load(open('claude-settings/settings.json'))[
+    'env']['AWS_REGION'])" 2>/dev/null || echo "{aws_region}")
+else
+    DEFAULT_REGION="{aws_region}"
+fi
+
+# Configure each profile
+for PROFILE_NAME in $PROFILES; do
+    echo "Configuring AWS profile: $PROFILE_NAME"
+
+    # Remove old profile if exists
+    sed -i.bak "/\\[profile $PROFILE_NAME\\]/,/^$/d" ~/.aws/config 2>/dev/null || true
+
+    # Get profile-specific region from config.json
+    PROFILE_REGION=$(python3 -c "import json; print(json.load(open('config.json')).get('$PROFILE_NAME', \
+    {{}}).get('aws_region', '$DEFAULT_REGION'))")
+
+    # Add new profile with --profile flag (cross-platform, no shell required)
+    cat >> ~/.aws/config << EOF
+[profile $PROFILE_NAME]
+credential_process = $HOME/claude-code-with-bedrock/credential-process --profile $PROFILE_NAME
+region = $PROFILE_REGION
+EOF
+    echo "  ✓ Created AWS profile '$PROFILE_NAME'"
+done
+
+echo
+echo "======================================"
+echo "✓ Installation complete!"
+echo "======================================"
+echo
+echo "Available profiles:"
+for PROFILE_NAME in $PROFILES; do
+    echo "  - $PROFILE_NAME"
+done
+echo
+echo "To use Claude Code authentication:"
+echo "  export AWS_PROFILE=<profile-name>"
+echo "  aws sts get-caller-identity"
+echo
+echo "Example:"
+FIRST_PROFILE=$(echo $PROFILES | awk '{{print $1}}')
+echo "  export AWS_PROFILE=$FIRST_PROFILE"
+echo "  aws sts get-caller-identity"
+echo
+echo "Note: Authentication will automatically open your browser when needed."
+echo
+"""
+
+# README.md shipped in every package; filled in by _create_documentation
+README_TEMPLATE = """# Claude Code Authentication Setup
+
+## Quick Start
+
+### macOS/Linux
+
+1. Extract the package:
+   ```bash
+   unzip claude-code-package-*.zip
+   cd claude-code-package
+   ```
+
+2. Run the installer:
+   ```bash
+   ./install.sh
+   ```
+
+3. Use the AWS profile:
+   ```bash
+   export AWS_PROFILE=ClaudeCode
+   aws sts get-caller-identity
+   ```
+
+### Windows
+
+#### Step 1: Download the Package
+```powershell
+# Use the Invoke-WebRequest command provided by your IT administrator
+Invoke-WebRequest -Uri "URL_PROVIDED" -OutFile "claude-code-package.zip"
+```
+
+#### Step 2: Extract the Package
+
+**Option A: Using Windows Explorer**
+1. Right-click on `claude-code-package.zip`
+2. Select "Extract All..."
+3. Choose a destination folder
+4. Click "Extract"
+
+**Option B: Using PowerShell**
+```powershell
+# Extract to current directory
+Expand-Archive -Path "claude-code-package.zip" -DestinationPath "claude-code-package"
+
+# Navigate to the extracted folder
+cd claude-code-package
+```
+
+**Option C: Using Command Prompt**
+```cmd
+# If you have tar available (Windows 10 1803+)
+tar -xf claude-code-package.zip
+
+# Or use PowerShell from Command Prompt
+powershell -command "Expand-Archive -Path 'claude-code-package.zip' -DestinationPath 'claude-code-package'"
+
+cd claude-code-package
+```
+
+#### Step 3: Run the Installer
+```cmd
+install.bat
+```
+
+The installer will:
+- Check for AWS CLI installation
+- Copy authentication tools to `%USERPROFILE%\\claude-code-with-bedrock`
+- Configure the AWS profile "ClaudeCode"
+- Test the authentication
+
+#### Step 4: Use Claude Code
+```cmd
+# Set the AWS profile
+set AWS_PROFILE=ClaudeCode
+
+# Verify authentication works
+aws sts get-caller-identity
+
+# Your browser will open automatically for authentication if needed
+```
+
+For PowerShell users:
+```powershell
+$env:AWS_PROFILE = "ClaudeCode"
+aws sts get-caller-identity
+```
+
+## What This Does
+
+- Installs the Claude Code authentication tools
+- Configures your AWS CLI to use {provider_domain} for authentication
+- Sets up automatic credential refresh via your browser
+
+## Requirements
+
+- Python 3.8 or later
+- AWS CLI v2
+- pip3
+
+## Troubleshooting
+
+### macOS Keychain Access Popup
+On first use, macOS will ask for permission to access the keychain. This is normal and required for \
+secure credential storage. Click "Always Allow" to avoid repeated prompts.
+
+### Authentication Issues
+If you encounter issues with authentication:
+- Ensure you're assigned to the Claude Code application in your identity provider
+- Check that port 8400 is available for the callback
+- Contact your IT administrator for help
+
+### Authentication Behavior
+
+The system handles authentication automatically:
+- Your browser will open when authentication is needed
+- Credentials are cached securely to avoid repeated logins
+- Bad credentials are automatically cleared and re-authenticated
+
+To manually clear cached credentials (if needed):
+```bash
+~/claude-code-with-bedrock/credential-process --clear-cache
+```
+
+This will force re-authentication on your next AWS command.
+
+### Browser doesn't open
+Check that you're not in an SSH session. The browser needs to open on your local machine.
+
+## Support
+
+Contact your IT administrator for help.
+
+Configuration Details:
+- Organization: {provider_domain}
+- Region: {aws_region}
+- Package Version: {timestamp}{analytics_section}
+"""
+
+README_ANALYTICS_SECTION = """
+
+## Analytics Dashboard
+
+Your organization has enabled advanced analytics for Claude Code usage. You can access detailed metrics \
+and reports through AWS Athena.
+
+To view analytics:
+1. Open the AWS Console in region {aws_region}
+2. Navigate to Athena
+3. Select the analytics workgroup and database
+4. Run pre-built queries or create custom reports
+
+Available metrics include:
+- Token usage by user
+- Cost allocation
+- Model usage patterns
+- Activity trends
+"""
+
+
+@dataclass(frozen=True)
+class DockerBuildSpec:
+    """What differs between the binaries built with PyInstaller inside Docker."""
+
+    binary_prefix: str  # Binary name before the -linux-<arch> suffix
+    package: str  # Source package under source/, built from its __main__.py
+    description: str  # Used in messages, e.g. "OTEL helper"
+    pip_packages: tuple[str, ...]
+    hidden_imports: tuple[str, ...]
+
+    def dockerfile(self, docker_platform: str, binary_name: str) -> str:
+        """Render the Dockerfile whose "build" stage leaves the binary in /output."""
+        pip_packages = " \\\n    ".join(self.pip_packages)
+        hidden_imports = "".join(f"    --hidden-import {name} \\\n" for name in self.hidden_imports)
+        builder = BUILDER_DOCKERFILE.format(docker_platform=docker_platform)
+        return f"""{builder}
+FROM builder AS build
+
+# Install Python packages
+RUN python3 -m pip install --no-cache-dir \\
+    {pip_packages}
+
+# Set working directory
+WORKDIR /build
+
+# Copy source code
+COPY {self.package} /build/{self.package}
+
+# Build the binary with PyInstaller
+RUN pyinstaller \\
+    --onefile \\
+    --clean \\
+    --noconfirm \\
+    --name {binary_name} \\
+    --distpath /output \\
+    --workpath /tmp/build \\
+    --specpath /tmp \\
+    --log-level WARN \\
+{hidden_imports}    {self.package}/__main__.py
+
+# The binary will be in /output/{binary_name}
+"""
+
+
+CREDENTIAL_PROCESS_DOCKER_BUILD = DockerBuildSpec(
+    binary_prefix="credential-process",
+    package="credential_provider",
+    description="binary",
+    pip_packages=(
+        "boto3",
+        "requests",
+        "PyJWT",
+        "cryptography",
+        "keyring",
+        "keyrings.alt",
+        "questionary",
+        "rich",
+        "cleo",
+        "pydantic",
+        "pyyaml",
+        "six==1.16.0",
+        "python-dateutil",
+    ),
+    hidden_imports=(
+        "keyring.backends.SecretService",
+        "keyring.backends.chainer",
+        "six",
+        "six.moves",
+        "six.moves._thread",
+        "six.moves.urllib",
+        "six.moves.urllib.parse",
+        "dateutil",
+    ),
+)
+
+OTEL_HELPER_DOCKER_BUILD = DockerBuildSpec(
+    binary_prefix="otel-helper",
+    package="otel_helper",
+    description="OTEL helper",
+    pip_packages=("PyJWT", "cryptography", "six"),
+    hidden_imports=("six", "six.moves"),
+)
+
+
+def iter_python_files(root: str | Path) -> Iterator[Path]:
+    """Yield the paths of all .py files under root, recursively.
+
+    Uses os.scandir, whose entries already know whether they are directories, so unlike
+    Path.rglob no extra stat() is needed per entry. Symlinked directories are not followed.
+    """
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from iter_python_files(entry.path)
+            elif entry.name.endswith(".py"):
+                yield Path(entry.path)
 
 
 class PackageCommand(Command):
@@ -52,6 +576,13 @@ class PackageCommand(Command):
         option("build-verbose", description="Enable verbose logging for build processes", flag=True),
     ]
 
+    def __init__(self) -> None:
+        super().__init__()
+        # Tool and Docker daemon checks are answered once per run and shared by all builds
+        self._tool_cache: dict[str, bool] = {}
+        self._docker_running: bool | None = None
+        self._docker_check_lock = threading.Lock()
+
     def handle(self) -> int:
         """Execute the package command."""
         import platform
@@ -79,6 +610,13 @@ class PackageCommand(Command):
             console.print("[red]No deployment found. Run 'poetry run ccwb init' first.[/red]")
             return 1
 
+        # Start fetching the Identity Pool ID or Role ARN now, so the AWS round trip overlaps the prompts.
+        # Errors are raised rather than printed, and reported after the prompts so they cannot garble them.
+        auth_stack_name = profile.stack_names.get("auth", f"{profile.identity_pool_name}-stack")
+        executor = ThreadPoolExecutor(max_workers=1)
+        stack_outputs_future = executor.submit(fetch_stack_outputs, auth_stack_name, profile.aws_region)
+        executor.shutdown(wait=False)
+
         # Interactive prompts if not provided via CLI
         target_platform = self.option("target-platform")
         if target_platform == "all":  # Default value, prompt user
@@ -129,9 +667,11 @@ class PackageCommand(Command):
 
         # Get actual Identity Pool ID or Role ARN from stack outputs
         console.print("[yellow]Fetching deployment information...[/yellow]")
-        stack_outputs = get_stack_outputs(
-            profile.stack_names.get("auth", f"{profile.identity_pool_name}-stack"), profile.aws_region
-        )
+        try:
+            stack_outputs = stack_outputs_future.result()
+        except Exception as e:
+            console.print(f"[red]Error getting stack outputs: {e}[/red]")
+            stack_outputs = {}
 
         if not stack_outputs:
             console.print("[red]Could not fetch stack outputs. Is the stack deployed?[/red]")
@@ -238,8 +778,7 @@ class PackageCommand(Command):
                         else:
                             platforms_to_build.append("macos-intel")
 
-                        docker_check = subprocess.run(["docker", "--version"], capture_output=True)
-                        if docker_check.returncode == 0:
+                        if self._have_tool("docker"):
                             platforms_to_build.append("linux-x64")
                             platforms_to_build.append("linux-arm64")
                     elif current_os == "linux":
@@ -278,8 +817,7 @@ class PackageCommand(Command):
                     platforms_to_build.append("macos-intel")
 
                 # Check if Docker is available for Linux builds
-                docker_check = subprocess.run(["docker", "--version"], capture_output=True)
-                if docker_check.returncode == 0:
+                if self._have_tool("docker"):
                     platforms_to_build.append("linux-x64")
                     platforms_to_build.append("linux-arm64")
 
@@ -295,38 +833,10 @@ class PackageCommand(Command):
             # Single platform specified
             platforms_to_build = [target_platform]
 
-        built_executables = []
-        built_otel_helpers = []
-
         console.print()
-        for platform_name in platforms_to_build:
-            # Build credential process
-            console.print(f"[cyan]Building credential process for {platform_name}...[/cyan]")
-            try:
-                executable_path = self._build_executable(output_dir, platform_name)
-                # Check if this was an async Windows build
-                if executable_path is None:
-                    # Windows build started in CodeBuild, continue without local binary
-                    console.print("[dim]Windows binaries will be built in CodeBuild[/dim]")
-                else:
-                    built_executables.append((platform_name, executable_path))
-            except Exception as e:
-                console.print(f"[yellow]Warning: Could not build credential process for {platform_name}: {e}[/yellow]")
-
-            # Build OTEL helper if monitoring is enabled
-            if profile.monitoring_enabled:
-                # Skip OTEL helper for Windows if being built in CodeBuild
-                if platform_name == "windows" and executable_path is None:
-                    console.print("[dim]Windows OTEL helper will be built in CodeBuild[/dim]")
-                else:
-                    console.print(f"[cyan]Building OTEL helper for {platform_name}...[/cyan]")
-                    try:
-                        otel_helper_path = self._build_otel_helper(output_dir, platform_name)
-                        # Only add to list if build was successful (not None)
-                        if otel_helper_path is not None:
-                            built_otel_helpers.append((platform_name, otel_helper_path))
-                    except Exception as e:
-                        console.print(f"[yellow]Warning: Could not build OTEL helper for {platform_name}: {e}[/yellow]")
+        built_executables, built_otel_helpers = self._build_binaries(
+            output_dir, platforms_to_build, profile.monitoring_enabled, console
+        )
 
         # Check if any binaries were built
         if not built_executables:
@@ -348,7 +858,7 @@ class PackageCommand(Command):
         if built_otel_helpers:
             import shutil as _shutil
 
-            shell_wrapper_src = Path(__file__).parent.parent.parent.parent / "otel_helper" / "otel-helper.sh"
+            shell_wrapper_src = SOURCE_DIR / "otel_helper" / "otel-helper.sh"
             if shell_wrapper_src.exists():
                 shell_wrapper_dst = output_dir / "otel-helper.sh"
                 _shutil.copy2(shell_wrapper_src, shell_wrapper_dst)
@@ -405,6 +915,77 @@ class PackageCommand(Command):
 
         return 0
 
+    def _build_binaries(
+        self, output_dir: Path, platforms_to_build: list[str], monitoring_enabled: bool, console: Console
+    ) -> tuple[list[tuple[str, Path]], list[tuple[str, Path]]]:
+        """Build the credential process and, with monitoring, the OTEL helper for each platform.
+
+        Returns:
+            (built_executables, built_otel_helpers) as (platform, binary path) pairs, in platform order
+        """
+        builds: dict[tuple[str, str], Path | None] = {}
+
+        if "windows" in platforms_to_build:
+            # Windows binaries come from CodeBuild (or Nuitka on Windows); the OTEL helper depends on that build
+            console.print("[cyan]Building credential process for windows...[/cyan]")
+            executable_path = None
+            try:
+                executable_path = self._build_executable(output_dir, "windows")
+                builds[("credential-process", "windows")] = executable_path
+                if executable_path is None:
+                    # Windows build started in CodeBuild, continue without local binary
+                    console.print("[dim]Windows binaries will be built in CodeBuild[/dim]")
+            except Exception as e:
+                console.print(f"[yellow]Warning: Could not build credential process for windows: {e}[/yellow]")
+
+            if monitoring_enabled:
+                if executable_path is None:
+                    console.print("[dim]Windows OTEL helper will be built in CodeBuild[/dim]")
+                else:
+                    console.print("[cyan]Building OTEL helper for windows...[/cyan]")
+                    try:
+                        builds[("otel-helper", "windows")] = self._build_otel_helper(output_dir, "windows")
+                    except Exception as e:
+                        console.print(f"[yellow]Warning: Could not build OTEL helper for windows: {e}[/yellow]")
+
+        # Every other build is a separate PyInstaller or Docker subprocess with its own work directory,
+        # so the credential process and OTEL helper builds for all platforms run concurrently
+        build_jobs = []
+        for platform_name in platforms_to_build:
+            if platform_name == "windows":
+                continue
+            build_jobs.append(("credential-process", platform_name, self._build_executable))
+            if monitoring_enabled:
+                build_jobs.append(("otel-helper", platform_name, self._build_otel_helper))
+
+        if build_jobs:
+            with ThreadPoolExecutor(max_workers=len(build_jobs)) as executor:
+                futures = {}
+                for kind, platform_name, build in build_jobs:
+                    label = "credential process" if kind == "credential-process" else "OTEL helper"
+                    console.print(f"[cyan]Building {label} for {platform_name}...[/cyan]")
+                    futures[executor.submit(build, output_dir, platform_name)] = (kind, platform_name, label)
+
+                for future in as_completed(futures):
+                    kind, platform_name, label = futures[future]
+                    try:
+                        builds[(kind, platform_name)] = future.result()
+                    except Exception as e:
+                        console.print(f"[yellow]Warning: Could not build {label} for {platform_name}: {e}[/yellow]")
+
+        # Report binaries in the order the platforms were requested; None means no local binary was built
+        built_executables = [
+            (platform_name, builds[("credential-process", platform_name)])
+            for platform_name in platforms_to_build
+            if builds.get(("credential-process", platform_name)) is not None
+        ]
+        built_otel_helpers = [
+            (platform_name, builds[("otel-helper", platform_name)])
+            for platform_name in platforms_to_build
+            if builds.get(("otel-helper", platform_name)) is not None
+        ]
+        return built_executables, built_otel_helpers
+
     def _check_build_status(self, build_id: str, console: Console) -> int:
         """Check the status of a CodeBuild build."""
         import json
@@ -486,7 +1067,6 @@ class PackageCommand(Command):
         import platform
 
         current_system = platform.system().lower()
-        current_machine = platform.machine().lower()
 
         # Windows builds use Nuitka via CodeBuild
         if target_platform == "windows":
@@ -499,6 +1079,16 @@ class PackageCommand(Command):
                 self._build_windows_via_codebuild(output_dir)
                 return None  # No local binary created
 
+        return self._build_with_cache(
+            output_dir, target_platform, "credential_provider", self._build_credential_process
+        )
+
+    def _build_credential_process(self, output_dir: Path, target_platform: str) -> Path:
+        """Build the credential-process binary for a macOS or Linux target platform."""
+        import platform
+
+        current_machine = platform.machine().lower()
+
         # macOS builds use PyInstaller for cross-architecture support
         if target_platform == "macos-arm64":
             return self._build_macos_pyinstaller(output_dir, "arm64")
@@ -607,9 +1197,8 @@ class PackageCommand(Command):
             )
 
         # Check if Nuitka is available (through Poetry)
-        source_dir = Path(__file__).parent.parent.parent.parent
         nuitka_check = subprocess.run(
-            ["poetry", "run", "which", "nuitka"], capture_output=True, text=True, cwd=source_dir
+            ["poetry", "run", "which", "nuitka"], capture_output=True, text=True, cwd=SOURCE_DIR
         )
         if nuitka_check.returncode != 0:
             raise RuntimeError(
@@ -619,7 +1208,7 @@ class PackageCommand(Command):
             )
 
         # Find the source file
-        src_file = Path(__file__).parent.parent.parent.parent.parent / "source" / "credential_provider" / "__main__.py"
+        src_file = SOURCE_DIR / "credential_provider" / "__main__.py"
 
         if not src_file.exists():
             raise FileNotFoundError(f"Source file not found: {src_file}")
@@ -689,13 +1278,97 @@ class PackageCommand(Command):
         cmd.append(str(src_file))
 
         # Run Nuitka (from source directory where pyproject.toml is located)
-        source_dir = Path(__file__).parent.parent.parent.parent
-        result = subprocess.run(cmd, capture_output=not verbose, text=True, cwd=source_dir)
-        if result.returncode != 0:
-            raise RuntimeError(f"Nuitka build failed: {result.stderr}")
+        returncode, output = self._run_capture_tail(cmd, echo=verbose, cwd=SOURCE_DIR)
+        if returncode != 0:
+            raise RuntimeError(f"Nuitka build failed: {output}")
 
         return output_dir / binary_name
 
+    def _source_hash(self, package: str) -> str:
+        """Hash everything a binary is built from: the package sources, dependencies and build recipe.
+
+        Covers the .py files of the package, pyproject.toml and poetry.lock, this module (which holds
+        the PyInstaller flags and Dockerfiles), and the building Python and machine.
+        """
+        package_dir = SOURCE_DIR / package
+        inputs = [*sorted(iter_python_files(package_dir)), SOURCE_DIR / "pyproject.toml", SOURCE_DIR / "poetry.lock"]
+        digest = hashlib.sha256(f"{sys.version}\0{platform.machine()}\0".encode())
+        digest.update(hashlib.sha256(Path(__file__).read_bytes()).digest())
+        for path in inputs:
+            if path.is_file():
+                digest.update(f"{path.relative_to(SOURCE_DIR)}\0".encode())
+                digest.update(hashlib.sha256(path.read_bytes()).digest())
+        return digest.hexdigest()
+
+    def _build_with_cache(self, output_dir: Path, target_platform: str, package: str, build) -> Path | None:
+        """Copy a cached binary built from identical sources into output_dir, or build and cache it.
+
+        Binaries are kept under ~/.cache/ccwb/binaries/<package>-<platform>-<source hash>, so repeated
+        package runs skip PyInstaller entirely until the sources, dependencies or build recipe change.
+        Only the newest binary per package and platform is kept.
+        """
+        cache_root = Path.home() / ".cache" / "ccwb" / "binaries"
+        cache_dir = cache_root / f"{package}-{target_platform}-{self._source_hash(package)}"
+        cached = [path for path in cache_dir.glob("*") if not path.name.startswith(".")]
+        if cached:
+            Console().print(f"[dim]Reusing cached {cached[0].name} (sources unchanged)[/dim]")
+            return Path(shutil.copy2(cached[0], output_dir / cached[0].name))
+
+        binary_path = build(output_dir, target_platform)
+        if binary_path and binary_path.exists():
+            # Copy under a temporary name first so an interrupted copy is never picked up as a cache hit
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            partial_path = cache_dir / f".{binary_path.name}.partial"
+            shutil.copy2(binary_path, partial_path)
+            os.replace(partial_path, cache_dir / binary_path.name)
+
+            # Binaries from older sources are never reused, so drop them rather than let the cache grow
+            for stale_dir in cache_root.glob(f"{package}-{target_platform}-*"):
+                if stale_dir != cache_dir:
+                    shutil.rmtree(stale_dir, ignore_errors=True)
+        return binary_path
+
+    def _run_capture_tail(
+        self, cmd: list[str], echo: bool = False, tail_bytes: int = BUILD_OUTPUT_TAIL_BYTES, **kwargs
+    ) -> tuple[int, str]:
+        """Run a build command, keeping only the tail of its combined stdout and stderr.
+
+        Build logs can run to megabytes, so the output is streamed and only the last tail_bytes
+        are kept for the error message. With echo, the output is also passed through to the terminal.
+
+        Returns:
+            The exit code and the decoded tail of the output
+        """
+        chunk_size = 4096
+        chunks: deque[bytes] = deque()
+        kept = 0
+        with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, **kwargs) as process:
+            for chunk in iter(lambda: process.stdout.read1(chunk_size), b""):
+                chunks.append(chunk)
+                kept += len(chunk)
+                # read1 may return short chunks, so trim by bytes rather than chunk count
+                while kept - len(chunks[0]) >= tail_bytes:
+                    kept -= len(chunks.popleft())
+                if echo:
+                    sys.stdout.buffer.write(chunk)
+                    sys.stdout.buffer.flush()
+        tail = b"".join(chunks)[-tail_bytes:]
+        return process.returncode, tail.decode(errors="replace")
+
+    def _pyinstaller_cache_dir(self, binary_name: str) -> Path:
+        """Get the persistent PyInstaller work directory for a binary, creating it if needed.
+
+        It lives outside /tmp so the analysis cache survives reboots, and each binary gets its
+        own directory so concurrent builds never share one.
+        """
+        cache_dir = Path.home() / ".cache" / "ccwb" / "pyinstaller" / binary_name
+        os.makedirs(cache_dir, exist_ok=True)
+        return cache_dir
+
+    def _pyinstaller_env(self, cache_dir: Path) -> dict[str, str]:
+        """Build the environment for a local PyInstaller run, keeping its config cache in cache_dir."""
+        return {**os.environ, "PYINSTALLER_CONFIG_DIR": str(cache_dir / "config")}
+
     def _build_macos_pyinstaller(self, output_dir: Path, arch: str) -> Path:
         """Build macOS executable using PyInstaller with target architecture."""
         console = Console()
@@ -712,7 +1385,7 @@ class PackageCommand(Command):
             raise ValueError(f"Unsupported macOS architecture: {arch}")
 
         # Find the source file
-        src_file = Path(__file__).parent.parent.parent.parent.parent / "source" / "credential_provider" / "__main__.py"
+        src_file = SOURCE_DIR / "credential_provider" / "__main__.py"
         if not src_file.exists():
             raise FileNotFoundError(f"Source file not found: {src_file}")
 
@@ -740,7 +1413,8 @@ class PackageCommand(Command):
         # Determine log level based on verbose flag
         log_level = "INFO" if verbose else "WARN"
 
-        # Build PyInstaller command
+        # Build PyInstaller command (without --clean, so the cached analysis is reused)
+        cache_dir = self._pyinstaller_cache_dir(binary_name)
         if use_x86_python:
             # Use x86_64 Python environment
             cmd = [
@@ -748,12 +1422,11 @@ class PackageCommand(Command):
                 "-x86_64",
                 str(x86_venv_path / "bin" / "pyinstaller"),
                 "--onefile",
-                "--clean",
                 "--noconfirm",
                 f"--name={binary_name}",
                 f"--distpath={str(output_dir)}",
-                "--workpath=/tmp/pyinstaller-x86",
-                "--specpath=/tmp/pyinstaller-x86",
+                f"--workpath={cache_dir / 'build'}",
+                f"--specpath={cache_dir}",
                 f"--log-level={log_level}",
                 # Hidden imports for our dependencies
                 "--hidden-import=keyring.backends.macOS",
@@ -769,13 +1442,12 @@ class PackageCommand(Command):
                 "run",
                 "pyinstaller",
                 "--onefile",
-                "--clean",
                 "--noconfirm",
                 f"--target-arch={arch}",
                 f"--name={binary_name}",
                 f"--distpath={str(output_dir)}",
-                "--workpath=/tmp/pyinstaller",
-                "--specpath=/tmp/pyinstaller",
+                f"--workpath={cache_dir / 'build'}",
+                f"--specpath={cache_dir}",
                 f"--log-level={log_level}",
                 # Hidden imports for our dependencies
                 "--hidden-import=keyring.backends.macOS",
@@ -786,12 +1458,13 @@ class PackageCommand(Command):
             ]
 
         # Run PyInstaller from source directory
-        source_dir = Path(__file__).parent.parent.parent.parent
-        result = subprocess.run(cmd, capture_output=not verbose, text=True, cwd=source_dir)
+        returncode, output = self._run_capture_tail(
+            cmd, echo=verbose, cwd=SOURCE_DIR, env=self._pyinstaller_env(cache_dir)
+        )
 
-        if result.returncode != 0:
-            console.print(f"[red]PyInstaller build failed: {result.stderr}[/red]")
-            raise RuntimeError(f"PyInstaller build failed: {result.stderr}")
+        if returncode != 0:
+            console.print(f"[red]PyInstaller build failed: {output}[/red]")
+            raise RuntimeError(f"PyInstaller build failed: {output}")
 
         binary_path = output_dir / binary_name
         if binary_path.exists():
@@ -816,7 +1489,7 @@ class PackageCommand(Command):
             binary_name = "credential-process-linux-x64"
 
         # Find the source file
-        src_file = Path(__file__).parent.parent.parent.parent.parent / "source" / "credential_provider" / "__main__.py"
+        src_file = SOURCE_DIR / "credential_provider" / "__main__.py"
         if not src_file.exists():
             raise FileNotFoundError(f"Source file not found: {src_file}")
 
@@ -825,18 +1498,18 @@ class PackageCommand(Command):
         # Determine log level based on verbose flag
         log_level = "INFO" if verbose else "WARN"
 
-        # Build PyInstaller command
+        # Build PyInstaller command (without --clean, so the cached analysis is reused)
+        cache_dir = self._pyinstaller_cache_dir(binary_name)
         cmd = [
             "poetry",
             "run",
             "pyinstaller",
             "--onefile",
-            "--clean",
             "--noconfirm",
             f"--name={binary_name}",
             f"--distpath={str(output_dir)}",
-            "--workpath=/tmp/pyinstaller",
-            "--specpath=/tmp/pyinstaller",
+            f"--workpath={cache_dir / 'build'}",
+            f"--specpath={cache_dir}",
             f"--log-level={log_level}",
             # Hidden imports for our dependencies
             "--hidden-import=keyring.backends.SecretService",
@@ -851,12 +1524,13 @@ class PackageCommand(Command):
         ]
 
         # Run PyInstaller from source directory
-        source_dir = Path(__file__).parent.parent.parent.parent
-        result = subprocess.run(cmd, capture_output=not verbose, text=True, cwd=source_dir)
+        returncode, output = self._run_capture_tail(
+            cmd, echo=verbose, cwd=SOURCE_DIR, env=self._pyinstaller_env(cache_dir)
+        )
 
-        if result.returncode != 0:
-            console.print(f"[red]PyInstaller build failed: {result.stderr}[/red]")
-            raise RuntimeError(f"PyInstaller build failed: {result.stderr}")
+        if returncode != 0:
+            console.print(f"[red]PyInstaller build failed: {output}[/red]")
+            raise RuntimeError(f"PyInstaller build failed: {output}")
 
         binary_path = output_dir / binary_name
         if binary_path.exists():
@@ -868,374 +1542,139 @@ class PackageCommand(Command):
 
     def _build_linux_via_docker(self, output_dir: Path, arch: str = "x64") -> Path:
         """Build Linux binaries using Docker with PyInstaller."""
-        import shutil
-        import tempfile
-
-        console = Console()
-        verbose = self.option("build-verbose")
-
-        # Determine platform and binary name
-        if arch == "arm64":
-            docker_platform = "linux/arm64"
-            binary_name = "credential-process-linux-arm64"
-        else:
-            docker_platform = "linux/amd64"
-            binary_name = "credential-process-linux-x64"
-
-        # Check if Docker is available and running
-        docker_check = subprocess.run(["docker", "--version"], capture_output=True)
-        if docker_check.returncode != 0:
-            console.print(f"\n[yellow]⚠️  Docker not found - skipping Linux {arch} build[/yellow]")
-            console.print("[dim]Linux binaries require Docker Desktop to be installed and running.[/dim]")
-            console.print("[dim]Install Docker: https://docs.docker.com/get-docker/[/dim]")
-            console.print(f"[dim]Skipping credential-process-linux-{arch}[/dim]\n")
-            # Return a dummy path that won't be included in the package
-            return None
-
-        # Check if Docker daemon is running
-        daemon_check = subprocess.run(["docker", "info"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-        if daemon_check.returncode != 0:
-            console.print(f"\n[yellow]⚠️  Docker daemon not running - skipping Linux {arch} build[/yellow]")
-            console.print("[dim]Please start Docker Desktop and try again.[/dim]")
-            console.print(f"[dim]Skipping credential-process-linux-{arch}[/dim]\n")
-            # Return a dummy path that won't be included in the package
-            return None
-
-        # Create a temporary directory for the Docker build
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Copy source files to temp directory
-            source_dir = Path(__file__).parent.parent.parent.parent
-            shutil.copytree(source_dir / "credential_provider", temp_path / "credential_provider")
-
-            # Create Dockerfile with PyInstaller
-            dockerfile_content = f"""FROM --platform={docker_platform} ubuntu:22.04
-
-# Set non-interactive to avoid tzdata prompts
-ENV DEBIAN_FRONTEND=noninteractive
-ENV TZ=UTC
-
-# Install Python 3.12 and build dependencies
-RUN apt-get update && apt-get install -y \
-    software-properties-common \
-    build-essential \
-    binutils \
-    curl \
-    && add-apt-repository -y ppa:deadsnakes/ppa \
-    && apt-get update \
-    && apt-get install -y python3.12 python3.12-dev python3.12-venv \
-    && python3.12 -m ensurepip \
-    && python3.12 -m pip install --upgrade pip \
-    && rm -rf /var/lib/apt/lists/*
-
-# Set Python 3.12 as default python3
-RUN update-alternatives --install /usr/bin/python3 python3 /usr/bin/python3.12 1
-
-# Install Python packages
-RUN python3 -m pip install --no-cache-dir \
-    pyinstaller==6.3.0 \
-    boto3 \
-    requests \
-    PyJWT \
-    cryptography \
-    keyring \
-    keyrings.alt \
-    questionary \
-    rich \
-    cleo \
-    pydantic \
-    pyyaml \
-    six==1.16.0 \
-    python-dateutil
-
-# Set working directory
-WORKDIR /build
-
-# Copy source code
-COPY credential_provider /build/credential_provider
-
-# Build the binary with PyInstaller
-RUN pyinstaller \
-    --onefile \
-    --clean \
-    --noconfirm \
-    --name {binary_name} \
-    --distpath /output \
-    --workpath /tmp/build \
-    --specpath /tmp \
-    --log-level WARN \
-    --hidden-import keyring.backends.SecretService \
-    --hidden-import keyring.backends.chainer \
-    --hidden-import six \
-    --hidden-import six.moves \
-    --hidden-import six.moves._thread \
-    --hidden-import six.moves.urllib \
-    --hidden-import six.moves.urllib.parse \
-    --hidden-import dateutil \
-    credential_provider/__main__.py
-
-# The binary will be in /output/{binary_name}
-"""
-
-            (temp_path / "Dockerfile").write_text(dockerfile_content)
-
-            # Generate unique image tag to avoid reusing cached images
-            import time
-
-            image_tag = f"ccwb-linux-{arch}-builder-{int(time.time())}"
-
-            # Remove any existing image with similar name to ensure fresh build
-            if verbose:
-                console.print("[dim]Cleaning up old Docker images...[/dim]")
-            subprocess.run(
-                ["docker", "rmi", "-f", f"ccwb-linux-{arch}-builder"],
-                capture_output=True,
-            )
-
-            # Build Docker image
-            console.print(f"[yellow]Building Linux {arch} binary via Docker (this may take a few minutes)...[/yellow]")
-            if verbose:
-                console.print("[dim]Docker build output:[/dim]")
-            build_result = subprocess.run(
-                [
-                    "docker",
-                    "buildx",
-                    "build",
-                    "--no-cache",
-                    "--platform",
-                    docker_platform,
-                    "-t",
-                    image_tag,
-                    "--load",
-                    ".",
-                ],
-                cwd=temp_path,
-                capture_output=not verbose,
-                text=True,
-            )
-
-            if build_result.returncode != 0:
-                raise RuntimeError(f"Docker build failed: {build_result.stderr}")
-
-            # Run container and copy binary out
-            import time
-
-            container_name = f"ccwb-extract-{arch}-{int(time.time())}"
-
-            # Create container from the newly built image
-            run_result = subprocess.run(
-                ["docker", "create", "--name", container_name, image_tag],
-                capture_output=True,
-                text=True,
-            )
-
-            if run_result.returncode != 0:
-                raise RuntimeError(f"Failed to create container: {run_result.stderr}")
-
-            try:
-                # Copy binary from container
-                copy_result = subprocess.run(
-                    ["docker", "cp", f"{container_name}:/output/{binary_name}", str(output_dir)],
-                    capture_output=True,
-                    text=True,
-                )
-
-                if copy_result.returncode != 0:
-                    raise RuntimeError(f"Failed to copy binary from container: {copy_result.stderr}")
-
-                # Verify the binary was created
-                binary_path = output_dir / binary_name
-                if not binary_path.exists():
-                    raise RuntimeError(f"Linux {arch} binary was not created successfully")
-
-                # Make it executable
-                binary_path.chmod(0o755)
-
-                console.print(f"[green]✓ Linux {arch} binary built successfully via Docker[/green]")
-                return binary_path
-
-            finally:
-                # Clean up container and image
-                subprocess.run(["docker", "rm", container_name], capture_output=True)
-                subprocess.run(["docker", "rmi", image_tag], capture_output=True)
-
-    def _build_linux_otel_helper_via_docker(self, output_dir: Path, arch: str = "x64") -> Path:
-        """Build Linux OTEL helper binary using Docker with PyInstaller."""
-        import shutil
-        import tempfile
-
-        console = Console()
-        verbose = self.option("build-verbose")
-
-        # Determine platform and binary name
-        if arch == "arm64":
-            docker_platform = "linux/arm64"
-            binary_name = "otel-helper-linux-arm64"
-        else:
-            docker_platform = "linux/amd64"
-            binary_name = "otel-helper-linux-x64"
-
-        # Check if Docker is available and running
-        docker_check = subprocess.run(["docker", "--version"], capture_output=True)
-        if docker_check.returncode != 0:
-            console.print(f"\n[yellow]⚠️  Docker not found - skipping Linux {arch} OTEL helper build[/yellow]")
-            console.print("[dim]Linux binaries require Docker Desktop to be installed and running.[/dim]")
-            console.print(f"[dim]Skipping otel-helper-linux-{arch}[/dim]\n")
-            # Return a dummy path that won't be included in the package
-            return None
-
-        # Check if Docker daemon is running
-        daemon_check = subprocess.run(["docker", "info"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-        if daemon_check.returncode != 0:
-            console.print(f"\n[yellow]⚠️  Docker daemon not running - skipping Linux {arch} OTEL helper build[/yellow]")
-            console.print("[dim]Please start Docker Desktop and try again.[/dim]")
-            console.print(f"[dim]Skipping otel-helper-linux-{arch}[/dim]\n")
-            # Return a dummy path that won't be included in the package
-            return None
-
-        # Create a temporary directory for the Docker build
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Copy source files to temp directory
-            source_dir = Path(__file__).parent.parent.parent.parent
-            shutil.copytree(source_dir / "otel_helper", temp_path / "otel_helper")
-
-            # Create Dockerfile for OTEL helper with PyInstaller
-            dockerfile_content = f"""FROM --platform={docker_platform} ubuntu:22.04
-
-# Set non-interactive to avoid tzdata prompts
-ENV DEBIAN_FRONTEND=noninteractive
-ENV TZ=UTC
-
-# Install Python 3.12 and build dependencies
-RUN apt-get update && apt-get install -y \
-    software-properties-common \
-    build-essential \
-    binutils \
-    curl \
-    && add-apt-repository -y ppa:deadsnakes/ppa \
-    && apt-get update \
-    && apt-get install -y python3.12 python3.12-dev python3.12-venv \
-    && python3.12 -m ensurepip \
-    && python3.12 -m pip install --upgrade pip \
-    && rm -rf /var/lib/apt/lists/*
-
-# Set Python 3.12 as default python3
-RUN update-alternatives --install /usr/bin/python3 python3 /usr/bin/python3.12 1
-
-# Install Python packages
-RUN python3 -m pip install --no-cache-dir \
-    pyinstaller==6.3.0 \
-    PyJWT \
-    cryptography \
-    six
-
-# Set working directory
-WORKDIR /build
-
-# Copy source code
-COPY otel_helper /build/otel_helper
-
-# Build the binary with PyInstaller
-RUN pyinstaller \
-    --onefile \
-    --clean \
-    --noconfirm \
-    --name {binary_name} \
-    --distpath /output \
-    --workpath /tmp/build \
-    --specpath /tmp \
-    --log-level WARN \
-    --hidden-import six \
-    --hidden-import six.moves \
-    otel_helper/__main__.py
-
-# The binary will be in /output/{binary_name}
-"""
+        return self._build_linux_binary_via_docker(CREDENTIAL_PROCESS_DOCKER_BUILD, output_dir, arch)
 
-            (temp_path / "Dockerfile").write_text(dockerfile_content)
+    def _build_linux_otel_helper_via_docker(self, output_dir: Path, arch: str = "x64") -> Path:
+        """Build Linux OTEL helper binary using Docker with PyInstaller."""
+        return self._build_linux_binary_via_docker(OTEL_HELPER_DOCKER_BUILD, output_dir, arch)
 
-            # Generate unique image tag to avoid reusing cached images
-            import time
+    def _build_linux_binary_via_docker(self, spec: DockerBuildSpec, output_dir: Path, arch: str) -> Path | None:
+        """Build one Linux binary described by spec using Docker with PyInstaller.
 
-            image_tag = f"ccwb-otel-{arch}-builder-{int(time.time())}"
+        Returns:
+            Path to the binary, or None if Docker is not available
+        """
+        console = Console()
 
-            # Remove any existing image with similar name to ensure fresh build
-            if verbose:
-                console.print("[dim]Cleaning up old Docker images...[/dim]")
-            subprocess.run(
-                ["docker", "rmi", "-f", f"ccwb-otel-{arch}-builder"],
-                capture_output=True,
-            )
+        # Determine platform and binary name
+        docker_platform = "linux/arm64" if arch == "arm64" else "linux/amd64"
+        binary_name = f"{spec.binary_prefix}-linux-{arch}"
+        description = f"Linux {arch} {spec.description}"
 
-            # Build Docker image
-            console.print(f"[yellow]Building Linux {arch} OTEL helper via Docker...[/yellow]")
-            if verbose:
-                console.print("[dim]Docker build output:[/dim]")
-            build_result = subprocess.run(
-                [
-                    "docker",
-                    "buildx",
-                    "build",
-                    "--no-cache",
-                    "--platform",
-                    docker_platform,
-                    "-t",
-                    image_tag,
-                    "--load",
-                    ".",
-                ],
-                cwd=temp_path,
-                capture_output=not verbose,
-                text=True,
-            )
+        # Check if Docker is available and running
+        if not self._have_tool("docker"):
+            console.print(f"\n[yellow]⚠️  Docker not found - skipping {description} build[/yellow]")
+            console.print("[dim]Linux binaries require Docker Desktop to be installed and running.[/dim]")
+            console.print("[dim]Install Docker: https://docs.docker.com/get-docker/[/dim]")
+            console.print(f"[dim]Skipping {binary_name}[/dim]\n")
+            # Return a dummy path that won't be included in the package
+            return None
+
+        # Check if Docker daemon is running
+        if not self._docker_daemon_running():
+            console.print(f"\n[yellow]⚠️  Docker daemon not running - skipping {description} build[/yellow]")
+            console.print("[dim]Please start Docker Desktop and try again.[/dim]")
+            console.print(f"[dim]Skipping {binary_name}[/dim]\n")
+            # Return a dummy path that won't be included in the package
+            return None
 
-            if build_result.returncode != 0:
-                raise RuntimeError(f"Docker build failed for OTEL helper: {build_result.stderr}")
+        # Create a temporary directory for the Docker build
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
 
-            # Run container and copy binary out
-            import time
+            # Copy source files to temp directory
+            shutil.copytree(SOURCE_DIR / spec.package, temp_path / spec.package, ignore=DOCKER_CONTEXT_IGNORE)
 
-            container_name = f"ccwb-otel-extract-{arch}-{int(time.time())}"
+            dockerfile_content = spec.dockerfile(docker_platform, binary_name)
 
-            # Create container from the newly built image
-            run_result = subprocess.run(
-                ["docker", "create", "--name", container_name, image_tag],
-                capture_output=True,
-                text=True,
+            console.print(f"[yellow]Building {description} via Docker (this may take a few minutes)...[/yellow]")
+            binary_path = self._build_binary_with_docker(
+                temp_path, dockerfile_content, docker_platform, binary_name, output_dir, description
             )
+            console.print(f"[green]✓ {description} built successfully via Docker[/green]")
+            return binary_path
+
+    def _have_tool(self, name: str) -> bool:
+        """Check whether an executable is on PATH, remembering the answer for this run."""
+        if name not in self._tool_cache:
+            self._tool_cache[name] = shutil.which(name) is not None
+        return self._tool_cache[name]
+
+    def _docker_daemon_running(self) -> bool:
+        """Check whether the Docker daemon is reachable, running `docker info` at most once per run."""
+        with self._docker_check_lock:
+            if self._docker_running is None:
+                daemon_check = subprocess.run(["docker", "info"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                self._docker_running = daemon_check.returncode == 0
+        return self._docker_running
+
+    def _build_binary_with_docker(
+        self,
+        build_dir: Path,
+        dockerfile_content: str,
+        docker_platform: str,
+        binary_name: str,
+        output_dir: Path,
+        description: str,
+    ) -> Path:
+        """Build a Dockerfile that produces /output/<binary_name> and export the binary to output_dir.
 
-            if run_result.returncode != 0:
-                raise RuntimeError(f"Failed to create container: {run_result.stderr}")
+        A final scratch stage holding only the binary is exported with BuildKit's local exporter,
+        so the binary is written straight to the host: no image is loaded and no container is
+        created to copy it out.
 
-            try:
-                # Copy binary from container
-                copy_result = subprocess.run(
-                    ["docker", "cp", f"{container_name}:/output/{binary_name}", str(output_dir)],
-                    capture_output=True,
-                    text=True,
-                )
+        Args:
+            build_dir: Docker build context; the Dockerfile is written here
+            dockerfile_content: Dockerfile whose "build" stage leaves the binary in /output
+            docker_platform: Docker platform to build for (e.g. linux/amd64)
+            binary_name: Name of the binary inside /output and in output_dir
+            output_dir: Directory to copy the binary into
+            description: What is being built, for error messages
+
+        Returns:
+            Path to the executable binary in output_dir
+        """
+        console = Console()
+        verbose = self.option("build-verbose")
 
-                if copy_result.returncode != 0:
-                    raise RuntimeError(f"Failed to copy OTEL binary from container: {copy_result.stderr}")
+        (build_dir / "Dockerfile").write_text(
+            f"{dockerfile_content}\nFROM scratch AS export\nCOPY --from=build /output/{binary_name} /\n"
+        )
+        export_dir = build_dir / "export"
 
-                # Verify the binary was created
-                binary_path = output_dir / binary_name
-                if not binary_path.exists():
-                    raise RuntimeError(f"Linux {arch} OTEL helper binary was not created successfully")
+        # Build and export the binary
+        if verbose:
+            console.print("[dim]Docker build output:[/dim]")
+        returncode, output = self._run_capture_tail(
+            [
+                "docker",
+                "buildx",
+                "build",
+                # Rebuild only the PyInstaller stage; the cached builder stage is reused
+                "--no-cache-filter",
+                "build",
+                "--platform",
+                docker_platform,
+                "--output",
+                f"type=local,dest={export_dir}",
+                ".",
+            ],
+            echo=verbose,
+            cwd=build_dir,
+        )
 
-                # Make it executable
-                binary_path.chmod(0o755)
+        if returncode != 0:
+            raise RuntimeError(f"Docker build failed for {description}: {output}")
 
-                console.print(f"[green]✓ Linux {arch} OTEL helper built successfully via Docker[/green]")
-                return binary_path
+        # Verify the binary was created and move it into place
+        exported_path = export_dir / binary_name
+        if not exported_path.exists():
+            raise RuntimeError(f"{description} was not created successfully")
+        binary_path = Path(shutil.move(exported_path, output_dir / binary_name))
 
-            finally:
-                # Clean up container and image
-                subprocess.run(["docker", "rm", container_name], capture_output=True)
-                subprocess.run(["docker", "rmi", image_tag], capture_output=True)
+        # Make it executable
+        binary_path.chmod(0o755)
+        return binary_path
 
     def _build_windows_via_codebuild(self, output_dir: Path) -> Path:
         """Build Windows binaries using AWS CodeBuild."""
@@ -1396,17 +1835,14 @@ RUN pyinstaller \
         temp_dir = Path(tempfile.mkdtemp())
         source_zip = temp_dir / "source.zip"
 
-        # Get the source directory (parent of package.py)
-        source_dir = Path(__file__).parents[3]  # Go up to source/ directory
-
         with zipfile.ZipFile(source_zip, "w", zipfile.ZIP_DEFLATED) as zf:
             # Add all Python files from source directory
-            for py_file in source_dir.rglob("*.py"):
-                arcname = str(py_file.relative_to(source_dir.parent))
+            for py_file in iter_python_files(SOURCE_DIR):
+                arcname = str(py_file.relative_to(SOURCE_DIR.parent))
                 zf.write(py_file, arcname)
 
             # Add pyproject.toml for dependencies
-            pyproject_file = source_dir / "pyproject.toml"
+            pyproject_file = SOURCE_DIR / "pyproject.toml"
             if pyproject_file.exists():
                 zf.write(pyproject_file, "pyproject.toml")
 
@@ -1424,6 +1860,10 @@ RUN pyinstaller \
                 # If not, we need to build via CodeBuild (but this should have been done already)
                 raise RuntimeError("Windows otel-helper should have been built with credential-process")
 
+        return self._build_with_cache(output_dir, target_platform, "otel_helper", self._build_otel_helper_binary)
+
+    def _build_otel_helper_binary(self, output_dir: Path, target_platform: str) -> Path:
+        """Build the OTEL helper binary for a macOS or Linux target platform."""
         # macOS builds use PyInstaller
         if target_platform == "macos-arm64":
             return self._build_otel_helper_pyinstaller(output_dir, "macos", "arm64")
@@ -1479,7 +1919,7 @@ RUN pyinstaller \
             raise ValueError(f"Unsupported platform for OTEL helper: {platform_name}")
 
         # Find the source file
-        src_file = Path(__file__).parent.parent.parent.parent / "otel_helper" / "__main__.py"
+        src_file = SOURCE_DIR / "otel_helper" / "__main__.py"
         if not src_file.exists():
             raise FileNotFoundError(f"OTEL helper source not found: {src_file}")
 
@@ -1503,7 +1943,8 @@ RUN pyinstaller \
         # Determine log level based on verbose flag
         log_level = "INFO" if verbose else "WARN"
 
-        # Build PyInstaller command
+        # Build PyInstaller command (without --clean, so the cached analysis is reused)
+        cache_dir = self._pyinstaller_cache_dir(binary_name)
         if use_x86_python:
             # Use x86_64 Python environment
             cmd = [
@@ -1511,12 +1952,11 @@ RUN pyinstaller \
                 "-x86_64",
                 str(x86_venv_path / "bin" / "pyinstaller"),
                 "--onefile",
-                "--clean",
                 "--noconfirm",
                 f"--name={binary_name}",
                 f"--distpath={str(output_dir)}",
-                "--workpath=/tmp/pyinstaller-x86",
-                "--specpath=/tmp/pyinstaller-x86",
+                f"--workpath={cache_dir / 'build'}",
+                f"--specpath={cache_dir}",
                 f"--log-level={log_level}",
                 str(src_file),
             ]
@@ -1527,12 +1967,11 @@ RUN pyinstaller \
                 "run",
                 "pyinstaller",
                 "--onefile",
-                "--clean",
                 "--noconfirm",
                 f"--name={binary_name}",
                 f"--distpath={str(output_dir)}",
-                "--workpath=/tmp/pyinstaller",
-                "--specpath=/tmp/pyinstaller",
+                f"--workpath={cache_dir / 'build'}",
+                f"--specpath={cache_dir}",
                 f"--log-level={log_level}",
                 str(src_file),
             ]
@@ -1542,12 +1981,13 @@ RUN pyinstaller \
             cmd.insert(5, f"--target-arch={arch}")
 
         # Run PyInstaller from source directory
-        source_dir = Path(__file__).parent.parent.parent.parent
-        result = subprocess.run(cmd, capture_output=not verbose, text=True, cwd=source_dir)
+        returncode, output = self._run_capture_tail(
+            cmd, echo=verbose, cwd=SOURCE_DIR, env=self._pyinstaller_env(cache_dir)
+        )
 
-        if result.returncode != 0:
-            console.print(f"[red]PyInstaller build failed for OTEL helper: {result.stderr}[/red]")
-            raise RuntimeError(f"PyInstaller build failed: {result.stderr}")
+        if returncode != 0:
+            console.print(f"[red]PyInstaller build failed for OTEL helper: {output}[/red]")
+            raise RuntimeError(f"PyInstaller build failed: {output}")
 
         binary_path = output_dir / binary_name
         if binary_path.exists():
@@ -1594,7 +2034,7 @@ RUN pyinstaller \
             raise RuntimeError(f"Cannot build Linux binary on {current_system}. Nuitka requires native builds.")
 
         # Find the source file
-        src_file = Path(__file__).parent.parent.parent.parent / "otel_helper" / "__main__.py"
+        src_file = SOURCE_DIR / "otel_helper" / "__main__.py"
 
         if not src_file.exists():
             raise FileNotFoundError(f"OTEL helper script not found: {src_file}")
@@ -1655,10 +2095,9 @@ RUN pyinstaller \
         cmd.append(str(src_file))
 
         # Run Nuitka (from source directory where pyproject.toml is located)
-        source_dir = Path(__file__).parent.parent.parent.parent
-        result = subprocess.run(cmd, capture_output=True, text=True, cwd=source_dir)
-        if result.returncode != 0:
-            raise RuntimeError(f"Nuitka build failed for OTEL helper: {result.stderr}")
+        returncode, output = self._run_capture_tail(cmd, cwd=SOURCE_DIR)
+        if returncode != 0:
+            raise RuntimeError(f"Nuitka build failed for OTEL helper: {output}")
 
         return output_dir / binary_name
 
@@ -1684,326 +2123,76 @@ RUN pyinstaller \
             profile_name: {
                 "provider_domain": profile.provider_domain,
                 "client_id": profile.client_id,
-                "aws_region": profile.aws_region,
-                "provider_type": profile.provider_type or self._detect_provider_type(profile.provider_domain),
-                "credential_storage": profile.credential_storage,
-                "cross_region_profile": profile.cross_region_profile or "us",
-            }
-        }
-
-        # Add the appropriate federation field based on type
-        if federation_type == "direct":
-            config[profile_name]["federated_role_arn"] = federation_identifier
-            config[profile_name]["federation_type"] = "direct"
-            config[profile_name]["max_session_duration"] = profile.max_session_duration
-        else:
-            config[profile_name]["identity_pool_id"] = federation_identifier
-            config[profile_name]["federation_type"] = "cognito"
-
-        # Add cognito_user_pool_id if it's a Cognito provider
-        if profile.provider_type == "cognito" and profile.cognito_user_pool_id:
-            config[profile_name]["cognito_user_pool_id"] = profile.cognito_user_pool_id
-
-        # Add selected_model if available
-        if hasattr(profile, "selected_model") and profile.selected_model:
-            config[profile_name]["selected_model"] = profile.selected_model
-
-        # Add confidential client fields for Azure AD if present.
-        # client_secret is never written to config.json — it lives in the OS keyring.
-        # End users set it with: credential-process --set-client-secret --profile <profile>
-        if getattr(profile, "azure_auth_mode", None):
-            config[profile_name]["azure_auth_mode"] = profile.azure_auth_mode
-        if getattr(profile, "client_certificate_path", None):
-            config[profile_name]["client_certificate_path"] = profile.client_certificate_path
-            config[profile_name]["client_certificate_key_path"] = profile.client_certificate_key_path
-            # Warn if the paths are absolute — they are machine-specific and will not
-            # resolve on end-user machines with different install layouts.
-            cert_is_absolute = Path(profile.client_certificate_path).is_absolute()
-            key_is_absolute = Path(profile.client_certificate_key_path).is_absolute()
-            if (cert_is_absolute or key_is_absolute) and console:
-                console.print(
-                    "\n[yellow]Warning: certificate paths in config.json are absolute and will not "
-                    "resolve on machines where the files are stored elsewhere.[/yellow]"
-                )
-                console.print(
-                    "[yellow]Instruct end users to set the following environment variables:[/yellow]"
-                )
-                console.print("[dim]  AZURE_CLIENT_CERTIFICATE_PATH=<path/to/cert.pem>[/dim]")
-                console.print("[dim]  AZURE_CLIENT_CERTIFICATE_KEY_PATH=<path/to/key.pem>[/dim]\n")
-
-        config_path = output_dir / "config.json"
-        with open(config_path, "w") as f:
-            json.dump(config, f, indent=2)
-        return config_path
-
-    def _get_bedrock_region_for_profile(self, profile) -> str:
-        """Get the correct AWS region for Bedrock API calls based on user-selected source region."""
-        return get_source_region_for_profile(profile)
-
-    def _detect_provider_type(self, domain: str) -> str:
-        """Auto-detect provider type from domain."""
-        from urllib.parse import urlparse
-
-        if not domain:
-            return "oidc"
-
-        # Handle both full URLs and domain-only inputs
-        url_to_parse = domain if domain.startswith(("http://", "https://")) else f"https://{domain}"
-
-        try:
-            parsed = urlparse(url_to_parse)
-            hostname = parsed.hostname
-
-            if not hostname:
-                return "oidc"
-
-            hostname_lower = hostname.lower()
-
-            # Check for exact domain match or subdomain match
-            # Using endswith with leading dot prevents bypass attacks
-            if hostname_lower.endswith(".okta.com") or hostname_lower == "okta.com":
-                return "okta"
-            elif hostname_lower.endswith(".auth0.com") or hostname_lower == "auth0.com":
-                return "auth0"
-            elif hostname_lower.endswith(".microsoftonline.com") or hostname_lower == "microsoftonline.com":
-                return "azure"
-            elif hostname_lower.endswith(".windows.net") or hostname_lower == "windows.net":
-                return "azure"
-            elif hostname_lower.endswith(".amazoncognito.com") or hostname_lower == "amazoncognito.com":
-                return "cognito"
-            else:
-                return "oidc"  # Default to generic OIDC
-        except Exception:
-            return "oidc"  # Default to generic OIDC on parsing error
-
-    def _create_installer(self, output_dir: Path, profile, built_executables, built_otel_helpers=None) -> Path:
-        """Create simple installer script."""
-
-        # Determine which binaries were built
-        platforms_built = [platform for platform, _ in built_executables]
-        [platform for platform, _ in built_otel_helpers] if built_otel_helpers else []
-
-        installer_content = f"""#!/bin/bash
-# Claude Code Authentication Installer
-# Organization: {profile.provider_domain}
-# Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
-
-set -e
-
-echo "======================================"
-echo "Claude Code Authentication Installer"
-echo "======================================"
-echo
-echo "Organization: {profile.provider_domain}"
-echo
-
-
-# Check prerequisites
-echo "Checking prerequisites..."
-
-if ! command -v aws &> /dev/null; then
-    echo "❌ AWS CLI is not installed"
-    echo "   Please install from https://aws.amazon.com/cli/"
-    exit 1
-fi
-
-echo "✓ Prerequisites found"
-
-# Detect platform and architecture
-echo
-echo "Detecting platform and architecture..."
-if [[ "$OSTYPE" == "darwin"* ]]; then
-    PLATFORM="macos"
-    ARCH=$(uname -m)
-    if [[ "$ARCH" == "arm64" ]]; then
-        echo "✓ Detected macOS ARM64 (Apple Silicon)"
-        BINARY_SUFFIX="macos-arm64"
-    else
-        echo "✓ Detected macOS Intel"
-        BINARY_SUFFIX="macos-intel"
-    fi
-elif [[ "$OSTYPE" == "linux-gnu"* ]]; then
-    PLATFORM="linux"
-    ARCH=$(uname -m)
-    if [[ "$ARCH" == "aarch64" ]] || [[ "$ARCH" == "arm64" ]]; then
-        echo "✓ Detected Linux ARM64"
-        BINARY_SUFFIX="linux-arm64"
-    else
-        echo "✓ Detected Linux x64"
-        BINARY_SUFFIX="linux-x64"
-    fi
-else
-    echo "❌ Unsupported platform: $OSTYPE"
-    echo "   This installer supports macOS and Linux only."
-    exit 1
-fi
-
-# Check if binary for platform exists
-CREDENTIAL_BINARY="credential-process-$BINARY_SUFFIX"
-OTEL_BINARY="otel-helper-$BINARY_SUFFIX"
-
-if [ ! -f "$CREDENTIAL_BINARY" ]; then
-    echo "❌ Binary not found for your platform: $CREDENTIAL_BINARY"
-    echo "   Please ensure you have the correct package for your architecture."
-    exit 1
-fi
-"""
-
-        installer_content += f"""
-# Create directory
-echo
-echo "Installing authentication tools..."
-mkdir -p ~/claude-code-with-bedrock
-
-# Copy appropriate binary
-cp "$CREDENTIAL_BINARY" ~/claude-code-with-bedrock/credential-process
-
-# Copy config
-cp config.json ~/claude-code-with-bedrock/
-chmod +x ~/claude-code-with-bedrock/credential-process
-
-# macOS Gatekeeper + Keychain notices
-if [[ "$OSTYPE" == "darwin"* ]]; then
-    # Remove quarantine flag added by macOS when downloading unsigned binaries.
-    # Without this, Gatekeeper blocks execution with "Apple could not verify..." dialog.
-    xattr -d com.apple.quarantine ~/claude-code-with-bedrock/credential-process 2>/dev/null || true
-    echo
-    echo "⚠️  macOS Keychain Access:"
-    echo "   On first use, macOS will ask for permission to access the keychain."
-    echo "   This is normal and required for secure credential storage."
-    echo "   Click 'Always Allow' when prompted."
-fi
-
-# Copy Claude Code settings if present
-if [ -d "claude-settings" ]; then
-    echo
-    echo "Installing Claude Code settings..."
-    mkdir -p ~/.claude
-
-    # Copy settings and replace placeholders
-    if [ -f "claude-settings/settings.json" ]; then
-        # Check if settings file already exists
-        if [ -f ~/.claude/settings.json ]; then
-            echo "Existing Claude Code settings found"
-            read -p "Overwrite with new settings? (Y/n): " -n 1 -r
-            echo
-            # Default to Yes if user just presses enter (empty REPLY)
-            if [[ -z "$REPLY" ]]; then
-                REPLY="y"
-            fi
-            if [[ ! $REPLY =~ ^[Yy]$ ]]; then
-                echo "Skipping Claude Code settings..."
-                SKIP_SETTINGS=true
-            fi
-        fi
-
-        if [ "$SKIP_SETTINGS" != "true" ]; then
-            # Replace placeholders and write settings
-            sed -e "s|__OTEL_HELPER_PATH__|$HOME/claude-code-with-bedrock/otel-helper|g" \
-                -e "s|__CREDENTIAL_PROCESS_PATH__|$HOME/claude-code-with-bedrock/credential-process|g" \
-                "claude-settings/settings.json" > ~/.claude/settings.json
-            echo "✓ Claude Code settings configured"
-        fi
-    fi
-fi
-
-# Copy OTEL helper executable and shell wrapper if present
-if [ -f "$OTEL_BINARY" ]; then
-    echo
-    echo "Installing OTEL helper..."
-    # Install PyInstaller binary as otel-helper-bin (fallback for cache miss)
-    cp "$OTEL_BINARY" ~/claude-code-with-bedrock/otel-helper-bin
-    chmod +x ~/claude-code-with-bedrock/otel-helper-bin
-    xattr -d com.apple.quarantine ~/claude-code-with-bedrock/otel-helper-bin 2>/dev/null || true
-    # Install shell wrapper as otel-helper (fast cache check, avoids PyInstaller startup)
-    if [ -f "otel-helper.sh" ]; then
-        cp "otel-helper.sh" ~/claude-code-with-bedrock/otel-helper
-        chmod +x ~/claude-code-with-bedrock/otel-helper
-    else
-        # Fallback: if shell wrapper not in package, point directly to binary
-        cp "$OTEL_BINARY" ~/claude-code-with-bedrock/otel-helper
-        chmod +x ~/claude-code-with-bedrock/otel-helper
-    fi
-    echo "✓ OTEL helper installed"
-fi
-
-# Add debug info if OTEL helper was installed
-if [ -f ~/claude-code-with-bedrock/otel-helper ]; then
-    echo "The OTEL helper will extract user attributes from authentication tokens"
-    echo "and include them in metrics. To test the helper, run:"
-    echo "  ~/claude-code-with-bedrock/otel-helper-bin --test"
-fi
-
-# Update AWS config
-echo
-echo "Configuring AWS profiles..."
-mkdir -p ~/.aws
+                "aws_region": profile.aws_region,
+                "provider_type": profile.provider_type or detect_provider_type_secure(profile.provider_domain),
+                "credential_storage": profile.credential_storage,
+                "cross_region_profile": profile.cross_region_profile or "us",
+            }
+        }
 
-# Read all profiles from config.json
-PROFILES=$(python3 -c "import json; profiles = list(json.load(open('config.json')).keys()); print(' '.join(profiles))")
+        # Add the appropriate federation field based on type
+        if federation_type == "direct":
+            config[profile_name]["federated_role_arn"] = federation_identifier
+            config[profile_name]["federation_type"] = "direct"
+            config[profile_name]["max_session_duration"] = profile.max_session_duration
+        else:
+            config[profile_name]["identity_pool_id"] = federation_identifier
+            config[profile_name]["federation_type"] = "cognito"
 
-if [ -z "$PROFILES" ]; then
-    echo "❌ No profiles found in config.json"
-    exit 1
-fi
+        # Add cognito_user_pool_id if it's a Cognito provider
+        if profile.provider_type == "cognito" and profile.cognito_user_pool_id:
+            config[profile_name]["cognito_user_pool_id"] = profile.cognito_user_pool_id
 
-echo "Found profiles: $PROFILES"
-echo
+        # Add selected_model if available
+        if hasattr(profile, "selected_model") and profile.selected_model:
+            config[profile_name]["selected_model"] = profile.selected_model
 
-# Get region from package settings (for Bedrock calls, not infrastructure)
-if [ -f "claude-settings/settings.json" ]; then
-    DEFAULT_REGION=$(python3 -c "import json; print(json.load(open('claude-settings/settings.json'))[
-    'env']['AWS_REGION'])" 2>/dev/null || echo "{profile.aws_region}")
-else
-    DEFAULT_REGION="{profile.aws_region}"
-fi
+        # Add confidential client fields for Azure AD if present.
+        # client_secret is never written to config.json — it lives in the OS keyring.
+        # End users set it with: credential-process --set-client-secret --profile <profile>
+        if getattr(profile, "azure_auth_mode", None):
+            config[profile_name]["azure_auth_mode"] = profile.azure_auth_mode
+        if getattr(profile, "client_certificate_path", None):
+            config[profile_name]["client_certificate_path"] = profile.client_certificate_path
+            config[profile_name]["client_certificate_key_path"] = profile.client_certificate_key_path
+            # Warn if the paths are absolute — they are machine-specific and will not
+            # resolve on end-user machines with different install layouts.
+            cert_is_absolute = Path(profile.client_certificate_path).is_absolute()
+            key_is_absolute = Path(profile.client_certificate_key_path).is_absolute()
+            if (cert_is_absolute or key_is_absolute) and console:
+                console.print(
+                    "\n[yellow]Warning: certificate paths in config.json are absolute and will not "
+                    "resolve on machines where the files are stored elsewhere.[/yellow]"
+                )
+                console.print(
+                    "[yellow]Instruct end users to set the following environment variables:[/yellow]"
+                )
+                console.print("[dim]  AZURE_CLIENT_CERTIFICATE_PATH=<path/to/cert.pem>[/dim]")
+                console.print("[dim]  AZURE_CLIENT_CERTIFICATE_KEY_PATH=<path/to/key.pem>[/dim]\n")
 
-# Configure each profile
-for PROFILE_NAME in $PROFILES; do
-    echo "Configuring AWS profile: $PROFILE_NAME"
+        config_path = output_dir / "config.json"
+        config_path.write_text(dumps_json(config, indent=True), encoding="utf-8")
+        return config_path
 
-    # Remove old profile if exists
-    sed -i.bak "/\\[profile $PROFILE_NAME\\]/,/^$/d" ~/.aws/config 2>/dev/null || true
+    def _get_bedrock_region_for_profile(self, profile) -> str:
+        """Get the correct AWS region for Bedrock API calls based on user-selected source region."""
+        return get_source_region_for_profile(profile)
 
-    # Get profile-specific region from config.json
-    PROFILE_REGION=$(python3 -c "import json; print(json.load(open('config.json')).get('$PROFILE_NAME', \
-    {{}}).get('aws_region', '$DEFAULT_REGION'))")
+    def _create_installer(self, output_dir: Path, profile, built_executables, built_otel_helpers=None) -> Path:
+        """Create simple installer script."""
 
-    # Add new profile with --profile flag (cross-platform, no shell required)
-    cat >> ~/.aws/config << EOF
-[profile $PROFILE_NAME]
-credential_process = $HOME/claude-code-with-bedrock/credential-process --profile $PROFILE_NAME
-region = $PROFILE_REGION
-EOF
-    echo "  ✓ Created AWS profile '$PROFILE_NAME'"
-done
+        # Determine which binaries were built
+        platforms_built = [platform for platform, _ in built_executables]
+        [platform for platform, _ in built_otel_helpers] if built_otel_helpers else []
 
-echo
-echo "======================================"
-echo "✓ Installation complete!"
-echo "======================================"
-echo
-echo "Available profiles:"
-for PROFILE_NAME in $PROFILES; do
-    echo "  - $PROFILE_NAME"
-done
-echo
-echo "To use Claude Code authentication:"
-echo "  export AWS_PROFILE=<profile-name>"
-echo "  aws sts get-caller-identity"
-echo
-echo "Example:"
-FIRST_PROFILE=$(echo $PROFILES | awk '{{print $1}}')
-echo "  export AWS_PROFILE=$FIRST_PROFILE"
-echo "  aws sts get-caller-identity"
-echo
-echo "Note: Authentication will automatically open your browser when needed."
-echo
-"""
+        installer_content = INSTALLER_TEMPLATE.format(
+            provider_domain=profile.provider_domain,
+            aws_region=profile.aws_region,
+            generated=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        )
 
         installer_path = output_dir / "install.sh"
-        with open(installer_path, "w") as f:
-            f.write(installer_content)
+        installer_path.write_text(installer_content, encoding="utf-8", newline="\n")
         installer_path.chmod(0o755)
 
         # Create Windows installer only if Windows builds are enabled (CodeBuild)
@@ -2154,178 +2343,26 @@ pause
 """
 
         installer_path = output_dir / "install.bat"
-        with open(installer_path, "w", encoding="utf-8") as f:
-            f.write(installer_content)
+        installer_path.write_text(installer_content, encoding="utf-8")
 
         # Note: chmod not needed on Windows batch files
         return installer_path
 
     def _create_documentation(self, output_dir: Path, profile, timestamp: str):
         """Create user documentation."""
-        readme_content = f"""# Claude Code Authentication Setup
-
-## Quick Start
-
-### macOS/Linux
-
-1. Extract the package:
-   ```bash
-   unzip claude-code-package-*.zip
-   cd claude-code-package
-   ```
-
-2. Run the installer:
-   ```bash
-   ./install.sh
-   ```
-
-3. Use the AWS profile:
-   ```bash
-   export AWS_PROFILE=ClaudeCode
-   aws sts get-caller-identity
-   ```
-
-### Windows
-
-#### Step 1: Download the Package
-```powershell
-# Use the Invoke-WebRequest command provided by your IT administrator
-Invoke-WebRequest -Uri "URL_PROVIDED" -OutFile "claude-code-package.zip"
-```
-
-#### Step 2: Extract the Package
-
-**Option A: Using Windows Explorer**
-1. Right-click on `claude-code-package.zip`
-2. Select "Extract All..."
-3. Choose a destination folder
-4. Click "Extract"
-
-**Option B: Using PowerShell**
-```powershell
-# Extract to current directory
-Expand-Archive -Path "claude-code-package.zip" -DestinationPath "claude-code-package"
-
-# Navigate to the extracted folder
-cd claude-code-package
-```
-
-**Option C: Using Command Prompt**
-```cmd
-# If you have tar available (Windows 10 1803+)
-tar -xf claude-code-package.zip
-
-# Or use PowerShell from Command Prompt
-powershell -command "Expand-Archive -Path 'claude-code-package.zip' -DestinationPath 'claude-code-package'"
-
-cd claude-code-package
-```
-
-#### Step 3: Run the Installer
-```cmd
-install.bat
-```
-
-The installer will:
-- Check for AWS CLI installation
-- Copy authentication tools to `%USERPROFILE%\\claude-code-with-bedrock`
-- Configure the AWS profile "ClaudeCode"
-- Test the authentication
-
-#### Step 4: Use Claude Code
-```cmd
-# Set the AWS profile
-set AWS_PROFILE=ClaudeCode
-
-# Verify authentication works
-aws sts get-caller-identity
-
-# Your browser will open automatically for authentication if needed
-```
-
-For PowerShell users:
-```powershell
-$env:AWS_PROFILE = "ClaudeCode"
-aws sts get-caller-identity
-```
-
-## What This Does
-
-- Installs the Claude Code authentication tools
-- Configures your AWS CLI to use {profile.provider_domain} for authentication
-- Sets up automatic credential refresh via your browser
-
-## Requirements
-
-- Python 3.8 or later
-- AWS CLI v2
-- pip3
-
-## Troubleshooting
-
-### macOS Keychain Access Popup
-On first use, macOS will ask for permission to access the keychain. This is normal and required for \
-secure credential storage. Click "Always Allow" to avoid repeated prompts.
-
-### Authentication Issues
-If you encounter issues with authentication:
-- Ensure you're assigned to the Claude Code application in your identity provider
-- Check that port 8400 is available for the callback
-- Contact your IT administrator for help
-
-### Authentication Behavior
-
-The system handles authentication automatically:
-- Your browser will open when authentication is needed
-- Credentials are cached securely to avoid repeated logins
-- Bad credentials are automatically cleared and re-authenticated
-
-To manually clear cached credentials (if needed):
-```bash
-~/claude-code-with-bedrock/credential-process --clear-cache
-```
-
-This will force re-authentication on your next AWS command.
-
-### Browser doesn't open
-Check that you're not in an SSH session. The browser needs to open on your local machine.
-
-## Support
-
-Contact your IT administrator for help.
-
-Configuration Details:
-- Organization: {profile.provider_domain}
-- Region: {profile.aws_region}
-- Package Version: {timestamp}"""
-
         # Add analytics information if enabled
+        analytics_section = ""
         if profile.monitoring_enabled and getattr(profile, "analytics_enabled", True):
-            analytics_section = f"""
-
-## Analytics Dashboard
-
-Your organization has enabled advanced analytics for Claude Code usage. You can access detailed metrics \
-and reports through AWS Athena.
+            analytics_section = README_ANALYTICS_SECTION.format(aws_region=profile.aws_region)
 
-To view analytics:
-1. Open the AWS Console in region {profile.aws_region}
-2. Navigate to Athena
-3. Select the analytics workgroup and database
-4. Run pre-built queries or create custom reports
-
-Available metrics include:
-- Token usage by user
-- Cost allocation
-- Model usage patterns
-- Activity trends
-"""
-            readme_content += analytics_section
-
-        readme_content += "\n" ""
+        readme_content = README_TEMPLATE.format(
+            provider_domain=profile.provider_domain,
+            aws_region=profile.aws_region,
+            timestamp=timestamp,
+            analytics_section=analytics_section,
+        )
 
-        with open(output_dir / "README.md", "w") as f:
-            f.write(readme_content)
+        (output_dir / "README.md").write_text(readme_content, encoding="utf-8")
 
     def _create_claude_settings(
         self, output_dir: Path, profile, include_coauthored_by: bool = True, profile_name: str = "ClaudeCode"
@@ -2376,29 +2413,9 @@ Available metrics include:
             if profile.monitoring_enabled:
                 # Get monitoring stack outputs
                 monitoring_stack = profile.stack_names.get("monitoring", f"{profile.identity_pool_name}-otel-collector")
-                cmd = [
-                    "aws",
-                    "cloudformation",
-                    "describe-stacks",
-                    "--stack-name",
-                    monitoring_stack,
-                    "--region",
-                    profile.aws_region,
-                    "--query",
-                    "Stacks[0].Outputs",
-                    "--output",
-                    "json",
-                ]
-
-                result = subprocess.run(cmd, capture_output=True, text=True)
-                if result.returncode == 0:
-                    outputs = json.loads(result.stdout)
-                    endpoint = None
-
-                    for output in outputs:
-                        if output["OutputKey"] == "CollectorEndpoint":
-                            endpoint = output["OutputValue"]
-                            break
+                outputs = get_stack_outputs(monitoring_stack, profile.aws_region)
+                if outputs:
+                    endpoint = outputs.get("CollectorEndpoint")
 
                     if endpoint:
                         # Add monitoring configuration
@@ -2432,8 +2449,7 @@ Available metrics include:
 
             # Save settings.json
             settings_path = claude_dir / "settings.json"
-            with open(settings_path, "w") as f:
-                json.dump(settings, f, indent=2)
+            atomic_write_text(settings_path, dumps_json(settings, indent=True))
 
             console.print("[dim]Created Claude Code settings for Bedrock configuration[/dim]")
 
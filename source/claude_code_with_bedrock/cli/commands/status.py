@@ -3,21 +3,42 @@
 
 """Status command - Show deployment status."""
 
-import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
 from cleo.commands.command import Command
 from cleo.helpers import option
-from rich import box
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
 
-from claude_code_with_bedrock.cli.utils.aws import get_stack_outputs
 from claude_code_with_bedrock.cli.utils.cloudformation import CloudFormationManager
 from claude_code_with_bedrock.cli.utils.display import display_configuration_info, get_configuration_dict
-from claude_code_with_bedrock.config import Config
+from claude_code_with_bedrock.config import Config, dumps_json
+
+# Every stack status except DELETE_COMPLETE, so list_stacks skips stacks that no longer exist
+ACTIVE_STACK_STATUSES = [
+    "CREATE_IN_PROGRESS",
+    "CREATE_FAILED",
+    "CREATE_COMPLETE",
+    "ROLLBACK_IN_PROGRESS",
+    "ROLLBACK_FAILED",
+    "ROLLBACK_COMPLETE",
+    "DELETE_IN_PROGRESS",
+    "DELETE_FAILED",
+    "UPDATE_IN_PROGRESS",
+    "UPDATE_COMPLETE_CLEANUP_IN_PROGRESS",
+    "UPDATE_COMPLETE",
+    "UPDATE_FAILED",
+    "UPDATE_ROLLBACK_IN_PROGRESS",
+    "UPDATE_ROLLBACK_FAILED",
+    "UPDATE_ROLLBACK_COMPLETE_CLEANUP_IN_PROGRESS",
+    "UPDATE_ROLLBACK_COMPLETE",
+    "REVIEW_IN_PROGRESS",
+    "IMPORT_IN_PROGRESS",
+    "IMPORT_COMPLETE",
+    "IMPORT_ROLLBACK_IN_PROGRESS",
+    "IMPORT_ROLLBACK_FAILED",
+    "IMPORT_ROLLBACK_COMPLETE",
+]
 
 
 class StatusCommand(Command):
@@ -30,10 +51,23 @@ class StatusCommand(Command):
         option("detailed", description="Show detailed information", flag=True),
     ]
 
+    def __init__(self) -> None:
+        super().__init__()
+        # CloudFormation managers (one boto3 client each), memoized per region
+        self._cf_managers: dict[str, CloudFormationManager] = {}
+        # describe_stacks results keyed by (stack name, region); None means the stack was not found
+        self._stack_cache: dict[tuple[str, str], dict[str, Any] | None] = {}
+        # list_stacks summaries per region, or None when stacks could not be listed there
+        self._stack_summaries: dict[str, dict[str, dict[str, Any]] | None] = {}
+
+    def _cf_manager(self, region: str) -> CloudFormationManager:
+        """Get the CloudFormation manager for a region, creating it on first use."""
+        if region not in self._cf_managers:
+            self._cf_managers[region] = CloudFormationManager(region=region)
+        return self._cf_managers[region]
+
     def handle(self) -> int:
         """Execute the status command."""
-        console = Console()
-
         # Load configuration
         config = Config.load()
 
@@ -45,6 +79,9 @@ class StatusCommand(Command):
         profile = config.get_profile(profile_name)
 
         if not profile:
+            from rich.console import Console
+
+            console = Console()
             if profile_name:
                 console.print(f"[red]Profile '{profile_name}' not found. Run 'poetry run ccwb init' first.[/red]")
             else:
@@ -59,12 +96,21 @@ class StatusCommand(Command):
         detailed = self.option("detailed")
 
         if json_output:
-            return self._show_json_status(profile, console)
+            return self._show_json_status(profile)
         else:
-            return self._show_rich_status(profile, console, detailed)
+            return self._show_rich_status(profile, detailed)
 
-    def _show_rich_status(self, profile, console: Console, detailed: bool) -> int:
+    def _show_rich_status(self, profile, detailed: bool) -> int:
         """Show status in rich formatted output."""
+        # Rich is only imported here so that --json output never pays for loading it
+        from rich import box
+        from rich.console import Console
+        from rich.panel import Panel
+        from rich.table import Table
+        from rich.text import Text
+
+        console = Console()
+
         # Header
         console.print(
             Panel.fit(
@@ -77,12 +123,12 @@ class StatusCommand(Command):
         # Configuration section
         console.print("\n[bold]Configuration[/bold]")
 
-        # Get endpoints to extract identity pool ID
+        # Get endpoints to extract identity pool ID; reused for the Endpoints section below
         endpoints = self._get_endpoints(profile)
         identity_pool_id = endpoints.get("identity_pool_id")
 
         # Use shared display utility
-        display_configuration_info(profile, identity_pool_id, format_type="table")
+        display_configuration_info(profile, identity_pool_id, format_type="table", console=console)
 
         # Stack status section
         console.print("\n[bold]Stack Status[/bold]")
@@ -94,18 +140,16 @@ class StatusCommand(Command):
         stack_table.add_column("Last Updated")
 
         for stack_type, info in stacks.items():
-            status_color = "green" if info["status"] == "CREATE_COMPLETE" else "yellow"
+            # Styled Text cells skip markup parsing; stacks that were not found have no timestamp
+            status_style = "green" if info["status"] == "CREATE_COMPLETE" else "yellow"
             stack_table.add_row(
-                stack_type.title(),
-                f"[{status_color}]{info['status']}[/{status_color}]",
-                info.get("last_updated", "N/A"),
+                stack_type.title(), Text(info["status"], style=status_style), info["last_updated"] or "N/A"
             )
 
         console.print(stack_table)
 
         # Endpoints section
         console.print("\n[bold]Endpoints[/bold]")
-        endpoints = self._get_endpoints(profile)
 
         if endpoints.get("identity_pool_id"):
             console.print(f"• Identity Pool: [cyan]{endpoints['identity_pool_id']}[/cyan]")
@@ -154,7 +198,7 @@ class StatusCommand(Command):
 
         return 0
 
-    def _show_json_status(self, profile, console: Console) -> int:
+    def _show_json_status(self, profile) -> int:
         """Show status in JSON format."""
         # Get endpoints to extract identity pool ID
         endpoints = self._get_endpoints(profile)
@@ -167,60 +211,115 @@ class StatusCommand(Command):
             "endpoints": endpoints,
         }
 
-        console.print(json.dumps(status, indent=2))
+        # Plain print: Rich would highlight and wrap the JSON, breaking it for scripts
+        print(dumps_json(status, indent=True))
         return 0
 
+    def _stack_names(self, profile) -> dict[str, str]:
+        """Get the CloudFormation stack name for each stack type shown by status."""
+        stack_types = ["auth", "monitoring", "dashboard"] if profile.monitoring_enabled else ["auth"]
+        names = profile.resolved_stack_names
+        return {stack_type: names[stack_type] for stack_type in stack_types}
+
+    def _discover_stacks(self, region: str) -> dict[str, dict[str, Any]] | None:
+        """List the existing stacks in a region once, keyed by stack name.
+
+        Returns:
+            Stack summaries by name, or None if the stacks cannot be listed.
+        """
+        if region not in self._stack_summaries:
+            try:
+                paginator = self._cf_manager(region).cf_client.get_paginator("list_stacks")
+                summaries = {}
+                for page in paginator.paginate(StackStatusFilter=ACTIVE_STACK_STATUSES):
+                    for summary in page.get("StackSummaries", []):
+                        summaries[summary["StackName"]] = summary
+                self._stack_summaries[region] = summaries
+            except Exception:
+                self._stack_summaries[region] = None
+        return self._stack_summaries[region]
+
+    def _describe_stack(self, stack_name: str, region: str) -> dict[str, Any] | None:
+        """Describe a CloudFormation stack once per command run.
+
+        Returns:
+            The stack description, or None if the stack cannot be described.
+        """
+        self._describe_stacks([stack_name], region)
+        return self._stack_cache[(stack_name, region)]
+
+    def _describe_stacks(self, stack_names: list[str], region: str) -> None:
+        """Describe the stacks not yet in the stack cache, concurrently when there are several."""
+        pending = list(dict.fromkeys(name for name in stack_names if (name, region) not in self._stack_cache))
+        summaries = self._discover_stacks(region)
+        if summaries is not None:
+            # Stacks missing from list_stacks do not exist; there is nothing to describe
+            for stack_name in pending:
+                if stack_name not in summaries:
+                    self._stack_cache[(stack_name, region)] = None
+            pending = [stack_name for stack_name in pending if stack_name in summaries]
+        if not pending:
+            return
+        # Create the client before fanning out; boto3 sessions are not safe for concurrent client creation
+        cf_client = self._cf_manager(region).cf_client
+
+        def describe(stack_name: str) -> None:
+            try:
+                response = cf_client.describe_stacks(StackName=stack_name)
+                self._stack_cache[(stack_name, region)] = response["Stacks"][0] if response["Stacks"] else None
+            except Exception:
+                self._stack_cache[(stack_name, region)] = None
+
+        if len(pending) == 1:
+            describe(pending[0])
+            return
+        with ThreadPoolExecutor(max_workers=min(4, len(pending))) as executor:
+            list(executor.map(describe, pending))
+
     def _get_stack_status(self, profile) -> dict[str, Any]:
         """Get status of all stacks."""
-        stacks = {}
-
-        # Check auth stack
-        auth_stack = profile.stack_names.get("auth", f"{profile.identity_pool_name}-stack")
-        auth_status = self._check_stack(auth_stack, profile.aws_region)
-        stacks["auth"] = auth_status
-
-        if profile.monitoring_enabled:
-            # Check monitoring stack
-            monitoring_stack = profile.stack_names.get("monitoring", f"{profile.identity_pool_name}-monitoring")
-            stacks["monitoring"] = self._check_stack(monitoring_stack, profile.aws_region)
-
-            # Check dashboard stack
-            dashboard_stack = profile.stack_names.get("dashboard", f"{profile.identity_pool_name}-dashboard")
-            stacks["dashboard"] = self._check_stack(dashboard_stack, profile.aws_region)
-
-        return stacks
+        names = self._stack_names(profile)
+        if self._discover_stacks(profile.aws_region) is None:
+            self._describe_stacks(list(names.values()), profile.aws_region)
+        return {
+            stack_type: self._check_stack(stack_name, profile.aws_region) for stack_type, stack_name in names.items()
+        }
 
     def _check_stack(self, stack_name: str, region: str) -> dict[str, Any]:
         """Check individual stack status using boto3."""
-        cf_manager = CloudFormationManager(region=region)
+        summaries = self._discover_stacks(region)
+        if summaries is not None:
+            # A stack summary carries the same status and timestamps as a full description
+            stack = summaries.get(stack_name)
+        else:
+            stack = self._describe_stack(stack_name, region)
+        if not stack:
+            return {"status": "NOT_FOUND", "last_updated": None}
 
-        try:
-            # Get stack details
-            response = cf_manager.cf_client.describe_stacks(StackName=stack_name)
-            if response["Stacks"]:
-                stack = response["Stacks"][0]
-                last_updated = stack.get("LastUpdatedTime") or stack.get("CreationTime")
+        last_updated = stack.get("LastUpdatedTime") or stack.get("CreationTime")
 
-                # Format timestamp if present
-                if last_updated:
-                    if hasattr(last_updated, "isoformat"):
-                        last_updated = last_updated.isoformat()
-                    else:
-                        last_updated = str(last_updated)
+        # Format timestamp if present
+        if last_updated:
+            if hasattr(last_updated, "isoformat"):
+                last_updated = last_updated.isoformat()
+            else:
+                last_updated = str(last_updated)
 
-                return {"status": stack["StackStatus"], "last_updated": last_updated}
-        except Exception:
-            pass
+        return {"status": stack["StackStatus"], "last_updated": last_updated}
 
-        return {"status": "NOT_FOUND", "last_updated": None}
+    def _stack_outputs(self, stack_name: str, region: str) -> dict[str, str]:
+        """Get the outputs of a stack from its cached description."""
+        stack = self._describe_stack(stack_name, region) or {}
+        return {output["OutputKey"]: output["OutputValue"] for output in stack.get("Outputs", [])}
 
     def _get_endpoints(self, profile) -> dict[str, Any]:
         """Get all relevant endpoints."""
         endpoints = {}
+        names = self._stack_names(profile)
+        self._describe_stacks(list(names.values()), profile.aws_region)
 
         # Get auth stack outputs
-        auth_stack = profile.stack_names.get("auth", f"{profile.identity_pool_name}-stack")
-        auth_outputs = get_stack_outputs(auth_stack, profile.aws_region)
+        auth_outputs = self._stack_outputs(names["auth"], profile.aws_region)
 
         if auth_outputs:
             endpoints["identity_pool_id"] = auth_outputs.get("IdentityPoolId")
@@ -230,15 +329,13 @@ class StatusCommand(Command):
 
         if profile.monitoring_enabled:
             # Get monitoring endpoint
-            monitoring_stack = profile.stack_names.get("monitoring", f"{profile.identity_pool_name}-otel-collector")
-            monitoring_outputs = get_stack_outputs(monitoring_stack, profile.aws_region)
+            monitoring_outputs = self._stack_outputs(names["monitoring"], profile.aws_region)
 
             if monitoring_outputs:
                 endpoints["monitoring_endpoint"] = monitoring_outputs.get("CollectorEndpoint")
 
             # Get dashboard URL
-            dashboard_stack = profile.stack_names.get("dashboard", f"{profile.identity_pool_name}-dashboard")
-            dashboard_outputs = get_stack_outputs(dashboard_stack, profile.aws_region)
+            dashboard_outputs = self._stack_outputs(names["dashboard"], profile.aws_region)
 
             if dashboard_outputs:
                 endpoints["dashboard_url"] = dashboard_outputs.get("DashboardURL")
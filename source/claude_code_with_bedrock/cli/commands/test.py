@@ -3,13 +3,26 @@
 
 """Test command - Verify authentication and access."""
 
+import base64
+import configparser
 import json
+import os
+import platform
 import subprocess
+import tempfile
+import threading
 import time
+import urllib.error
+import urllib.request
 import uuid
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from datetime import datetime
 from pathlib import Path
 
 import boto3
+from botocore.config import Config as BotocoreConfig
+from botocore.exceptions import ClientError, ConnectTimeoutError, EndpointConnectionError, ReadTimeoutError
 from cleo.commands.command import Command
 from cleo.helpers import option
 from rich import box
@@ -18,7 +31,59 @@ from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
-from claude_code_with_bedrock.config import Config
+from claude_code_with_bedrock.cli.utils.aws import get_cloudformation_client
+from claude_code_with_bedrock.config import Config, atomic_write_text
+
+# Client settings per service. Bedrock control-plane calls are small, so an unreachable or stalled
+# endpoint fails within seconds; model invocation keeps the read timeout of the former AWS CLI call.
+CLIENT_CONFIGS = {
+    "bedrock": BotocoreConfig(connect_timeout=3, read_timeout=15, retries={"max_attempts": 2}),
+    "bedrock-runtime": BotocoreConfig(connect_timeout=3, read_timeout=60),
+}
+
+# Seconds allowed for the credential process, including any browser sign-in, before authentication fails
+AUTH_TIMEOUT = 120
+
+# Upper bound on regions tested concurrently by --full
+MAX_REGION_WORKERS = 8
+
+# Bedrock failure details that apply to every region, so the remaining regions are not tested
+ACCOUNT_WIDE_FAILURES = ("lacks", "Access denied", "Invalid credentials")
+
+
+def _access_denied_error(message: str, region: str, account_id: str, role_name: str) -> str:
+    """Describe an AccessDeniedException from list_foundation_models."""
+    if "is not authorized to perform" in message:
+        action = "bedrock:ListFoundationModels" if "ListFoundationModels" in message else "bedrock access"
+        return f"Role {role_name} lacks {action} permission"
+    elif "Bedrock is not available" in message:
+        return f"Bedrock not available in {region} for account {account_id}"
+    return "Access denied - check IAM permissions"
+
+
+def _invalid_credentials_error(message: str, region: str, account_id: str, role_name: str) -> str:
+    """Describe an UnrecognizedClientException from list_foundation_models."""
+    return "Invalid credentials or role"
+
+
+def _unclassified_error(message: str, region: str, account_id: str, role_name: str) -> str:
+    """Describe any other list_foundation_models error by the first line of its message."""
+    if "could not be found" in message:
+        return f"Bedrock service not found in {region}"
+    return (message.split("\n")[0] if message else "Unknown error")[:80]
+
+
+# Bedrock access check failures by ClientError code
+BEDROCK_ACCESS_ERRORS = {
+    "AccessDeniedException": _access_denied_error,
+    "UnrecognizedClientException": _invalid_credentials_error,
+}
+
+# Model invocation failures that are reported without the raw error message
+MODEL_INVOCATION_ERRORS = {
+    "ThrottlingException": "Rate limited",
+    "ModelNotReadyException": "Model not ready",
+}
 
 
 class TestCommand(Command):
@@ -39,6 +104,18 @@ class TestCommand(Command):
         ),
     ]
 
+    def __init__(self) -> None:
+        super().__init__()
+        # STS caller identity per AWS profile; it cannot change while the command runs
+        self._identity_cache: dict[str, dict] = {}
+        # boto3 sessions are not thread-safe, so clients are created once under a lock and shared across regions
+        self._clients: dict[tuple, object] = {}
+        self._client_lock = threading.Lock()
+        # Claude model IDs per (AWS profile, region)
+        self._claude_models: dict[tuple, list[str]] = {}
+        # AWS config file (AWS_CONFIG_FILE or ~/.aws/config), parsed on first use
+        self._aws_config: configparser.ConfigParser | None = None
+
     def handle(self) -> int:
         """Execute the test command."""
         console = Console()
@@ -119,10 +196,8 @@ class TestCommand(Command):
         console.print("[bold]Step 1: Checking package contents[/bold]")
 
         # Detect current platform
-        import platform as platform_module
-
-        system = platform_module.system().lower()
-        machine = platform_module.machine().lower()
+        system = platform.system().lower()
+        machine = platform.machine().lower()
 
         if system == "darwin":
             if machine == "arm64":
@@ -233,318 +308,389 @@ class TestCommand(Command):
             # Set up temporary AWS profile for testing
             test_profile = f"ccwb-test-{uuid.uuid4().hex[:8]}"
             credential_command = f"/bin/sh -c 'CCWB_PROFILE={test_profile_name} {credential_binary}'"
-            subprocess.run(
-                ["aws", "configure", "set", f"profile.{test_profile}.credential_process", credential_command],
-                capture_output=True,
-            )
-            subprocess.run(
-                ["aws", "configure", "set", f"profile.{test_profile}.region", profile.aws_region],
-                capture_output=True,
-            )
+            if not self._add_aws_profile(
+                test_profile, {"credential_process": credential_command, "region": profile.aws_region}
+            ):
+                console.print("[red]Failed to configure test profile[/red]")
+                return 1
 
-            return self._run_quota_tests(
-                profile,
-                credential_binary,
-                package_dir,
-                test_profile_name,
-                test_profile,
-                quota_api_override,
-            )
+            try:
+                return self._run_quota_tests(
+                    profile,
+                    credential_binary,
+                    package_dir,
+                    test_profile_name,
+                    test_profile,
+                    quota_api_override,
+                )
+            finally:
+                self._remove_aws_profile(test_profile)
 
         # Step 2: Test the binary directly
         console.print("[bold]Step 2: Testing credential process binary[/bold]")
 
-        # Test if binary is executable
-        test_result = subprocess.run([str(credential_binary), "--version"], capture_output=True, text=True)
-
-        if test_result.returncode == 0:
-            console.print("✓ Binary is executable")
-        else:
-            console.print("[red]✗ Binary failed to run[/red]")
-            console.print(f"[dim]{test_result.stderr}[/dim]")
-            return 1
+        # Test if binary is executable; it starts in the background while the test profile is configured
+        version_proc = subprocess.Popen(
+            [str(credential_binary), "--version"], stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+        )
 
         # Set up temporary AWS profile for testing
         test_profile = f"ccwb-test-{uuid.uuid4().hex[:8]}"
 
-        console.print("\n[bold]Step 3: Testing authentication[/bold]")
-        console.print(f"[dim]Using temporary profile: {test_profile}[/dim]")
-
         # Configure the test profile
         # Set environment variable to tell credential binary which profile to use from config.json
         # Use shell to set environment variable
         credential_command = f"/bin/sh -c 'CCWB_PROFILE={test_profile_name} {credential_binary}'"
-        aws_config_result = subprocess.run(
-            ["aws", "configure", "set", f"profile.{test_profile}.credential_process", credential_command],
-            capture_output=True,
+        profile_added = self._add_aws_profile(
+            test_profile,
+            {"credential_process": credential_command, "region": profile_config.get("aws_region", "us-east-1")},
         )
 
-        if aws_config_result.returncode != 0:
-            console.print("[red]Failed to configure test profile[/red]")
-            return 1
-
-        # Configure region for the test profile
-        subprocess.run(
-            [
-                "aws",
-                "configure",
-                "set",
-                f"profile.{test_profile}.region",
-                profile_config.get("aws_region", "us-east-1"),
-            ],
-            capture_output=True,
-        )
-
-        # Load configuration for test parameters
-        profile = config.get_profile(test_profile_name)
+        try:
+            _, version_stderr = version_proc.communicate()
+            if version_proc.returncode == 0:
+                console.print("✓ Binary is executable")
+            else:
+                console.print("[red]✗ Binary failed to run[/red]")
+                console.print(f"[dim]{version_stderr}[/dim]")
+                return 1
 
-        if not profile:
-            console.print(
-                f"[red]Profile '{test_profile_name}' not found in configuration. Run 'poetry run ccwb \
-                init' first.[/red]"
-            )
-            return 1
+            console.print("\n[bold]Step 3: Testing authentication[/bold]")
+            console.print(f"[dim]Using temporary profile: {test_profile}[/dim]")
 
-        # Use test_profile instead of hardcoded "ClaudeCode"
-        aws_profile = test_profile
-        test_all_regions = self.option("full")
-        with_api = True  # Always test with API calls by default
+            if not profile_added:
+                console.print("[red]Failed to configure test profile[/red]")
+                return 1
 
-        # Create test results table
-        table = Table(title="Test Results", box=box.ROUNDED, show_header=True, header_style="bold cyan")
-        table.add_column("Test", style="white", no_wrap=True, min_width=24)
-        table.add_column("Status", style="white", width=12)
-        table.add_column("Details", style="dim", min_width=50, overflow="fold")
+            # Load configuration for test parameters
+            profile = config.get_profile(test_profile_name)
 
-        test_results = []
+            if not profile:
+                console.print(
+                    f"[red]Profile '{test_profile_name}' not found in configuration. Run 'poetry run ccwb \
+                    init' first.[/red]"
+                )
+                return 1
 
-        with Progress(
-            SpinnerColumn(), TextColumn("[progress.description]{task.description}"), console=console
-        ) as progress:
-            # Test 1: AWS Profile exists
-            task = progress.add_task("Checking AWS profile...", total=None)
-            result = self._test_aws_profile(aws_profile)
-            test_results.append(("AWS Profile Configured", result["status"], result["details"]))
-            progress.update(task, completed=True)
+            # Use test_profile instead of hardcoded "ClaudeCode"
+            aws_profile = test_profile
+            # One session for every test: it runs the credential process once and reuses its connections.
+            # Naming the profile explicitly also keeps AWS_* credentials in the environment from being used.
+            session = boto3.Session(profile_name=aws_profile)
+            test_all_regions = self.option("full")
+            with_api = True  # Always test with API calls by default
+
+            # Create test results table
+            table = Table(title="Test Results", box=box.ROUNDED, show_header=True, header_style="bold cyan")
+            table.add_column("Test", style="white", no_wrap=True, min_width=24)
+            table.add_column("Status", style="white", width=12)
+            table.add_column("Details", style="dim", min_width=50, overflow="fold")
+
+            test_results = []
+
+            # One spinner line whose description follows the running test; results are shown in the table below
+            with Progress(
+                SpinnerColumn(), TextColumn("[progress.description]{task.description}"), console=console, transient=True
+            ) as progress:
+                # Test 1: AWS Profile exists
+                task = progress.add_task("Checking AWS profile...", total=None)
+                result = self._test_aws_profile(aws_profile)
+                test_results.append(("AWS Profile Configured", result["status"], result["details"]))
+
+                # Test 2: Credentials can be obtained
+                progress.update(task, description="Testing authentication...")
+                # The credential process's own output is captured by botocore, so announce a possible sign-in here
+                progress.console.print("[dim]A browser window may open for you to sign in[/dim]")
+                result = self._test_authentication(session)
+                test_results.append(("Authentication", result["status"], result["details"]))
+
+                if result["status"] == "✓":
+                    # Test 3: Check assumed role
+                    progress.update(task, description="Verifying IAM role...")
+                    result = self._test_iam_role(session, profile)
+                    test_results.append(("IAM Role", result["status"], result["details"]))
+
+                    # Validate that selected_source_region is configured
+                    if not profile.selected_source_region:
+                        test_results.append(
+                            ("Configuration", "✗", "selected_source_region not set - run 'ccwb init' to configure")
+                        )
+                        progress.stop()
+                        # Display results immediately and exit
+                        console.print("\n")
+                        table = Table(title="Test Results", box=box.ROUNDED, show_header=True, header_style="bold cyan")
+                        table.add_column("Test", style="white", no_wrap=True, min_width=24)
+                        table.add_column("Status", style="white", width=12)
+                        table.add_column("Details", style="dim", min_width=50, overflow="fold")
+                        for test_name, status, details in test_results:
+                            if status == "✓":
+                                status_display = "[green]✓ Pass[/green]"
+                            else:
+                                status_display = "[red]✗ Fail[/red]"
+                            table.add_row(test_name, status_display, details)
+                        console.print(table)
+                        console.print("\n[red]Configuration error: selected_source_region must be set[/red]")
+                        return 1
+
+                    # Test 4: Determine which regions to test
+                    if test_all_regions:
+                        # Test all allowed regions
+                        regions_to_test = profile.allowed_bedrock_regions
+                    else:
+                        # Test only the user's configured source region
+                        regions_to_test = [profile.selected_source_region]
 
-            # Test 2: Credentials can be obtained
-            task = progress.add_task("Testing authentication...", total=None)
-            result = self._test_authentication(aws_profile)
-            test_results.append(("Authentication", result["status"], result["details"]))
-            progress.update(task, completed=True)
+                    # Test Bedrock access in configured region(s) concurrently, reporting in region order
+                    if len(regions_to_test) == 1:
+                        progress.update(task, description=f"Testing Bedrock API in {regions_to_test[0]}...")
+                    else:
+                        progress.update(task, description=f"Testing Bedrock API in {len(regions_to_test)} regions...")
 
-            if result["status"] == "✓":
-                # Test 3: Check assumed role
-                task = progress.add_task("Verifying IAM role...", total=None)
-                result = self._test_iam_role(aws_profile, profile)
-                test_results.append(("IAM Role", result["status"], result["details"]))
-                progress.update(task, completed=True)
+                    test_results.extend(self._test_regions(session, regions_to_test, with_api, profile.selected_model))
 
-                # Validate that selected_source_region is configured
-                if not profile.selected_source_region:
-                    test_results.append(
-                        ("Configuration", "✗", "selected_source_region not set - run 'ccwb init' to configure")
-                    )
-                    progress.stop()
-                    # Display results immediately and exit
-                    console.print("\n")
-                    table = Table(title="Test Results", box=box.ROUNDED, show_header=True, header_style="bold cyan")
-                    table.add_column("Test", style="white", no_wrap=True, min_width=24)
-                    table.add_column("Status", style="white", width=12)
-                    table.add_column("Details", style="dim", min_width=50, overflow="fold")
-                    for test_name, status, details in test_results:
-                        if status == "✓":
-                            status_display = "[green]✓ Pass[/green]"
+                    # Test 5: Test inference profiles in configured source region
+                    if not test_all_regions:
+                        # Only test inference profiles when testing configured region (not during full test)
+                        progress.update(task, description="Testing inference profiles...")
+                        result = self._test_inference_profiles(
+                            session, profile.selected_source_region, profile.selected_model
+                        )
+                        test_results.append(("Inference Profiles", result["status"], result["details"]))
+
+                    # Test 6: Quota Monitoring API (if enabled)
+                    quota_enabled = getattr(profile, "quota_monitoring_enabled", False)
+                    quota_endpoint = quota_api_override or getattr(profile, "quota_api_endpoint", None)
+
+                    if quota_enabled and quota_endpoint:
+                        progress.update(task, description="Testing quota monitoring API...")
+                        # Use the first profile in the package's config.json (more reliable than ccwb profile name)
+                        package_profile = next(iter(pkg_config), None)
+                        if package_profile:
+                            result = self._test_quota_api(
+                                credential_binary, quota_endpoint, package_dir, package_profile
+                            )
+                            test_results.append(("Quota Monitoring", result["status"], result["details"]))
                         else:
-                            status_display = "[red]✗ Fail[/red]"
-                        table.add_row(test_name, status_display, details)
-                    console.print(table)
-                    console.print("\n[red]Configuration error: selected_source_region must be set[/red]")
-                    return 1
-
-                # Test 4: Determine which regions to test
-                if test_all_regions:
-                    # Test all allowed regions
-                    regions_to_test = profile.allowed_bedrock_regions
-                else:
-                    # Test only the user's configured source region
-                    regions_to_test = [profile.selected_source_region]
-
-                # Test Bedrock access in configured region(s)
-                for region in regions_to_test:
-                    task = progress.add_task(f"Testing Bedrock API in {region}...", total=None)
-                    result = self._test_bedrock_access(aws_profile, region, with_api, profile.selected_model)
-                    test_results.append((f"Bedrock - {region}", result["status"], result["details"]))
-                    progress.update(task, completed=True)
-
-                # Test 5: Test inference profiles in configured source region
-                if not test_all_regions:
-                    # Only test inference profiles when testing configured region (not during full test)
-                    task = progress.add_task("Testing inference profiles...", total=None)
-                    result = self._test_inference_profiles(
-                        aws_profile, profile.selected_source_region, profile.selected_model
-                    )
-                    test_results.append(("Inference Profiles", result["status"], result["details"]))
-                    progress.update(task, completed=True)
-
-                # Test 6: Quota Monitoring API (if enabled)
-                quota_enabled = getattr(profile, "quota_monitoring_enabled", False)
-                quota_endpoint = quota_api_override or getattr(profile, "quota_api_endpoint", None)
-
-                if quota_enabled and quota_endpoint:
-                    task = progress.add_task("Testing quota monitoring API...", total=None)
-                    # Get profile name from package's config.json (more reliable than ccwb profile name)
-                    package_profile = self._get_package_profile_name(package_dir)
-                    if package_profile:
-                        result = self._test_quota_api(credential_binary, quota_endpoint, package_dir, package_profile)
-                        test_results.append(("Quota Monitoring", result["status"], result["details"]))
+                            test_results.append(("Quota Monitoring", "!", "Could not determine profile from package"))
+                    elif quota_enabled and not quota_endpoint:
+                        test_results.append(("Quota Monitoring", "!", "Enabled but API endpoint not configured"))
                     else:
-                        test_results.append(("Quota Monitoring", "!", "Could not determine profile from package"))
-                    progress.update(task, completed=True)
-                elif quota_enabled and not quota_endpoint:
-                    test_results.append(("Quota Monitoring", "!", "Enabled but API endpoint not configured"))
+                        test_results.append(("Quota Monitoring", "-", "Skipped (not enabled)"))
+
+            # Display results
+            console.print("\n")
+            for test_name, status, details in test_results:
+                if status == "✓":
+                    status_display = "[green]✓ Pass[/green]"
+                elif status == "!":
+                    status_display = "[yellow]! Warning[/yellow]"
+                elif status == "-":
+                    status_display = "[dim]- Skip[/dim]"
                 else:
-                    test_results.append(("Quota Monitoring", "-", "Skipped (not enabled)"))
+                    status_display = "[red]✗ Fail[/red]"
+                table.add_row(test_name, status_display, details)
+
+            console.print(table)
+
+            # Summary
+            passed = sum(1 for _, status, _ in test_results if status == "✓")
+            warnings = sum(1 for _, status, _ in test_results if status == "!")
+            failed = sum(1 for _, status, _ in test_results if status == "✗")
+            skipped = sum(1 for _, status, _ in test_results if status == "-")
+
+            summary_parts = [f"{passed} passed", f"{warnings} warnings", f"{failed} failed"]
+            if skipped > 0:
+                summary_parts.append(f"{skipped} skipped")
+            console.print(f"\n[bold]Summary:[/bold] {', '.join(summary_parts)}")
+
+            if failed > 0:
+                console.print("\n[red]Some tests failed. Please check the details above.[/red]")
+                console.print("\n[bold]Troubleshooting tips:[/bold]")
+                console.print("• Ensure you have access to the Okta application")
+                console.print("• Check that the Cognito Identity Pool is deployed")
+                console.print("• Verify IAM roles have correct permissions")
+                console.print("• Make sure Bedrock is enabled in your AWS account")
+
+                # If Bedrock tests failed, show how to check Bedrock status
+                bedrock_failed = any("Bedrock" in name and status == "✗" for name, status, _ in test_results)
+                if bedrock_failed:
+                    console.print("\n[bold]To check Bedrock status in your account:[/bold]")
+                    console.print("1. Visit https://console.aws.amazon.com/bedrock/")
+                    console.print("2. Check if you have access to Claude models")
+                    console.print("3. You may need to request model access if not enabled")
+                    console.print("\n[bold]To test with your admin credentials:[/bold]")
+                    console.print(
+                        f"aws bedrock list-foundation-models --region "
+                        f"{profile.allowed_bedrock_regions[0]} --query "
+                        f"\"modelSummaries[?contains(modelId, 'claude')]\""
+                    )
 
-        # Display results
-        console.print("\n")
-        for test_name, status, details in test_results:
-            if status == "✓":
-                status_display = "[green]✓ Pass[/green]"
-            elif status == "!":
-                status_display = "[yellow]! Warning[/yellow]"
-            elif status == "-":
-                status_display = "[dim]- Skip[/dim]"
+                return 1
+            elif warnings > 0:
+                console.print("\n[yellow]Tests passed with warnings. Check details above.[/yellow]")
+                return 0
             else:
-                status_display = "[red]✗ Fail[/red]"
-            table.add_row(test_name, status_display, details)
+                console.print("\n[green]All tests passed! Your setup is working correctly.[/green]")
 
-        console.print(table)
-
-        # Summary
-        passed = sum(1 for _, status, _ in test_results if status == "✓")
-        warnings = sum(1 for _, status, _ in test_results if status == "!")
-        failed = sum(1 for _, status, _ in test_results if status == "✗")
-        skipped = sum(1 for _, status, _ in test_results if status == "-")
-
-        summary_parts = [f"{passed} passed", f"{warnings} warnings", f"{failed} failed"]
-        if skipped > 0:
-            summary_parts.append(f"{skipped} skipped")
-        console.print(f"\n[bold]Summary:[/bold] {', '.join(summary_parts)}")
+                if not test_all_regions:
+                    console.print(
+                        "\n[dim]Note: Tested your configured source region. "
+                        "Use --full to test all allowed regions.[/dim]"
+                    )
 
-        if failed > 0:
-            console.print("\n[red]Some tests failed. Please check the details above.[/red]")
-            console.print("\n[bold]Troubleshooting tips:[/bold]")
-            console.print("• Ensure you have access to the Okta application")
-            console.print("• Check that the Cognito Identity Pool is deployed")
-            console.print("• Verify IAM roles have correct permissions")
-            console.print("• Make sure Bedrock is enabled in your AWS account")
-
-            # If Bedrock tests failed, show how to check Bedrock status
-            bedrock_failed = any("Bedrock" in name and status == "✗" for name, status, _ in test_results)
-            if bedrock_failed:
-                console.print("\n[bold]To check Bedrock status in your account:[/bold]")
-                console.print("1. Visit https://console.aws.amazon.com/bedrock/")
-                console.print("2. Check if you have access to Claude models")
-                console.print("3. You may need to request model access if not enabled")
-                console.print("\n[bold]To test with your admin credentials:[/bold]")
-                console.print(
-                    f"aws bedrock list-foundation-models --region "
-                    f"{profile.allowed_bedrock_regions[0]} --query "
-                    f"\"modelSummaries[?contains(modelId, 'claude')]\""
-                )
+                console.print("\n[bold]Package test complete. Authentication and Bedrock access verified.[/bold]")
 
-            return 1
-        elif warnings > 0:
-            console.print("\n[yellow]Tests passed with warnings. Check details above.[/yellow]")
-            return 0
-        else:
-            console.print("\n[green]All tests passed! Your setup is working correctly.[/green]")
+                return 0
+        finally:
+            # Remove the temporary profile on every exit path so sections do not pile up in the AWS config
+            if profile_added:
+                self._remove_aws_profile(test_profile)
+
+    def _test_regions(
+        self, session: boto3.Session, regions: list[str], with_api: bool, selected_model: str = None
+    ) -> list[tuple]:
+        """Test Bedrock access in each region concurrently, returning result rows in region order.
+
+        A failure that is not specific to one region (missing permissions, bad credentials) would
+        repeat in every region, so regions that have not started yet are skipped instead.
+        """
+        results = {}
+        with ThreadPoolExecutor(max_workers=min(MAX_REGION_WORKERS, len(regions))) as executor:
+            futures = {
+                executor.submit(self._test_bedrock_access, session, region, with_api, selected_model): region
+                for region in regions
+            }
+            for future in as_completed(futures):
+                result = future.result()
+                results[futures[future]] = result
+                if result["status"] == "✗" and any(reason in result["details"] for reason in ACCOUNT_WIDE_FAILURES):
+                    executor.shutdown(cancel_futures=True)
+                    break
+            # Keep the results of regions that were already running when the pool was shut down
+            for future, region in futures.items():
+                if future.done() and not future.cancelled():
+                    results[region] = future.result()
+
+        rows = []
+        for region in regions:
+            if region in results:
+                rows.append((f"Bedrock - {region}", results[region]["status"], results[region]["details"]))
+            else:
+                rows.append((f"Bedrock - {region}", "-", "Skipped (access denied in another region)"))
+        return rows
 
-            if not test_all_regions:
-                console.print(
-                    "\n[dim]Note: Tested your configured source region. Use --full to test all allowed regions.[/dim]"
-                )
+    def _aws_config_path(self) -> Path:
+        """Get the AWS config file, honoring AWS_CONFIG_FILE like the AWS CLI and boto3 do."""
+        return Path(os.path.expanduser(os.environ.get("AWS_CONFIG_FILE", "~/.aws/config")))
 
-            console.print("\n[bold]Package test complete. Authentication and Bedrock access verified.[/bold]")
+    def _add_aws_profile(self, profile_name: str, settings: dict[str, str]) -> bool:
+        """Append a profile section to the AWS config file, leaving the rest of the file as written.
 
-            # Clean up test profile if we created one
-            if "test_profile" in locals():
-                subprocess.run(
-                    ["aws", "configure", "--profile", test_profile, "set", "credential_process", ""],
-                    capture_output=True,
-                )
+        Returns:
+            True if the profile was written
+        """
+        aws_config_file = self._aws_config_path()
+        section = "".join(f"{key} = {value}\n" for key, value in settings.items())
+        try:
+            aws_config_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(aws_config_file, "a") as f:
+                f.write(f"\n[profile {profile_name}]\n{section}")
+        except OSError:
+            return False
+        self._aws_config = None
+        return True
+
+    def _remove_aws_profile(self, profile_name: str) -> None:
+        """Remove a profile section from the AWS config file, keeping every other line (including comments)."""
+        aws_config_file = self._aws_config_path()
+        try:
+            lines = aws_config_file.read_text().splitlines(keepends=True)
+        except OSError:
+            return
+
+        kept = []
+        skip = False
+        for line in lines:
+            if line.lstrip().startswith("["):
+                skip = line.strip() == f"[profile {profile_name}]"
+                # Drop the blank line that separated the removed section from the one before it
+                if skip and kept and not kept[-1].strip():
+                    kept.pop()
+            if not skip:
+                kept.append(line)
 
-            return 0
+        try:
+            # This often runs right after Ctrl+C or a timeout, so never leave the user's config half-written.
+            # Resolving first keeps a symlinked config file a symlink.
+            atomic_write_text(aws_config_file.resolve(), "".join(kept))
+        except OSError:
+            return
+        self._aws_config = None
 
     def _test_aws_profile(self, profile_name: str) -> dict:
         """Test if AWS profile exists."""
         try:
-            aws_config_file = Path.home() / ".aws" / "config"
+            aws_config_file = self._aws_config_path()
             if not aws_config_file.exists():
                 return {"status": "✗", "details": "AWS config file not found"}
 
-            with open(aws_config_file) as f:
-                content = f.read()
-                if f"[profile {profile_name}]" in content:
-                    return {"status": "✓", "details": f"Profile '{profile_name}' found"}
-                else:
-                    return {"status": "✗", "details": f"Profile '{profile_name}' not found"}
+            if self._aws_config is None:
+                # Interpolation off: credential_process commands may contain '%'
+                self._aws_config = configparser.ConfigParser(interpolation=None, strict=False)
+                self._aws_config.read(aws_config_file)
+            if self._aws_config.has_section(f"profile {profile_name}"):
+                return {"status": "✓", "details": f"Profile '{profile_name}' found"}
+            else:
+                return {"status": "✗", "details": f"Profile '{profile_name}' not found"}
         except Exception as e:
             return {"status": "✗", "details": str(e)}
 
-    def _test_authentication(self, profile_name: str) -> dict:
+    def _get_identity(self, session: boto3.Session) -> dict:
+        """Get the caller identity of a session, calling STS only once per profile."""
+        if session.profile_name not in self._identity_cache:
+            self._identity_cache[session.profile_name] = self._client(session, "sts").get_caller_identity()
+        return self._identity_cache[session.profile_name]
+
+    def _client(self, session: boto3.Session, service: str, region: str | None = None):
+        """Return a cached client for the session, creating it under a lock so region threads can share it."""
+        key = (session.profile_name, service, region)
+        with self._client_lock:
+            if key not in self._clients:
+                self._clients[key] = session.client(service, region_name=region, config=CLIENT_CONFIGS.get(service))
+            return self._clients[key]
+
+    def _test_authentication(self, session: boto3.Session) -> dict:
         """Test if authentication works."""
         try:
-            # Try to get caller identity
-            # Clear AWS credentials from environment to ensure credential_process is used
-            import os
-
-            test_env = os.environ.copy()
-            test_env.pop("AWS_ACCESS_KEY_ID", None)
-            test_env.pop("AWS_SECRET_ACCESS_KEY", None)
-            test_env.pop("AWS_SESSION_TOKEN", None)
+            # Getting the caller identity runs the profile's credential process. Botocore gives it no timeout,
+            # so it runs on a daemon thread that a hung sign-in cannot keep alive past the command.
+            future = Future()
 
-            cmd = ["aws", "sts", "get-caller-identity", "--profile", profile_name]
-
-            # Show credential process output in real-time
-            import sys
-
-            result = subprocess.run(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=sys.stderr,  # Show stderr (browser messages, auth progress) in real-time
-                text=True,
-                timeout=120,
-                env=test_env,
-            )
-
-            if result.returncode == 0:
-                identity = json.loads(result.stdout)
-                return {"status": "✓", "details": f"Authenticated as {identity.get('UserId', 'unknown')[:20]}..."}
-            else:
-                return {"status": "✗", "details": f"Authentication failed (exit code {result.returncode})"}
-        except subprocess.TimeoutExpired:
+            def get_identity():
+                try:
+                    future.set_result(self._get_identity(session))
+                except BaseException as e:
+                    future.set_exception(e)
+
+            threading.Thread(target=get_identity, daemon=True).start()
+            identity = future.result(timeout=AUTH_TIMEOUT)
+            return {"status": "✓", "details": f"Authenticated as {identity.get('UserId', 'unknown')[:20]}..."}
+        except FutureTimeoutError:
             return {"status": "✗", "details": "Authentication timed out"}
+        except ClientError as e:
+            return {"status": "✗", "details": f"Authentication failed ({e.response['Error']['Code']})"}
         except Exception as e:
             return {"status": "✗", "details": str(e)}
 
-    def _test_iam_role(self, profile_name: str, config_profile) -> dict:
+    def _test_iam_role(self, session: boto3.Session, config_profile) -> dict:
         """Test IAM role and permissions."""
         try:
-            # Clear AWS credentials from environment
-            import os
-
-            test_env = os.environ.copy()
-            test_env.pop("AWS_ACCESS_KEY_ID", None)
-            test_env.pop("AWS_SECRET_ACCESS_KEY", None)
-            test_env.pop("AWS_SESSION_TOKEN", None)
-
-            cmd = ["aws", "sts", "get-caller-identity", "--profile", profile_name]
-            result = subprocess.run(cmd, capture_output=True, text=True, env=test_env)
+            try:
+                identity = self._get_identity(session)
+            except ClientError:
+                identity = None
 
-            if result.returncode == 0:
-                identity = json.loads(result.stdout)
+            if identity is not None:
                 arn = identity.get("Arn", "")
                 account_id = identity.get("Account", "")
 
@@ -583,138 +729,98 @@ class TestCommand(Command):
         except Exception as e:
             return {"status": "✗", "details": str(e)}
 
-    def _test_bedrock_access(self, profile_name: str, region: str, with_api: bool = False, selected_model: str = None) -> dict:
+    def _test_bedrock_access(
+        self, session: boto3.Session, region: str, with_api: bool = False, selected_model: str = None
+    ) -> dict:
         """Test Bedrock access in a specific region."""
         try:
-            # Clear AWS credentials from environment
-            import os
-
-            test_env = os.environ.copy()
-            test_env.pop("AWS_ACCESS_KEY_ID", None)
-            test_env.pop("AWS_SECRET_ACCESS_KEY", None)
-            test_env.pop("AWS_SESSION_TOKEN", None)
-
             # First get the account we're using
-            identity_cmd = ["aws", "sts", "get-caller-identity", "--profile", profile_name]
-            identity_result = subprocess.run(identity_cmd, capture_output=True, text=True, env=test_env)
             account_id = "unknown"
             role_name = "unknown"
-            if identity_result.returncode == 0:
-                identity = json.loads(identity_result.stdout)
+            try:
+                identity = self._get_identity(session)
                 account_id = identity.get("Account", "unknown")
                 arn = identity.get("Arn", "")
                 if ":assumed-role/" in arn:
                     role_name = arn.split("/")[-2]
+            except ClientError:
+                pass
 
             # First check if Bedrock is available in the region
-            describe_cmd = [
-                "aws",
-                "bedrock",
-                "list-foundation-models",
-                "--profile",
-                profile_name,
-                "--region",
-                region,
-                "--query",
-                "modelSummaries[?contains(modelId, 'claude')].modelId",
-                "--output",
-                "json",
-            ]
-            result = subprocess.run(describe_cmd, capture_output=True, text=True, timeout=60, env=test_env)
-
-            if result.returncode == 0:
-                models = json.loads(result.stdout)
-                if models:
-                    if with_api:
-                        # Test model invocation using the configured inference profile
-                        test_result = self._test_model_invocation(profile_name, region, selected_model)
-                        if test_result["success"]:
-                            return {"status": "✓", "details": f"Found {len(models)} models, API test passed"}
-                        else:
-                            # Check the type of error
-                            error = test_result["error"]
-                            if "ValidationException" in error:
-                                # Validation errors often mean model isn't available in this region
-                                return {
-                                    "status": "✓",
-                                    "details": f"Found {len(models)} Claude models (some models may \
-                                    not support invoke)",
-                                }
-                            elif "ThrottlingException" in error or "Rate limited" in error:
-                                # Rate limiting is not a failure
-                                return {
-                                    "status": "✓",
-                                    "details": f"Found {len(models)} Claude models (API test rate limited)",
-                                }
-                            elif "timeout" in error.lower():
-                                # Timeouts could be transient
-                                return {
-                                    "status": "!",
-                                    "details": f"Found {len(models)} Claude models (API test timed out)",
-                                }
-                            else:
-                                # Other errors are actual failures
-                                return {"status": "✗", "details": f"Found models but API test failed: {error[:80]}"}
+            try:
+                models = self._list_claude_models(session, region)
+            except ClientError as e:
+                error_code = e.response.get("Error", {}).get("Code", "")
+                describe_error = BEDROCK_ACCESS_ERRORS.get(error_code, _unclassified_error)
+                return {"status": "✗", "details": describe_error(str(e), region, account_id, role_name)}
+
+            if models:
+                if with_api:
+                    # Test model invocation using the configured inference profile
+                    test_result = self._test_model_invocation(session, region, selected_model)
+                    if test_result["success"]:
+                        return {"status": "✓", "details": f"Found {len(models)} models, API test passed"}
                     else:
-                        return {"status": "✓", "details": f"Found {len(models)} Claude models"}
+                        # Check the type of error
+                        error = test_result["error"]
+                        if "ValidationException" in error:
+                            # Validation errors often mean model isn't available in this region
+                            return {
+                                "status": "✓",
+                                "details": f"Found {len(models)} Claude models (some models may not support invoke)",
+                            }
+                        elif "ThrottlingException" in error or "Rate limited" in error:
+                            # Rate limiting is not a failure
+                            return {
+                                "status": "✓",
+                                "details": f"Found {len(models)} Claude models (API test rate limited)",
+                            }
+                        elif "timeout" in error.lower():
+                            # Timeouts could be transient
+                            return {
+                                "status": "!",
+                                "details": f"Found {len(models)} Claude models (API test timed out)",
+                            }
+                        else:
+                            # Other errors are actual failures
+                            return {"status": "✗", "details": f"Found models but API test failed: {error[:80]}"}
                 else:
-                    return {"status": "!", "details": "No Claude models found"}
+                    return {"status": "✓", "details": f"Found {len(models)} Claude models"}
             else:
-                error_msg = result.stderr or result.stdout
-
-                # Parse specific error types
-                if "AccessDeniedException" in error_msg:
-                    # Extract the specific error message
-                    if "is not authorized to perform" in error_msg:
-                        action = (
-                            "bedrock:ListFoundationModels" if "ListFoundationModels" in error_msg else "bedrock access"
-                        )
-                        return {"status": "✗", "details": f"Role {role_name} lacks {action} permission"}
-                    elif "Bedrock is not available" in error_msg:
-                        return {"status": "✗", "details": f"Bedrock not available in {region} for account {account_id}"}
-                    else:
-                        return {"status": "✗", "details": "Access denied - check IAM permissions"}
-                elif "UnrecognizedClientException" in error_msg:
-                    return {"status": "✗", "details": "Invalid credentials or role"}
-                elif "could not be found" in error_msg:
-                    return {"status": "✗", "details": f"Bedrock service not found in {region}"}
-                else:
-                    # Show first line of error for clarity
-                    first_line = error_msg.split("\n")[0] if error_msg else "Unknown error"
-                    return {"status": "✗", "details": first_line[:80]}
-        except subprocess.TimeoutExpired:
+                return {"status": "!", "details": "No Claude models found"}
+        except (ConnectTimeoutError, ReadTimeoutError):
             return {"status": "!", "details": "Request timed out (may be a network issue)"}
+        except EndpointConnectionError:
+            return {"status": "✗", "details": f"Bedrock endpoint unreachable in {region}"}
         except Exception as e:
             return {"status": "✗", "details": str(e)}
 
-    def _test_inference_profiles(self, profile_name: str, region: str, selected_model: str = None) -> dict:
-        """Test inference profiles access in the configured region."""
-        try:
-            # Clear AWS credentials from environment
-            import os
-
-            test_env = os.environ.copy()
-            test_env.pop("AWS_ACCESS_KEY_ID", None)
-            test_env.pop("AWS_SECRET_ACCESS_KEY", None)
-            test_env.pop("AWS_SESSION_TOKEN", None)
-
-            # List inference profiles
-            cmd = [
-                "aws",
-                "bedrock",
-                "list-inference-profiles",
-                "--profile",
-                profile_name,
-                "--region",
-                region,
-                "--output",
-                "json",
+    def _list_claude_models(self, session: boto3.Session, region: str) -> list[str]:
+        """List the Claude model IDs available in a region, fetching each region at most once per run."""
+        key = (session.profile_name, region)
+        if key not in self._claude_models:
+            response = self._client(session, "bedrock", region).list_foundation_models(byProvider="Anthropic")
+            self._claude_models[key] = [
+                model["modelId"] for model in response.get("modelSummaries", []) if "claude" in model["modelId"]
             ]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60, env=test_env)
+        return self._claude_models[key]
 
-            if result.returncode == 0:
-                profiles = json.loads(result.stdout)
-                profile_summaries = profiles.get("inferenceProfileSummaries", [])
+    def _test_inference_profiles(self, session: boto3.Session, region: str, selected_model: str = None) -> dict:
+        """Test inference profiles access in the configured region."""
+        try:
+            # List inference profiles (all pages, as the AWS CLI did)
+            try:
+                bedrock = self._client(session, "bedrock", region)
+                profile_summaries = [
+                    summary
+                    for page in bedrock.get_paginator("list_inference_profiles").paginate()
+                    for summary in page.get("inferenceProfileSummaries", [])
+                ]
+                error_msg = None
+            except ClientError as e:
+                error_msg = str(e)
+
+            if error_msg is None:
 
                 if profile_summaries:
                     # Check if the selected model matches any inference profile
@@ -737,8 +843,6 @@ class TestCommand(Command):
                         "details": "No inference profiles available (cross-region routing not configured)",
                     }
             else:
-                error_msg = result.stderr or result.stdout
-
                 # Parse specific error types
                 if "AccessDeniedException" in error_msg:
                     return {"status": "✗", "details": "Access denied - check bedrock:ListInferenceProfiles permission"}
@@ -748,7 +852,7 @@ class TestCommand(Command):
                     # Show first line of error for clarity
                     first_line = error_msg.split("\n")[0] if error_msg else "Unknown error"
                     return {"status": "✗", "details": first_line[:80]}
-        except subprocess.TimeoutExpired:
+        except (ConnectTimeoutError, ReadTimeoutError):
             return {"status": "!", "details": "Request timed out"}
         except Exception as e:
             return {"status": "✗", "details": str(e)}
@@ -765,8 +869,6 @@ class TestCommand(Command):
                 return {"status": "!", "details": "Could not get monitoring token"}
 
             # Test OTEL helper with the token
-            import os
-
             env = os.environ.copy()
             env["CLAUDE_CODE_MONITORING_TOKEN"] = token_result.stdout.strip()
 
@@ -800,28 +902,10 @@ class TestCommand(Command):
         except Exception as e:
             return {"status": "✗", "details": str(e)[:50]}
 
-    def _get_package_profile_name(self, package_dir: Path) -> str | None:
-        """Get the profile name from the package's config.json."""
-        config_file = package_dir / "config.json"
-        if not config_file.exists():
-            return None
-        try:
-            with open(config_file) as f:
-                config = json.load(f)
-            # config.json has profile names as top-level keys
-            # Return the first (usually only) profile
-            profiles = list(config.keys())
-            return profiles[0] if profiles else None
-        except Exception:
-            return None
-
     def _test_quota_api(
         self, credential_binary: Path, quota_api_endpoint: str, package_dir: Path, profile_name: str
     ) -> dict:
         """Test quota monitoring API access."""
-        import urllib.error
-        import urllib.request
-
         try:
             # Get JWT token using the monitoring token flag
             # Run from package_dir so binary can find config.json
@@ -875,95 +959,49 @@ class TestCommand(Command):
         except Exception as e:
             return {"status": "✗", "details": str(e)[:50]}
 
-    def _test_model_invocation(self, profile_name: str, region: str, selected_model: str = None) -> dict:
+    def _test_model_invocation(self, session: boto3.Session, region: str, selected_model: str = None) -> dict:
         """Test actual model invocation using the configured inference profile."""
-        try:
-            # Clear AWS credentials from environment
-            import os
-
-            test_env = os.environ.copy()
-            test_env.pop("AWS_ACCESS_KEY_ID", None)
-            test_env.pop("AWS_SECRET_ACCESS_KEY", None)
-            test_env.pop("AWS_SESSION_TOKEN", None)
+        if not selected_model:
+            return {"success": False, "error": "No model configured - run 'ccwb init' to select a model"}
 
-            if not selected_model:
-                return {"success": False, "error": "No model configured - run 'ccwb init' to select a model"}
-
-            model_id = selected_model
-
-            # Create a minimal test prompt using Messages API
-            body_dict = {
-                "messages": [{"role": "user", "content": "Say 'test successful' in exactly 2 words"}],
-                "max_tokens": 10,
-                "temperature": 0,
-                "anthropic_version": "bedrock-2023-05-31",
-            }
+        model_id = selected_model
 
-            # Write body to a temporary file
-            import tempfile
+        # Create a minimal test prompt using Messages API
+        body_dict = {
+            "messages": [{"role": "user", "content": "Say 'test successful' in exactly 2 words"}],
+            "max_tokens": 10,
+            "temperature": 0,
+            "anthropic_version": "bedrock-2023-05-31",
+        }
 
-            with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-                json.dump(body_dict, f)
-                body_file = f.name
-
-            # Test invocation
-            cmd = [
-                "aws",
-                "bedrock-runtime",
-                "invoke-model",
-                "--profile",
-                profile_name,
-                "--region",
-                region,
-                "--model-id",
-                model_id,
-                "--body",
-                f"fileb://{body_file}",
-                "--content-type",
-                "application/json",
-                "/tmp/bedrock-test-output.json",
-            ]
-
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60, env=test_env)
-
-            if result.returncode == 0:
-                # Check if we got a response
-                try:
-                    with open("/tmp/bedrock-test-output.json") as f:
-                        response = json.load(f)
-                        if "content" in response and len(response["content"]) > 0:
-                            text = response["content"][0].get("text", "").strip()
-                            return {"success": True, "response": text}
-                        else:
-                            return {"success": False, "error": "No content in response"}
-                except Exception as e:
-                    return {"success": False, "error": f"Failed to parse response: {str(e)}"}
+        try:
+            runtime = self._client(session, "bedrock-runtime", region)
+            result = runtime.invoke_model(modelId=model_id, body=json.dumps(body_dict), contentType="application/json")
+        except ClientError as e:
+            error_code = e.response.get("Error", {}).get("Code", "")
+            error_msg = str(e)
+            if error_code in MODEL_INVOCATION_ERRORS:
+                return {"success": False, "error": MODEL_INVOCATION_ERRORS[error_code]}
+            elif error_code == "ValidationException":
+                # Return more of the error for debugging
+                return {"success": False, "error": f"Model {model_id} validation error: {error_msg[:150]}"}
             else:
-                error_msg = result.stderr or result.stdout
-                if "ThrottlingException" in error_msg:
-                    return {"success": False, "error": "Rate limited"}
-                elif "ModelNotReadyException" in error_msg:
-                    return {"success": False, "error": "Model not ready"}
-                else:
-                    # Return more of the error for debugging
-                    if "ValidationException" in error_msg and model_id:
-                        return {"success": False, "error": f"Model {model_id} validation error: {error_msg[:150]}"}
-                    else:
-                        return {"success": False, "error": error_msg[:200]}
-        except subprocess.TimeoutExpired:
+                return {"success": False, "error": error_msg[:200]}
+        except (ConnectTimeoutError, ReadTimeoutError):
             return {"success": False, "error": "Request timed out"}
         except Exception as e:
             return {"success": False, "error": str(e)}
-        finally:
-            # Clean up test files
-            try:
-                import os
 
-                os.remove("/tmp/bedrock-test-output.json")
-                if "body_file" in locals():
-                    os.remove(body_file)
-            except Exception:
-                pass
+        # Check if we got a response
+        try:
+            response = json.loads(result["body"].read())
+        except Exception as e:
+            return {"success": False, "error": f"Failed to parse response: {str(e)}"}
+        if "content" in response and len(response["content"]) > 0:
+            text = response["content"][0].get("text", "").strip()
+            return {"success": True, "response": text}
+        else:
+            return {"success": False, "error": "No content in response"}
 
     def _get_expected_account(self, config_profile) -> str:
         """Get the expected AWS account ID from the deployed stack."""
@@ -972,29 +1010,12 @@ class TestCommand(Command):
             stack_name = config_profile.stack_names.get("auth", f"{config_profile.identity_pool_name}-stack")
 
             # Use the current AWS credentials (not the profile being tested)
-            cmd = [
-                "aws",
-                "cloudformation",
-                "describe-stacks",
-                "--stack-name",
-                stack_name,
-                "--region",
-                config_profile.aws_region,
-                "--query",
-                "Stacks[0].StackId",
-                "--output",
-                "text",
-            ]
-
-            result = subprocess.run(cmd, capture_output=True, text=True)
-
-            if result.returncode == 0 and result.stdout:
-                # Extract account ID from stack ARN
-                # arn:aws:cloudformation:region:ACCOUNT:stack/name/id
-                stack_arn = result.stdout.strip()
-                parts = stack_arn.split(":")
-                if len(parts) >= 5:
-                    return parts[4]
+            stack = get_cloudformation_client(config_profile.aws_region).describe_stacks(StackName=stack_name)
+            # Extract account ID from stack ARN
+            # arn:aws:cloudformation:region:ACCOUNT:stack/name/id
+            parts = stack["Stacks"][0]["StackId"].split(":")
+            if len(parts) >= 5:
+                return parts[4]
 
             return None
         except Exception:
@@ -1099,8 +1120,6 @@ class TestCommand(Command):
 
     def _get_user_usage(self, profile, email: str) -> dict:
         """Fetch user usage data from UserQuotaMetrics table."""
-        from datetime import datetime
-
         table_name = getattr(profile, "user_quota_metrics_table", None)
         if not table_name:
             return {}
@@ -1128,8 +1147,6 @@ class TestCommand(Command):
 
     def _get_user_email_from_jwt(self, credential_binary: Path, package_dir: Path, profile_name: str) -> str | None:
         """Extract user email from JWT token."""
-        import base64
-
         try:
             token_result = subprocess.run(
                 [str(credential_binary), "--profile", profile_name, "--get-monitoring-token"],
@@ -1188,9 +1205,6 @@ class TestCommand(Command):
 
     def _make_quota_test_bedrock_call(self, aws_profile: str, region: str, selected_model: str = None) -> dict:
         """Make a small Bedrock call for testing usage capture."""
-        import os
-        import tempfile
-
         try:
             test_env = os.environ.copy()
             test_env.pop("AWS_ACCESS_KEY_ID", None)
@@ -3,14 +3,34 @@
 
 """AWS utilities for CLI commands."""
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache, lru_cache
 from typing import Any
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError, NoCredentialsError
 
+# Shared by every CloudFormation client: adaptive retries back off when describe_stacks
+# is throttled instead of failing, and keep-alive lets repeated calls reuse connections
+CLOUDFORMATION_CLIENT_CONFIG = Config(
+    retries={"mode": "adaptive", "max_attempts": 10},
+    tcp_keepalive=True,
+    max_pool_connections=8,
+)
 
+# boto3's default session is not safe for concurrent client creation
+CLIENT_CREATION_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=1)
 def get_current_region() -> str | None:
-    """Get the current AWS region from configuration."""
+    """Get the current AWS region from configuration.
+
+    The result is cached for the life of the process, since resolving it re-reads the
+    environment and ~/.aws/config. Call invalidate_region_cache() after changing either.
+    """
     try:
         session = boto3.Session()
         return session.region_name or "us-east-1"
@@ -18,19 +38,31 @@ def get_current_region() -> str | None:
         return "us-east-1"
 
 
+def invalidate_region_cache() -> None:
+    """Forget the cached region so the next get_current_region() call resolves it again."""
+    get_current_region.cache_clear()
+
+
+@cache
+def get_cloudformation_client(region: str | None = None):
+    """Get the CloudFormation client for a region, shared for the life of the process.
+
+    Reusing one client per region keeps its connection pool, so later calls skip the
+    TLS handshake. Pass None for the default region.
+    """
+    with CLIENT_CREATION_LOCK:
+        return boto3.client("cloudformation", region_name=region, config=CLOUDFORMATION_CLIENT_CONFIG)
+
+
 def check_bedrock_access(region: str) -> bool:
     """Check if Bedrock is accessible in the given region."""
     try:
         client = boto3.client("bedrock", region_name=region)
-        # Try to list foundation models
-        response = client.list_foundation_models()
+        # List only Anthropic models; filtering server-side keeps the probe response small
+        response = client.list_foundation_models(byProvider="Anthropic")
 
         # Check if Claude models are available
-        claude_models = [
-            model for model in response.get("modelSummaries", []) if "claude" in model.get("modelId", "").lower()
-        ]
-
-        return len(claude_models) > 0
+        return any("claude" in model.get("modelId", "").lower() for model in response.get("modelSummaries", []))
     except ClientError as e:
         if e.response["Error"]["Code"] == "AccessDeniedException":
             return False
@@ -45,7 +77,7 @@ def get_bedrock_models(region: str) -> list[dict[str, Any]]:
     """Get available Bedrock models in a region."""
     try:
         client = boto3.client("bedrock", region_name=region)
-        response = client.list_foundation_models()
+        response = client.list_foundation_models(byProvider="Anthropic")
 
         # Filter for Claude models
         claude_models = [
@@ -66,7 +98,7 @@ def get_bedrock_models(region: str) -> list[dict[str, Any]]:
 def check_stack_exists(stack_name: str, region: str) -> bool:
     """Check if a CloudFormation stack exists."""
     try:
-        client = boto3.client("cloudformation", region_name=region)
+        client = get_cloudformation_client(region)
         response = client.describe_stacks(StackName=stack_name)
 
         # Check if stack is in a valid state
@@ -86,19 +118,19 @@ def check_stack_exists(stack_name: str, region: str) -> bool:
         return False
 
 
-def get_stack_outputs(stack_name: str, region: str) -> dict[str, str]:
-    """Get outputs from a CloudFormation stack."""
-    try:
-        client = boto3.client("cloudformation", region_name=region)
-        response = client.describe_stacks(StackName=stack_name)
+def fetch_stack_outputs(stack_name: str, region: str) -> dict[str, str]:
+    """Get outputs from a CloudFormation stack, letting errors propagate to the caller."""
+    client = get_cloudformation_client(region)
+    stack = client.describe_stacks(StackName=stack_name)["Stacks"][0]
 
-        stack = response["Stacks"][0]
-        outputs = {}
+    # Keep only the output key/value pairs; the rest of the stack description is dropped
+    return {output["OutputKey"]: output["OutputValue"] for output in stack.get("Outputs") or []}
 
-        for output in stack.get("Outputs", []):
-            outputs[output["OutputKey"]] = output["OutputValue"]
 
-        return outputs
+def get_stack_outputs(stack_name: str, region: str) -> dict[str, str]:
+    """Get outputs from a CloudFormation stack."""
+    try:
+        return fetch_stack_outputs(stack_name, region)
     except Exception as e:
         print(f"Error getting stack outputs: {e}")
         return {}
@@ -120,7 +152,7 @@ def validate_iam_permissions() -> dict[str, bool]:
 
     # Check CloudFormation permissions
     try:
-        client = boto3.client("cloudformation")
+        client = get_cloudformation_client()
         client.list_stacks(StackStatusFilter=["CREATE_COMPLETE"])
         permissions["cloudformation"] = True
     except Exception:
@@ -145,29 +177,52 @@ def validate_iam_permissions() -> dict[str, bool]:
     return permissions
 
 
+def _vpc_info(vpc: dict[str, Any]) -> dict[str, Any]:
+    """Convert a describe_vpcs entry into the VPC summary used by the CLI."""
+    vpc_info = {
+        "id": vpc["VpcId"],
+        "cidr": vpc["CidrBlock"],
+        "is_default": vpc.get("IsDefault", False),
+        "name": "",
+        "state": vpc["State"],
+    }
+
+    # Get VPC name from tags
+    for tag in vpc.get("Tags", []):
+        if tag["Key"] == "Name":
+            vpc_info["name"] = tag["Value"]
+            break
+
+    return vpc_info
+
+
+def _subnet_info(subnet: dict[str, Any]) -> dict[str, Any]:
+    """Convert a describe_subnets entry into the subnet summary used by the CLI."""
+    subnet_info = {
+        "id": subnet["SubnetId"],
+        "cidr": subnet["CidrBlock"],
+        "availability_zone": subnet["AvailabilityZone"],
+        "available_ips": subnet["AvailableIpAddressCount"],
+        "name": "",
+        "is_public": subnet.get("MapPublicIpOnLaunch", False),
+    }
+
+    # Get subnet name from tags
+    for tag in subnet.get("Tags", []):
+        if tag["Key"] == "Name":
+            subnet_info["name"] = tag["Value"]
+            break
+
+    return subnet_info
+
+
 def get_vpcs(region: str) -> list[dict[str, Any]]:
     """Get list of VPCs in a region."""
     try:
         client = boto3.client("ec2", region_name=region)
         response = client.describe_vpcs()
 
-        vpcs = []
-        for vpc in response.get("Vpcs", []):
-            vpc_info = {
-                "id": vpc["VpcId"],
-                "cidr": vpc["CidrBlock"],
-                "is_default": vpc.get("IsDefault", False),
-                "name": "",
-                "state": vpc["State"],
-            }
-
-            # Get VPC name from tags
-            for tag in vpc.get("Tags", []):
-                if tag["Key"] == "Name":
-                    vpc_info["name"] = tag["Value"]
-                    break
-
-            vpcs.append(vpc_info)
+        vpcs = [_vpc_info(vpc) for vpc in response.get("Vpcs", [])]
 
         # Sort by name, with default VPC first
         vpcs.sort(key=lambda x: (not x["is_default"], x["name"]))
@@ -183,24 +238,7 @@ def get_subnets(region: str, vpc_id: str) -> list[dict[str, Any]]:
         client = boto3.client("ec2", region_name=region)
         response = client.describe_subnets(Filters=[{"Name": "vpc-id", "Values": [vpc_id]}])
 
-        subnets = []
-        for subnet in response.get("Subnets", []):
-            subnet_info = {
-                "id": subnet["SubnetId"],
-                "cidr": subnet["CidrBlock"],
-                "availability_zone": subnet["AvailabilityZone"],
-                "available_ips": subnet["AvailableIpAddressCount"],
-                "name": "",
-                "is_public": subnet.get("MapPublicIpOnLaunch", False),
-            }
-
-            # Get subnet name from tags
-            for tag in subnet.get("Tags", []):
-                if tag["Key"] == "Name":
-                    subnet_info["name"] = tag["Value"]
-                    break
-
-            subnets.append(subnet_info)
+        subnets = [_subnet_info(subnet) for subnet in response.get("Subnets", [])]
 
         # Sort by availability zone
         subnets.sort(key=lambda x: x["availability_zone"])
@@ -210,6 +248,38 @@ def get_subnets(region: str, vpc_id: str) -> list[dict[str, Any]]:
         return []
 
 
+def get_all_vpcs_and_subnets(region: str) -> dict[str, tuple[dict[str, Any], list[dict[str, Any]]]]:
+    """Get all VPCs in a region together with their subnets.
+
+    VPCs and subnets are described concurrently, so picking a VPC needs no
+    further API call to list its subnets.
+
+    Returns:
+        Mapping of VPC ID to (VPC info, subnets), ordered like get_vpcs() with
+        subnets ordered like get_subnets(). Empty if the VPCs cannot be listed.
+    """
+    try:
+        client = boto3.client("ec2", region_name=region)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            vpcs_future = executor.submit(client.describe_vpcs)
+            subnets_future = executor.submit(client.describe_subnets)
+            vpcs = [_vpc_info(vpc) for vpc in vpcs_future.result().get("Vpcs", [])]
+            subnet_entries = subnets_future.result().get("Subnets", [])
+    except Exception:
+        return {}
+
+    subnets_by_vpc: dict[str, list[dict[str, Any]]] = {}
+    for subnet in subnet_entries:
+        subnets_by_vpc.setdefault(subnet["VpcId"], []).append(_subnet_info(subnet))
+
+    # Sort by name, with default VPC first; subnets by availability zone
+    vpcs.sort(key=lambda x: (not x["is_default"], x["name"]))
+    return {
+        vpc["id"]: (vpc, sorted(subnets_by_vpc.get(vpc["id"], []), key=lambda x: x["availability_zone"]))
+        for vpc in vpcs
+    }
+
+
 def detect_cognito_stack(region: str) -> dict[str, Any] | None:
     """
     Detect if cognito-user-pool-setup stack is deployed.
@@ -219,7 +289,7 @@ def detect_cognito_stack(region: str) -> dict[str, Any] | None:
     and validates they have distribution support (DistributionWebClientId output).
     """
     try:
-        client = boto3.client("cloudformation", region_name=region)
+        client = get_cloudformation_client(region)
 
         # Search for stacks with known naming patterns
         response = client.list_stacks(StackStatusFilter=["CREATE_COMPLETE", "UPDATE_COMPLETE"])
@@ -298,7 +368,7 @@ def detect_all_cognito_stacks(region: str) -> list[dict[str, Any]]:
     Useful when multiple Cognito stacks exist and user needs to choose.
     """
     try:
-        client = boto3.client("cloudformation", region_name=region)
+        client = get_cloudformation_client(region)
 
         # Search for stacks with known naming patterns
         response = client.list_stacks(StackStatusFilter=["CREATE_COMPLETE", "UPDATE_COMPLETE"])
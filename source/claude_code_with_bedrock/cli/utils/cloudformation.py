@@ -12,6 +12,7 @@ import boto3
 import cfn_flip
 from botocore.exceptions import ClientError, WaiterError
 
+from .aws import CLOUDFORMATION_CLIENT_CONFIG
 from .cf_exceptions import (
     CloudFormationError,
     PermissionError,
@@ -64,7 +65,7 @@ class CloudFormationManager:
     def cf_client(self):
         """Lazy-loaded CloudFormation client with connection pooling."""
         if not self._cf_client:
-            self._cf_client = self.session.client("cloudformation")
+            self._cf_client = self.session.client("cloudformation", config=CLOUDFORMATION_CLIENT_CONFIG)
         return self._cf_client
 
     @property
@@ -3,16 +3,18 @@
 
 """Shared display utilities for consistent output formatting across commands."""
 
-from typing import Any
-
-from rich import box
-from rich.console import Console
-from rich.table import Table
+from typing import TYPE_CHECKING, Any
 
 from claude_code_with_bedrock.models import get_all_model_display_names
 
+if TYPE_CHECKING:
+    # Rich is imported where it is used, so get_configuration_dict callers (JSON output) never load it
+    from rich.console import Console
+
 
-def display_configuration_info(profile, identity_pool_id: str | None = None, format_type: str = "table") -> None:
+def display_configuration_info(
+    profile, identity_pool_id: str | None = None, format_type: str = "table", console: "Console | None" = None
+) -> None:
     """
     Display configuration information in a consistent format.
 
@@ -20,8 +22,12 @@ def display_configuration_info(profile, identity_pool_id: str | None = None, for
         profile: The configuration profile object
         identity_pool_id: Optional actual identity pool ID (from stack outputs)
         format_type: Display format - "table" for rich table, "simple" for simple text
+        console: Optional console to print to; a new one is created if omitted
     """
-    console = Console()
+    if console is None:
+        from rich.console import Console
+
+        console = Console()
 
     if format_type == "table":
         _display_table_format(console, profile, identity_pool_id)
@@ -29,8 +35,11 @@ def display_configuration_info(profile, identity_pool_id: str | None = None, for
         _display_simple_format(console, profile, identity_pool_id)
 
 
-def _display_table_format(console: Console, profile, identity_pool_id: str | None) -> None:
+def _display_table_format(console: "Console", profile, identity_pool_id: str | None) -> None:
     """Display configuration in rich table format."""
+    from rich import box
+    from rich.table import Table
+
     config_table = Table(box=box.SIMPLE)
     config_table.add_column("Setting", style="dim")
     config_table.add_column("Value")
@@ -49,7 +58,7 @@ def _display_table_format(console: Console, profile, identity_pool_id: str | Non
         config_table.add_row("Federation Type", "Direct STS (12-hour sessions)")
         federated_role_arn = getattr(profile, "federated_role_arn", None)
         if federated_role_arn:
-            config_table.add_row("Federated Role", federated_role_arn.split("/")[-1])  # Show just role name
+            config_table.add_row("Federated Role", federated_role_arn.rpartition("/")[2])  # Show just role name
     else:
         config_table.add_row("Federation Type", "Cognito Identity Pool (8-hour sessions)")
 
@@ -93,7 +102,7 @@ def _display_table_format(console: Console, profile, identity_pool_id: str | Non
     console.print(config_table)
 
 
-def _display_simple_format(console: Console, profile, identity_pool_id: str | None) -> None:
+def _display_simple_format(console: "Console", profile, identity_pool_id: str | None) -> None:
     """Display configuration in simple text format."""
     console.print("\n[bold]Package Configuration:[/bold]")
 
@@ -111,7 +120,7 @@ def _display_simple_format(console: Console, profile, identity_pool_id: str | No
         console.print("  Federation Type: [cyan]Direct STS (12-hour sessions)[/cyan]")
         federated_role_arn = getattr(profile, "federated_role_arn", None)
         if federated_role_arn:
-            console.print(f"  Federated Role: [cyan]{federated_role_arn.split('/')[-1]}[/cyan]")
+            console.print(f"  Federated Role: [cyan]{federated_role_arn.rpartition('/')[2]}[/cyan]")
     else:
         console.print("  Federation Type: [cyan]Cognito Identity Pool (8-hour sessions)[/cyan]")
 
@@ -8,6 +8,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from claude_code_with_bedrock.config import atomic_write_text, dumps_json
+
 
 class WizardProgress:
     """Tracks and persists wizard progress."""
@@ -15,6 +17,8 @@ class WizardProgress:
     def __init__(self, wizard_name: str = "init"):
         self.wizard_name = wizard_name
         self.progress_file = self._get_progress_file()
+        # Compact JSON of each top-level key as last written to the journal
+        self._saved_fragments: dict[str, str] = {}
         self.data: dict[str, Any] = self._load_progress()
 
     def _get_progress_file(self) -> Path:
@@ -25,27 +29,79 @@ class WizardProgress:
         return config_dir / f".{self.wizard_name}_progress.json"
 
     def _load_progress(self) -> dict[str, Any]:
-        """Load existing progress if available."""
+        """Load existing progress if available.
+
+        The progress file is a journal of step records, one JSON object per line,
+        each holding only the keys that changed in that step. Replaying the records
+        in order rebuilds the full wizard state, which is then compacted back into a
+        single record. A file written as a single JSON object (older versions) is
+        read as a one-record journal.
+        """
         if self.progress_file.exists():
             try:
-                with open(self.progress_file) as f:
-                    data = json.load(f)
-                    # Check if progress is recent (within 24 hours)
-                    saved_time = datetime.fromisoformat(data.get("timestamp", ""))
-                    if (datetime.now() - saved_time).days < 1:
-                        return data
+                data = self._replay(self.progress_file.read_text(encoding="utf-8"))
+                # Check if progress is recent (within 24 hours)
+                saved_time = datetime.fromisoformat(data.get("timestamp", ""))
+                if (datetime.now() - saved_time).days < 1:
+                    self._compact(data)
+                    return data
             except Exception:
                 pass
+            # Stale or unreadable progress must not be replayed under new records
+            self.progress_file.unlink(missing_ok=True)
         return {"step": "start", "data": {}, "timestamp": datetime.now().isoformat()}
 
+    @staticmethod
+    def _replay(content: str) -> dict[str, Any]:
+        """Rebuild wizard state from the progress journal."""
+        try:
+            records = [json.loads(content)]
+        except json.JSONDecodeError:
+            records = []
+            for line in content.splitlines():
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # A torn trailing line from an interrupted write; keep what was complete
+                    break
+
+        state: dict[str, Any] = {"step": "start", "data": {}, "timestamp": ""}
+        for record in records:
+            state["step"] = record.get("step", state["step"])
+            state["data"].update(record.get("data", {}))
+            state["timestamp"] = record.get("timestamp", state["timestamp"])
+        return state
+
+    def _compact(self, data: dict[str, Any]) -> None:
+        """Rewrite the journal as a single record holding the full state."""
+        atomic_write_text(self.progress_file, dumps_json(data) + "\n")
+        self._saved_fragments = {key: self._encode(value) for key, value in data["data"].items()}
+
+    @staticmethod
+    def _encode(value: Any) -> str:
+        """Encode a value canonically for change detection."""
+        return dumps_json(value, sort_keys=True)
+
     def save_step(self, step: str, step_data: dict[str, Any]) -> None:
-        """Save progress for a specific step."""
+        """Save progress for a specific step.
+
+        Only keys whose values changed since the last save are appended to the
+        journal, so each save writes the step's delta rather than the full state.
+        """
+        changed = {}
+        for key, value in step_data.items():
+            encoded = self._encode(value)
+            if self._saved_fragments.get(key) != encoded:
+                changed[key] = value
+                self._saved_fragments[key] = encoded
+
         self.data["step"] = step
         self.data["data"].update(step_data)
         self.data["timestamp"] = datetime.now().isoformat()
 
-        with open(self.progress_file, "w") as f:
-            json.dump(self.data, f, indent=2)
+        record = {"step": step, "data": changed, "timestamp": self.data["timestamp"]}
+        with open(self.progress_file, "a", encoding="utf-8") as f:
+            f.write(dumps_json(record) + "\n")
 
     def get_saved_data(self) -> dict[str, Any]:
         """Get all saved data."""
@@ -63,6 +119,7 @@ class WizardProgress:
         """Clear saved progress."""
         if self.progress_file.exists():
             self.progress_file.unlink()
+        self._saved_fragments = {}
         self.data = {"step": "start", "data": {}, "timestamp": datetime.now().isoformat()}
 
     def get_summary(self) -> str:
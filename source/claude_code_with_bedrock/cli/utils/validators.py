@@ -5,6 +5,14 @@
 
 import re
 
+# Domain patterns (compiled once; the OIDC domain validator runs on every keystroke in the init wizard)
+OKTA_DOMAIN_PATTERN = re.compile(
+    r"^[a-zA-Z0-9][a-zA-Z0-9-]*\.okta(-emea)?\.com$|^[a-zA-Z0-9][a-zA-Z0-9-]*\.oktapreview\.com$"
+)
+OIDC_PROVIDER_DOMAIN_PATTERN = re.compile(
+    r"^[a-zA-Z0-9][a-zA-Z0-9.-]+\.[a-zA-Z0-9]+(/[a-zA-Z0-9._~:/?#[\]@!$&\'()*+,;=-]*)?$"
+)
+
 
 def validate_okta_domain(domain: str) -> bool:
     """Validate Okta domain format.
@@ -19,11 +27,10 @@ def validate_okta_domain(domain: str) -> bool:
         return False
 
     # Remove protocol if present
-    domain = domain.replace("https://", "").replace("http://", "")
+    domain = domain.removeprefix("https://").removeprefix("http://")
 
     # Check format
-    pattern = r"^[a-zA-Z0-9][a-zA-Z0-9-]*\.okta(-emea)?\.com$|^[a-zA-Z0-9][a-zA-Z0-9-]*\.oktapreview\.com$"
-    return bool(re.match(pattern, domain))
+    return bool(OKTA_DOMAIN_PATTERN.match(domain))
 
 
 def validate_oidc_provider_domain(domain: str) -> bool:
@@ -40,14 +47,13 @@ def validate_oidc_provider_domain(domain: str) -> bool:
         return False
 
     # Remove protocol if present
-    domain = domain.replace("https://", "").replace("http://", "")
+    domain = domain.removeprefix("https://").removeprefix("http://")
 
     # Basic validation: must have at least a domain name
     # Allow paths for providers like Microsoft that require them
     # Must start with alphanumeric, can contain dots, hyphens, slashes
     # Minimum: x.y format (at least one dot)
-    pattern = r"^[a-zA-Z0-9][a-zA-Z0-9.-]+\.[a-zA-Z0-9]+(/[a-zA-Z0-9._~:/?#[\]@!$&\'()*+,;=-]*)?$"
-    return bool(re.match(pattern, domain))
+    return bool(OIDC_PROVIDER_DOMAIN_PATTERN.match(domain))
 
 
 def validate_aws_region(region: str) -> bool:
@@ -4,11 +4,78 @@
 """Configuration management for Claude Code with Bedrock."""
 
 import json
+import os
+import tempfile
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from claude_code_with_bedrock.utils.url_validation import detect_provider_type_secure
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; the stdlib json module produces the same output
+    orjson = None
+
+# Suffix appended to the identity pool name for each stack type whose name is not set in the profile
+DEFAULT_STACK_NAME_SUFFIXES = {
+    "auth": "stack",
+    "monitoring": "otel-collector",
+    "dashboard": "dashboard",
+    "analytics": "analytics",
+    "quota": "quota",
+    "networking": "networking",
+    "codebuild": "codebuild",
+    "distribution": "distribution",
+}
+
+
+def dumps_json(data: Any, *, indent: bool = False, sort_keys: bool = False) -> str:
+    """Serialize data to JSON, using orjson when it is installed.
+
+    Args:
+        data: JSON-serializable data.
+        indent: Pretty-print with two-space indentation instead of compact separators.
+        sort_keys: Sort object keys.
+
+    Returns:
+        The JSON document as a string.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(data, option=option).decode()
+    if indent:
+        return json.dumps(data, indent=2, sort_keys=sort_keys, ensure_ascii=False)
+    return json.dumps(data, separators=(",", ":"), sort_keys=sort_keys, ensure_ascii=False)
+
+
+def atomic_write_text(path: Path, content: str) -> None:
+    """Write a file atomically.
+
+    The content is written to a temporary file next to the target and renamed
+    over it, so an interrupted write (e.g. Ctrl+C) never leaves a truncated file.
+    Each call gets its own temporary file, so concurrent writers cannot clobber
+    each other's partial content.
+
+    Args:
+        path: File to write.
+        content: Text content to write (encoded as UTF-8).
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    tmp_path = Path(tmp_name)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
 
 @dataclass
 class Profile:
@@ -95,6 +162,16 @@ class Profile:
         """Legacy property for backward compatibility."""
         return self.client_id
 
+    @property
+    def resolved_stack_names(self) -> dict[str, str]:
+        """CloudFormation stack name for each stack type, falling back to the default names."""
+        names = {
+            stack_type: f"{self.identity_pool_name}-{suffix}"
+            for stack_type, suffix in DEFAULT_STACK_NAME_SUFFIXES.items()
+        }
+        names.update(self.stack_names)
+        return names
+
     def to_dict(self) -> dict[str, Any]:
         """Convert profile to dictionary."""
         return asdict(self)
@@ -120,37 +197,11 @@ class Profile:
         if "credential_storage" not in data:
             data["credential_storage"] = "session"
 
-        # Auto-detect provider type if not set
-        if "provider_type" not in data and "provider_domain" in data:
-            domain = data["provider_domain"]
-            # Secure provider detection using proper URL parsing
-            if domain:
-                # Handle both full URLs and domain-only inputs
-                url_to_parse = domain if domain.startswith(("http://", "https://")) else f"https://{domain}"
-
-                try:
-                    from urllib.parse import urlparse
-
-                    parsed = urlparse(url_to_parse)
-                    hostname = parsed.hostname
-
-                    if hostname:
-                        hostname_lower = hostname.lower()
-
-                        # Check for exact domain match or subdomain match
-                        # Using endswith with leading dot prevents bypass attacks
-                        if hostname_lower.endswith(".okta.com") or hostname_lower == "okta.com":
-                            data["provider_type"] = "okta"
-                        elif hostname_lower.endswith(".auth0.com") or hostname_lower == "auth0.com":
-                            data["provider_type"] = "auth0"
-                        elif hostname_lower.endswith(".microsoftonline.com") or hostname_lower == "microsoftonline.com":
-                            data["provider_type"] = "azure"
-                        elif hostname_lower.endswith(".windows.net") or hostname_lower == "windows.net":
-                            data["provider_type"] = "azure"
-                        elif hostname_lower.endswith(".amazoncognito.com") or hostname_lower == "amazoncognito.com":
-                            data["provider_type"] = "cognito"
-                except Exception:
-                    pass  # Leave provider_type unset if parsing fails
+        # Auto-detect provider type if not set; unknown providers leave it unset
+        if "provider_type" not in data and data.get("provider_domain"):
+            provider_type = detect_provider_type_secure(data["provider_domain"])
+            if provider_type != "oidc":
+                data["provider_type"] = provider_type
 
         # Migrate legacy distribution configuration
         if "enable_distribution" in data and data.get("enable_distribution"):
@@ -204,7 +255,7 @@ class Config:
         # Load global config
         if cls.CONFIG_FILE.exists():
             try:
-                with open(cls.CONFIG_FILE) as f:
+                with open(cls.CONFIG_FILE, encoding="utf-8") as f:
                     data = json.load(f)
 
                 return cls(
@@ -226,8 +277,7 @@ class Config:
             "profiles_dir": str(self.PROFILES_DIR),
         }
 
-        with open(self.CONFIG_FILE, "w") as f:
-            json.dump(data, f, indent=2)
+        atomic_write_text(self.CONFIG_FILE, dumps_json(data, indent=True))
 
     def load_profile(self, name: str | None = None) -> Profile:
         """Load a specific profile or the active profile.
@@ -253,7 +303,7 @@ class Config:
             raise FileNotFoundError(f"Profile not found: {profile_name}")
 
         try:
-            with open(profile_path) as f:
+            with open(profile_path, encoding="utf-8") as f:
                 data = json.load(f)
 
             return Profile.from_dict(data)
@@ -283,8 +333,7 @@ class Config:
         # Save to file
         profile_path = self.PROFILES_DIR / f"{profile.name}.json"
 
-        with open(profile_path, "w") as f:
-            json.dump(profile.to_dict(), f, indent=2)
+        atomic_write_text(profile_path, dumps_json(profile.to_dict(), indent=True))
 
         # Set as active if it's the first profile
         if not self.active_profile and not self.list_profiles():
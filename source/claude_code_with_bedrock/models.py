@@ -12,13 +12,15 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
+from functools import cache
 from typing import Any
 
 # Default regions for AWS profile based on cross-region profile
 DEFAULT_REGIONS = {"us": "us-east-1", "europe": "eu-west-3", "apac": "ap-northeast-1", "us-gov": "us-gov-west-1"}
 
 # Claude model configurations
-# Each model defines its availability across different cross-region profiles
+# Each model defines its availability across different cross-region profiles.
+# This table is static: the lookup helpers below are cached, so it must not be mutated at runtime.
 CLAUDE_MODELS = {
     "opus-4-6": {
         "name": "Claude Opus 4.6",
@@ -500,7 +502,20 @@ CLAUDE_MODELS = {
     },
 }
 
+# Reverse index from a Bedrock model ID (any profile) back to its CLAUDE_MODELS key
+MODEL_ID_TO_KEY = {
+    profile_config["model_id"]: model_key
+    for model_key, model_info in CLAUDE_MODELS.items()
+    for profile_config in model_info["profiles"].values()
+}
+
+
+def get_model_key_for_model_id(model_id: str) -> str | None:
+    """Get the CLAUDE_MODELS key for a model ID, or None if the ID is unknown."""
+    return MODEL_ID_TO_KEY.get(model_id)
+
 
+@cache
 def get_available_profiles_for_model(model_key: str) -> list[str]:
     """Get list of available cross-region profiles for a given model."""
     if model_key not in CLAUDE_MODELS:
@@ -508,6 +523,7 @@ def get_available_profiles_for_model(model_key: str) -> list[str]:
     return list(CLAUDE_MODELS[model_key]["profiles"].keys())
 
 
+@cache
 def get_model_id_for_profile(model_key: str, profile_key: str) -> str:
     """Get the model ID for a specific model and cross-region profile."""
     if model_key not in CLAUDE_MODELS:
@@ -528,6 +544,7 @@ def get_default_region_for_profile(profile_key: str) -> str:
     return DEFAULT_REGIONS[profile_key]
 
 
+@cache
 def get_source_regions_for_model_profile(model_key: str, profile_key: str) -> list[str]:
     """Get source regions for a specific model and profile combination."""
     if model_key not in CLAUDE_MODELS:
@@ -540,6 +557,7 @@ def get_source_regions_for_model_profile(model_key: str, profile_key: str) -> li
     return model_config["profiles"][profile_key]["source_regions"]
 
 
+@cache
 def get_destination_regions_for_model_profile(model_key: str, profile_key: str) -> list[str]:
     """Get destination regions for a specific model and profile combination."""
     if model_key not in CLAUDE_MODELS:
@@ -570,6 +588,7 @@ def get_all_model_display_names() -> dict[str, str]:
     return display_names
 
 
+@cache
 def get_profile_description(model_key: str, profile_key: str) -> str:
     """Get the description for a specific model profile combination."""
     if model_key not in CLAUDE_MODELS:
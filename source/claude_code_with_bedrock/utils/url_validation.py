@@ -3,6 +3,33 @@
 
 from urllib.parse import urlparse
 
+# Known OIDC provider domains, keyed by registrable domain (all entries are two labels)
+PROVIDER_TYPES_BY_DOMAIN = {
+    "okta.com": "okta",
+    "auth0.com": "auth0",
+    "microsoftonline.com": "azure",
+    "windows.net": "azure",
+    "amazoncognito.com": "cognito",
+}
+
+
+def get_known_provider_type(hostname: str) -> str | None:
+    """
+    Look up the provider type for a known provider hostname.
+
+    Only an exact domain or subdomain match counts: the hostname's registrable
+    domain (its last two labels) is looked up, so okta.com.evil.com and
+    not-okta.com do not match.
+
+    Args:
+        hostname: Hostname to classify (any case)
+
+    Returns:
+        Provider type, or None if the hostname is not a known provider
+    """
+    registrable_domain = ".".join(hostname.lower().rsplit(".", 2)[-2:])
+    return PROVIDER_TYPES_BY_DOMAIN.get(registrable_domain)
+
 
 def detect_provider_type_secure(domain: str) -> str:
     """
@@ -33,22 +60,7 @@ def detect_provider_type_secure(domain: str) -> str:
         if not hostname:
             return "oidc"
 
-        hostname_lower = hostname.lower()
-
-        # Check for exact domain match or subdomain match
-        # Using endswith with leading dot prevents bypass attacks
-        if hostname_lower.endswith(".okta.com") or hostname_lower == "okta.com":
-            return "okta"
-        elif hostname_lower.endswith(".auth0.com") or hostname_lower == "auth0.com":
-            return "auth0"
-        elif hostname_lower.endswith(".microsoftonline.com") or hostname_lower == "microsoftonline.com":
-            return "azure"
-        elif hostname_lower.endswith(".windows.net") or hostname_lower == "windows.net":
-            return "azure"
-        elif hostname_lower.endswith(".amazoncognito.com") or hostname_lower == "amazoncognito.com":
-            return "cognito"
-        else:
-            return "oidc"
+        return get_known_provider_type(hostname) or "oidc"
     except Exception:
         # Default to generic OIDC for any parsing errors
         return "oidc"
@@ -276,6 +276,73 @@ class TestCognitoRegionDetection:
         assert region_match is not None, "Fallback region detection failed"
         assert region_match.group(1) == "us-west-2", f"Wrong region extracted: {region_match.group(1)}"
 
+    def test_module_level_region_patterns(self):
+        """Test the compiled region patterns used by the init wizard."""
+        from claude_code_with_bedrock.cli.commands.init import (
+            COGNITO_DOMAIN_REGION_PATTERN,
+            REGION_IN_DOMAIN_PATTERN,
+        )
+
+        test_cases = [
+            ("myapp.auth.us-east-1.amazoncognito.com", "us-east-1"),
+            ("myapp.auth-fips.us-gov-west-1.amazoncognito.com", "us-gov-west-1"),
+        ]
+        for domain, expected_region in test_cases:
+            region_match = COGNITO_DOMAIN_REGION_PATTERN.search(domain)
+            assert region_match is not None, f"Failed to match region in {domain}"
+            assert region_match.group(1) == expected_region
+
+        assert COGNITO_DOMAIN_REGION_PATTERN.search("custom.us-west-2.mydomain.com") is None
+        assert REGION_IN_DOMAIN_PATTERN.search("custom.us-west-2.mydomain.com").group(1) == "us-west-2"
+        assert REGION_IN_DOMAIN_PATTERN.search("auth.us-gov-east-1.example.com").group(1) == "us-gov-east-1"
+
+    def test_parse_provider_domain(self):
+        """Test that a provider domain is parsed once into hostname, type and region."""
+        from claude_code_with_bedrock.cli.commands.init import parse_provider_domain
+
+        info = parse_provider_domain("MyApp.auth.us-east-1.amazoncognito.com")
+        assert info.hostname == "myapp.auth.us-east-1.amazoncognito.com"
+        assert info.provider_type == "cognito"
+        assert info.region == "us-east-1"
+
+        info = parse_provider_domain("cognito-idp.us-gov-west-1.amazonaws.com/us-gov-west-1_abc123")
+        assert info.provider_type == "cognito"
+        assert info.region == "us-gov-west-1"
+
+        info = parse_provider_domain("login.microsoftonline.com/tenant-id/v2.0")
+        assert info.provider_type == "azure"
+        assert info.region is None
+
+        info = parse_provider_domain("auth.us-west-2.example.com")
+        assert info.provider_type is None
+        assert info.region == "us-west-2"
+
+        assert parse_provider_domain("[invalid").hostname is None
+
+    def test_vpc_and_subnet_choice_labels(self):
+        """Test that VPC and subnet picker labels include name and markers."""
+        from claude_code_with_bedrock.cli.commands.init import build_subnet_choice, build_vpc_choice
+
+        vpc = {"id": "vpc-1", "cidr": "10.0.0.0/16", "name": "main", "is_default": True}
+        choice = build_vpc_choice(vpc)
+        assert choice.title == "main (vpc-1 - 10.0.0.0/16) [DEFAULT]"
+        assert choice.value == "vpc-1"
+        assert build_vpc_choice({**vpc, "name": "", "is_default": False}).title == "vpc-1 - 10.0.0.0/16"
+
+        subnet = {
+            "id": "subnet-1",
+            "cidr": "10.0.1.0/24",
+            "availability_zone": "us-east-1a",
+            "name": "public-a",
+            "is_public": True,
+        }
+        choice = build_subnet_choice(subnet)
+        assert choice.title == "public-a - subnet-1 - 10.0.1.0/24 (us-east-1a) [PUBLIC]"
+        assert choice.checked is True
+        choice = build_subnet_choice({**subnet, "name": "", "is_public": False})
+        assert choice.title == "subnet-1 - 10.0.1.0/24 (us-east-1a)"
+        assert choice.checked is False
+
 
 class TestInitCommandRegression:
     """Regression tests to prevent the lambda scoping issue from recurring."""
@@ -398,6 +465,19 @@ class TestCrossRegionProfiles:
             assert isinstance(profile_data["regions"], list)
             assert len(profile_data["regions"]) > 0
 
+    def test_model_choice_titles_are_built_once(self):
+        """Test that model picker titles cover every model and are cached."""
+        from claude_code_with_bedrock.cli.commands.init import get_model_choice_titles
+        from claude_code_with_bedrock.models import CLAUDE_MODELS
+
+        titles = get_model_choice_titles()
+        assert [key for _title, key in titles] == list(CLAUDE_MODELS)
+        assert get_model_choice_titles() is titles
+
+        title = {key: title for title, key in titles}["sonnet-4-5"]
+        assert title.startswith(CLAUDE_MODELS["sonnet-4-5"]["name"])
+        assert "US" in title
+
 
 class TestNamedFunctionsIntegration:
     """Integration tests for named validation functions."""
@@ -3,6 +3,7 @@
 
 """End-to-end tests for init command."""
 
+import json
 import sys
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -121,6 +122,245 @@ class TestInitCommandE2E:
         # and doesn't cause any import or scoping issues
         assert mock_progress("init") is not None
 
+    @patch("claude_code_with_bedrock.cli.commands.init.questionary")
+    def test_update_only_runs_selected_sections(self, mock_questionary):
+        """Test that updating a profile only prompts for the selected sections."""
+        command = InitCommand()
+        progress = MagicMock()
+        progress.get_last_step.return_value = None
+
+        mock_questionary.confirm.return_value.ask.return_value = False
+        mock_questionary.select.return_value.ask.return_value = "presigned-s3"
+
+        existing = {"okta": {"domain": "company.okta.com"}, "aws": {"region": "us-east-1"}}
+        config = command._gather_configuration(progress, existing, "test", {"features"})
+
+        assert config["okta"] == {"domain": "company.okta.com"}
+        assert config["distribution"] == {"enabled": True, "type": "presigned-s3"}
+        assert config["codebuild"] == {"enabled": False}
+        mock_questionary.text.assert_not_called()
+        mock_questionary.confirm.assert_called_once()
+        mock_questionary.select.assert_called_once()
+        progress.save_step.assert_not_called()
+
+    @patch("claude_code_with_bedrock.cli.commands.init.boto3")
+    @patch("claude_code_with_bedrock.cli.commands.init.get_current_region", return_value="us-east-1")
+    @patch("claude_code_with_bedrock.cli.commands.init.questionary")
+    def test_features_only_update_configures_landing_page(self, mock_questionary, mock_region, mock_boto3):
+        """Test that a features-only update can configure the landing page using the saved region."""
+        command = InitCommand()
+        progress = MagicMock()
+        progress.get_last_step.return_value = None
+
+        mock_questionary.confirm.return_value.ask.return_value = False
+        mock_questionary.select.return_value.ask.side_effect = ["landing-page", "okta"]
+        mock_questionary.text.return_value.ask.side_effect = ["company.okta.com", "web-client", "downloads.example.com"]
+        mock_questionary.password.return_value.ask.return_value = "secret"
+        secrets_client = MagicMock()
+        secrets_client.create_secret.return_value = {"ARN": "arn:aws:secretsmanager:eu-west-1:123:secret:s"}
+        route53_client = MagicMock()
+        route53_client.list_hosted_zones.return_value = {"HostedZones": []}
+        clients = {"secretsmanager": secrets_client, "sts": MagicMock(), "route53": route53_client}
+        mock_boto3.client.side_effect = lambda service, **kwargs: clients[service]
+
+        existing = {"aws": {"region": "eu-west-1", "identity_pool_name": "test-pool"}}
+        config = command._gather_configuration(progress, existing, "test", {"features"})
+
+        assert config["distribution"]["type"] == "landing-page"
+        assert config["distribution"]["custom_domain"] == "downloads.example.com"
+        assert config["distribution"]["idp_client_secret_arn"] == "arn:aws:secretsmanager:eu-west-1:123:secret:s"
+        assert mock_boto3.client.call_args_list[0].kwargs == {"region_name": "eu-west-1"}
+        mock_region.assert_not_called()
+
+    @patch("claude_code_with_bedrock.cli.commands.init.get_current_region", return_value="us-east-1")
+    @patch("claude_code_with_bedrock.cli.commands.init.questionary")
+    def test_aws_step_asks_region_and_name_together(self, mock_questionary, _mock_region):
+        """Test that the AWS step batches its independent questions into one prompt."""
+        command = InitCommand()
+        progress = MagicMock()
+        mock_questionary.prompt.return_value = {"region": "eu-west-1", "stack_base_name": "team-auth"}
+
+        existing = {"aws": {"region": "us-east-1", "stacks": {"quota": "quota-stack"}}}
+        config = command._gather_configuration(progress, existing, "test", {"aws"})
+
+        mock_questionary.prompt.assert_called_once()
+        questions = mock_questionary.prompt.call_args.args[0]
+        assert [q["name"] for q in questions] == ["region", "stack_base_name"]
+        assert config["aws"]["region"] == "eu-west-1"
+        assert config["aws"]["stacks"]["auth"] == "team-auth-stack"
+        assert config["aws"]["stacks"]["quota"] == "quota-stack"
+
+        # A cancelled prompt returns an empty answer dict
+        mock_questionary.prompt.return_value = {}
+        assert command._gather_configuration(progress, existing, "test", {"aws"}) is None
+
+    def test_prerequisite_checks_run_in_process(self):
+        """Test that prerequisite checks do not spawn the AWS CLI."""
+        command = InitCommand()
+
+        with (
+            patch("subprocess.run") as mock_run,
+            patch("shutil.which", return_value="/usr/local/bin/aws"),
+            patch("boto3.Session") as mock_session,
+        ):
+            mock_session.return_value.get_credentials.return_value = MagicMock()
+            assert command._check_aws_cli() is True
+            assert command._check_aws_credentials() is True
+
+            mock_session.return_value.get_credentials.return_value = None
+            assert InitCommand()._check_aws_credentials() is False
+            mock_run.assert_not_called()
+
+            # Results are resolved once per wizard run
+            assert command._check_aws_credentials() is True
+
+        with patch("shutil.which", return_value=None):
+            assert InitCommand()._check_aws_cli() is False
+
+    def test_deploy_runs_monitoring_stacks_after_auth(self):
+        """Test that both monitoring stacks are deployed once the auth stack succeeds."""
+        command = InitCommand()
+        config = {
+            "aws": {
+                "region": "us-east-1",
+                "stacks": {"auth": "auth-stack", "monitoring": "otel-stack", "dashboard": "dash-stack"},
+            },
+            "monitoring": {"enabled": True},
+        }
+
+        with (
+            patch.object(command, "_save_configuration"),
+            patch.object(command, "_update_parameters_file"),
+            patch.object(command, "_deploy_stack", return_value=True) as mock_deploy_stack,
+        ):
+            assert command._deploy(config, "test") == 0
+
+        deployed = [call.args[0] for call in mock_deploy_stack.call_args_list]
+        assert deployed[0] == "auth-stack"
+        assert sorted(deployed[1:]) == ["dash-stack", "otel-stack"]
+
+        with (
+            patch.object(command, "_save_configuration"),
+            patch.object(command, "_update_parameters_file"),
+            patch.object(command, "_deploy_stack", return_value=False) as mock_deploy_stack,
+        ):
+            assert command._deploy(config, "test") == 1
+        mock_deploy_stack.assert_called_once()
+
+    def test_deploy_stack_uses_boto3_with_template_parameters(self, tmp_path):
+        """Test that stacks deploy through boto3 with only the parameters the template declares."""
+        command = InitCommand()
+        template_file = tmp_path / "stack.yaml"
+        template_file.write_text(
+            "Parameters:\n  OktaDomain:\n    Type: String\n"
+            "Resources:\n  Topic:\n    Type: AWS::SNS::Topic\n    Properties:\n      TopicName: !Ref OktaDomain\n"
+        )
+        params_file = tmp_path / "parameters.json"
+        params_file.write_text(
+            '[{"ParameterKey": "OktaDomain", "ParameterValue": "company.okta.com"},'
+            ' {"ParameterKey": "EnableMonitoring", "ParameterValue": "true"}]'
+        )
+
+        with (
+            patch("claude_code_with_bedrock.cli.commands.init.CloudFormationManager") as mock_manager,
+            patch.object(InitCommand, "io", MagicMock()),
+        ):
+            mock_manager.return_value.deploy_stack.return_value = MagicMock(success=True)
+
+            assert command._deploy_stack("auth-stack", template_file, params_file, "us-east-1") is True
+
+            mock_manager.return_value.deploy_stack.assert_called_once_with(
+                "auth-stack",
+                template_file,
+                parameters=[{"ParameterKey": "OktaDomain", "ParameterValue": "company.okta.com"}],
+                capabilities=["CAPABILITY_IAM", "CAPABILITY_NAMED_IAM"],
+            )
+
+            mock_manager.return_value.cf_client.describe_stacks.return_value = {
+                "Stacks": [{"StackStatus": "UPDATE_COMPLETE", "Outputs": [{"OutputKey": "K", "OutputValue": "V"}]}]
+            }
+            assert command._stack_exists("auth-stack", "us-east-1") is True
+            assert command._get_stack_outputs("auth-stack", "us-east-1") == {"K": "V"}
+            # Existence and outputs come from a single describe_stacks call
+            mock_manager.return_value.cf_client.describe_stacks.assert_called_once_with(StackName="auth-stack")
+            # One manager (and client) per region is reused across calls
+            mock_manager.assert_called_once_with(region="us-east-1")
+
+    def test_update_parameters_file_merges_by_key(self, tmp_path):
+        """Test that parameters are updated in place and new ones appended."""
+        command = InitCommand()
+        params_file = tmp_path / "parameters.json"
+        params_file.write_text(
+            json.dumps(
+                [
+                    {"ParameterKey": "Custom", "ParameterValue": "keep"},
+                    {"ParameterKey": "OktaDomain", "ParameterValue": "old.okta.com"},
+                ]
+            )
+        )
+        config = {
+            "okta": {"domain": "new.okta.com", "client_id": "client-id-12345"},
+            "aws": {"identity_pool_name": "pool", "allowed_bedrock_regions": ["us-east-1", "us-west-2"]},
+            "monitoring": {"enabled": False},
+        }
+
+        command._update_parameters_file(params_file, config)
+
+        params = json.loads(params_file.read_text())
+        keys = [p["ParameterKey"] for p in params]
+        assert keys[:2] == ["Custom", "OktaDomain"]
+        assert len(keys) == len(set(keys))
+        values = {p["ParameterKey"]: p["ParameterValue"] for p in params}
+        assert values["Custom"] == "keep"
+        assert values["OktaDomain"] == "new.okta.com"
+        assert values["AllowedBedrockRegions"] == "us-east-1,us-west-2"
+        assert [f.name for f in tmp_path.iterdir()] == ["parameters.json"]
+
+    @patch("claude_code_with_bedrock.cli.commands.init.get_account_id", return_value="123456789012")
+    @patch("claude_code_with_bedrock.cli.commands.init.Console")
+    def test_review_prints_resources_once(self, mock_console_cls, _mock_account):
+        """Test that the resources to be created are rendered in a single print."""
+        console = mock_console_cls.return_value
+        config = {
+            "okta": {"domain": "company.okta.com", "client_id": "client-id"},
+            "aws": {"region": "us-east-1", "identity_pool_name": "pool"},
+            "monitoring": {"enabled": True, "vpc_config": {"create_vpc": True}},
+            "quota": {"enabled": True},
+        }
+
+        assert InitCommand()._review_configuration(config) is True
+
+        bullets = [c.args[0] for c in console.print.call_args_list if c.args and str(c.args[0]).startswith("• ")]
+        assert len(bullets) == 1
+        assert "• Cognito Identity Pool for authentication" in bullets[0]
+        assert "• DynamoDB tables for quota tracking" in bullets[0]
+
+    @pytest.mark.parametrize("monitoring_enabled", [False, True])
+    @patch("claude_code_with_bedrock.cli.commands.init.questionary")
+    @patch("claude_code_with_bedrock.cli.commands.init.get_all_vpcs_and_subnets", return_value={})
+    @patch("claude_code_with_bedrock.cli.commands.init.Config")
+    def test_configure_vpc_looks_up_monitoring_stack_only_when_enabled(
+        self, mock_config, _mock_vpcs, mock_questionary, monitoring_enabled
+    ):
+        """Test that the monitoring stack is only described when the profile has monitoring."""
+        profile = mock_config.load.return_value.get_profile.return_value
+        profile.monitoring_enabled = monitoring_enabled
+        profile.stack_names = {"monitoring": "pool-otel-collector"}
+        mock_questionary.confirm.return_value.ask.return_value = True
+        command = InitCommand()
+
+        with patch.object(command, "_describe_stack", return_value=None) as mock_describe:
+            assert command._configure_vpc("us-east-1") == {"create_vpc": True}
+
+        assert mock_describe.called is monitoring_enabled
+
+    def test_validate_section_selection(self):
+        """Test that at least one section must be selected for an update."""
+        from claude_code_with_bedrock.cli.commands.init import validate_section_selection
+
+        assert validate_section_selection(["aws"]) is True
+        assert isinstance(validate_section_selection([]), str)
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -4,10 +4,13 @@
 """Tests for the package command."""
 
 import json
+import sys
 import tempfile
+import threading
 from pathlib import Path
+from unittest.mock import MagicMock, patch
 
-from claude_code_with_bedrock.cli.commands.package import PackageCommand
+from claude_code_with_bedrock.cli.commands.package import OTEL_HELPER_DOCKER_BUILD, PackageCommand
 from claude_code_with_bedrock.config import Profile
 
 
@@ -115,3 +118,244 @@ class TestPackageCommandCrossRegion:
             assert "AWS_REGION" in installer_content or "aws_region" in installer_content
             # The fallback should now have the interpolated region value
             assert "us-west-2" in installer_content or "config.json" in installer_content
+
+    def test_settings_read_monitoring_endpoint_from_stack_outputs(self, tmp_path):
+        """Test that the collector endpoint comes from the monitoring stack outputs."""
+        command = PackageCommand()
+        profile = Profile(
+            name="test",
+            provider_domain="test.okta.com",
+            client_id="test-client",
+            credential_storage="session",
+            aws_region="us-west-2",
+            identity_pool_name="test-pool",
+            monitoring_enabled=True,
+        )
+
+        with patch(
+            "claude_code_with_bedrock.cli.commands.package.get_stack_outputs",
+            return_value={"CollectorEndpoint": "https://collector.example.com"},
+        ) as get_outputs:
+            command._create_claude_settings(tmp_path, profile)
+
+        get_outputs.assert_called_once_with("test-pool-otel-collector", "us-west-2")
+        settings = json.loads((tmp_path / "claude-settings" / "settings.json").read_text())
+        assert settings["env"]["OTEL_EXPORTER_OTLP_ENDPOINT"] == "https://collector.example.com"
+        assert settings["otelHeadersHelper"] == "__OTEL_HELPER_PATH__"
+
+
+class TestPackageCommandBuilds:
+    """Tests for building the platform binaries."""
+
+    def test_builds_run_concurrently_and_keep_platform_order(self, tmp_path):
+        """Test that all local builds are started together and reported in platform order."""
+        command = PackageCommand()
+        platforms = ["linux-x64", "macos-arm64"]
+        # Every build waits until all four have started, so this only passes if they run concurrently
+        barrier = threading.Barrier(4, timeout=5)
+
+        def build(kind):
+            def run(output_dir, platform_name):
+                barrier.wait()
+                return output_dir / f"{kind}-{platform_name}"
+
+            return run
+
+        with (
+            patch.object(command, "_build_executable", side_effect=build("credential-process")),
+            patch.object(command, "_build_otel_helper", side_effect=build("otel-helper")),
+        ):
+            executables, otel_helpers = command._build_binaries(tmp_path, platforms, True, MagicMock())
+
+        assert executables == [(p, tmp_path / f"credential-process-{p}") for p in platforms]
+        assert otel_helpers == [(p, tmp_path / f"otel-helper-{p}") for p in platforms]
+
+    def test_failed_or_skipped_builds_are_left_out(self, tmp_path):
+        """Test that a failing build is reported and a skipped (None) build is not packaged."""
+        command = PackageCommand()
+        console = MagicMock()
+
+        def build_executable(output_dir, platform_name):
+            if platform_name == "linux-arm64":
+                raise RuntimeError("docker build failed")
+            return None if platform_name == "linux-x64" else output_dir / platform_name
+
+        with patch.object(command, "_build_executable", side_effect=build_executable):
+            executables, otel_helpers = command._build_binaries(
+                tmp_path, ["linux-x64", "linux-arm64", "macos-arm64"], False, console
+            )
+
+        assert executables == [("macos-arm64", tmp_path / "macos-arm64")]
+        assert otel_helpers == []
+        printed = " ".join(str(c.args[0]) for c in console.print.call_args_list)
+        assert "Could not build credential process for linux-arm64" in printed
+
+    def test_docker_build_exports_the_binary_without_a_container(self, tmp_path):
+        """Test that the Docker build writes the binary to the host and never creates an image or container."""
+        command = PackageCommand()
+        (tmp_path / "out").mkdir()
+
+        def docker_build(cmd, **kwargs):
+            export_dir = Path(cmd[cmd.index("--output") + 1].removeprefix("type=local,dest="))
+            export_dir.mkdir()
+            (export_dir / "otel-helper-linux-x64").write_text("binary")
+            return 0, ""
+
+        with (
+            patch.object(PackageCommand, "option", return_value=False),
+            patch.object(command, "_run_capture_tail", side_effect=docker_build) as mock_build,
+            patch("claude_code_with_bedrock.cli.commands.package.subprocess.run") as mock_run,
+        ):
+            binary_path = command._build_binary_with_docker(
+                tmp_path,
+                "FROM builder AS build",
+                "linux/amd64",
+                "otel-helper-linux-x64",
+                tmp_path / "out",
+                "Linux x64 OTEL helper",
+            )
+
+        assert binary_path == tmp_path / "out" / "otel-helper-linux-x64"
+        assert binary_path.read_text() == "binary"
+        dockerfile = (tmp_path / "Dockerfile").read_text()
+        assert dockerfile.endswith("FROM scratch AS export\nCOPY --from=build /output/otel-helper-linux-x64 /\n")
+        docker_cmd = mock_build.call_args.args[0]
+        assert "--load" not in docker_cmd
+        assert docker_cmd[docker_cmd.index("--no-cache-filter") + 1] == "build"
+        assert "--no-cache" not in docker_cmd
+        mock_run.assert_not_called()
+
+    def test_pyinstaller_uses_persistent_per_binary_cache(self, tmp_path):
+        """Test that local PyInstaller builds keep their work and config dirs under the user cache."""
+        command = PackageCommand()
+        output_dir = tmp_path / "dist"
+        output_dir.mkdir()
+
+        def pyinstaller(cmd, **kwargs):
+            (output_dir / "credential-process-linux-x64").touch()
+            return 0, ""
+
+        with (
+            patch.object(PackageCommand, "option", return_value=False),
+            patch("platform.machine", return_value="x86_64"),
+            patch("claude_code_with_bedrock.cli.commands.package.Path.home", return_value=tmp_path),
+            patch.object(command, "_run_capture_tail", side_effect=pyinstaller) as mock_run,
+        ):
+            command._build_linux_pyinstaller(output_dir)
+
+        cache_dir = tmp_path / ".cache" / "ccwb" / "pyinstaller" / "credential-process-linux-x64"
+        assert cache_dir.is_dir()
+        cmd = mock_run.call_args.args[0]
+        assert "--clean" not in cmd
+        assert f"--workpath={cache_dir / 'build'}" in cmd
+        assert mock_run.call_args.kwargs["env"]["PYINSTALLER_CONFIG_DIR"] == str(cache_dir / "config")
+
+    def test_build_output_keeps_only_the_tail(self):
+        """Test that streamed build output is trimmed to the last tail_bytes for error messages."""
+        command = PackageCommand()
+        script = "import sys; print('x' * 100000); print('build failed', file=sys.stderr); sys.exit(3)"
+
+        returncode, output = command._run_capture_tail([sys.executable, "-c", script], tail_bytes=1000)
+
+        assert returncode == 3
+        assert len(output) == 1000
+        assert output.rstrip().endswith("build failed")
+
+    def test_docker_checks_run_once_per_command(self, tmp_path):
+        """Test that both Linux Docker builds share one PATH lookup and one `docker info` call."""
+        command = PackageCommand()
+
+        with (
+            patch.object(PackageCommand, "option", return_value=False),
+            patch("claude_code_with_bedrock.cli.commands.package.shutil.which", return_value="docker") as which,
+            patch("claude_code_with_bedrock.cli.commands.package.subprocess.run") as mock_run,
+        ):
+            mock_run.return_value = MagicMock(returncode=1)
+            assert command._build_linux_via_docker(tmp_path, "x64") is None
+            assert command._build_linux_otel_helper_via_docker(tmp_path, "arm64") is None
+
+        which.assert_called_once_with("docker")
+        mock_run.assert_called_once()
+        assert mock_run.call_args.args[0] == ["docker", "info"]
+
+    def test_unchanged_sources_reuse_the_cached_binary(self, tmp_path):
+        """Test that a second build from the same sources copies the cached binary instead of rebuilding."""
+        command = PackageCommand()
+        source_dir = tmp_path / "source"
+        (source_dir / "otel_helper").mkdir(parents=True)
+        (source_dir / "otel_helper" / "__main__.py").write_text("print('v1')")
+        builds = []
+
+        def build(output_dir, target_platform):
+            builds.append(target_platform)
+            binary_path = output_dir / f"otel-helper-{target_platform}"
+            binary_path.write_text(f"binary {len(builds)}")
+            return binary_path
+
+        with (
+            patch("claude_code_with_bedrock.cli.commands.package.SOURCE_DIR", source_dir),
+            patch("claude_code_with_bedrock.cli.commands.package.Path.home", return_value=tmp_path),
+        ):
+            for run in ("first", "second"):
+                (tmp_path / run).mkdir()
+                binary_path = command._build_with_cache(tmp_path / run, "linux-x64", "otel_helper", build)
+                assert binary_path == tmp_path / run / "otel-helper-linux-x64"
+                assert binary_path.read_text() == "binary 1"
+
+            (source_dir / "otel_helper" / "__main__.py").write_text("print('v2')")
+            (tmp_path / "third").mkdir()
+            binary_path = command._build_with_cache(tmp_path / "third", "linux-x64", "otel_helper", build)
+
+        assert binary_path.read_text() == "binary 2"
+        assert builds == ["linux-x64", "linux-x64"]
+
+    def test_new_cached_binary_replaces_older_ones(self, tmp_path):
+        """Test that caching a binary removes older entries for the same package and platform only."""
+        command = PackageCommand()
+        source_dir = tmp_path / "source"
+        for package in ("otel_helper", "credential_provider"):
+            (source_dir / package).mkdir(parents=True)
+            (source_dir / package / "__main__.py").write_text("print('v1')")
+
+        def build(output_dir, target_platform):
+            binary_path = output_dir / f"binary-{target_platform}"
+            binary_path.write_text("binary")
+            return binary_path
+
+        cache_root = tmp_path / ".cache" / "ccwb" / "binaries"
+        with (
+            patch("claude_code_with_bedrock.cli.commands.package.SOURCE_DIR", source_dir),
+            patch("claude_code_with_bedrock.cli.commands.package.Path.home", return_value=tmp_path),
+        ):
+            for package, target_platform in [
+                ("otel_helper", "linux-x64"),
+                ("otel_helper", "linux-arm64"),
+                ("credential_provider", "linux-x64"),
+            ]:
+                output_dir = tmp_path / f"{package}-{target_platform}"
+                output_dir.mkdir()
+                command._build_with_cache(output_dir, target_platform, package, build)
+            old_entries = {path.name for path in cache_root.iterdir()}
+
+            (source_dir / "otel_helper" / "__main__.py").write_text("print('v2')")
+            (tmp_path / "rebuild").mkdir()
+            command._build_with_cache(tmp_path / "rebuild", "linux-x64", "otel_helper", build)
+
+        entries = {path.name for path in cache_root.iterdir()}
+        assert len(entries) == 3
+        assert old_entries - entries == {name for name in old_entries if name.startswith("otel_helper-linux-x64-")}
+        assert len(entries - old_entries) == 1
+        assert next(iter(entries - old_entries)).startswith("otel_helper-linux-x64-")
+
+    def test_docker_build_spec_renders_dockerfile(self):
+        """Test that a build spec renders a multi-stage Dockerfile for its package and binary."""
+        dockerfile = OTEL_HELPER_DOCKER_BUILD.dockerfile("linux/arm64", "otel-helper-linux-arm64")
+
+        # The builder stage is part of the Dockerfile, so no locally loaded image is needed
+        assert dockerfile.startswith("FROM --platform=linux/arm64 ubuntu:22.04 AS builder\n")
+        assert "\nFROM builder AS build\n" in dockerfile
+        assert dockerfile.index("pyinstaller==6.3.0") < dockerfile.index("FROM builder AS build")
+        assert "--no-cache-dir \\\n    PyJWT \\\n    cryptography \\\n    six\n" in dockerfile
+        assert "COPY otel_helper /build/otel_helper\n" in dockerfile
+        assert "    --name otel-helper-linux-arm64 \\\n" in dockerfile
+        assert "    --hidden-import six.moves \\\n    otel_helper/__main__.py\n" in dockerfile
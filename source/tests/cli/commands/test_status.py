@@ -0,0 +1,129 @@
+# ABOUTME: Unit tests for the status command
+# ABOUTME: Tests that stack lookups are shared between status and endpoint sections
+
+"""Tests for the status command."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+from claude_code_with_bedrock.cli.commands.status import StatusCommand
+from claude_code_with_bedrock.config import Profile
+
+
+def make_profile(**overrides) -> Profile:
+    """Build a monitoring-enabled test profile."""
+    values = {
+        "name": "test",
+        "provider_domain": "test.okta.com",
+        "client_id": "test-client-id",
+        "credential_storage": "keyring",
+        "aws_region": "us-east-1",
+        "identity_pool_name": "test-pool",
+        "monitoring_enabled": True,
+    }
+    values.update(overrides)
+    return Profile(**values)
+
+
+class TestStatusStackLookups:
+    """Tests for CloudFormation lookups made by the status command."""
+
+    def test_each_stack_is_described_once(self):
+        """Test that status and endpoints share one describe_stacks call per stack."""
+        command = StatusCommand()
+        profile = make_profile()
+        cf_client = MagicMock()
+        cf_client.get_paginator.side_effect = Exception("not authorized to perform cloudformation:ListStacks")
+        cf_client.describe_stacks.side_effect = lambda StackName: {
+            "Stacks": [
+                {
+                    "StackStatus": "CREATE_COMPLETE",
+                    "CreationTime": "2024-01-01",
+                    "Outputs": [{"OutputKey": "IdentityPoolId", "OutputValue": f"pool-for-{StackName}"}],
+                }
+            ]
+        }
+
+        with patch("claude_code_with_bedrock.cli.commands.status.CloudFormationManager") as manager:
+            manager.return_value.cf_client = cf_client
+            stacks = command._get_stack_status(profile)
+            endpoints = command._get_endpoints(profile)
+            command._get_endpoints(profile)
+
+        described = sorted(call.kwargs["StackName"] for call in cf_client.describe_stacks.call_args_list)
+        assert described == ["test-pool-dashboard", "test-pool-otel-collector", "test-pool-stack"]
+        assert stacks["auth"]["status"] == "CREATE_COMPLETE"
+        assert endpoints["identity_pool_id"] == "pool-for-test-pool-stack"
+        manager.assert_called_once_with(region="us-east-1")
+
+    def test_missing_stack_reports_not_found(self):
+        """Test that a stack that cannot be described is reported as NOT_FOUND without endpoints."""
+        command = StatusCommand()
+        profile = make_profile(monitoring_enabled=False)
+        cf_client = MagicMock()
+        cf_client.get_paginator.side_effect = Exception("not authorized to perform cloudformation:ListStacks")
+        cf_client.describe_stacks.side_effect = Exception("Stack with id test-pool-stack does not exist")
+
+        with patch("claude_code_with_bedrock.cli.commands.status.CloudFormationManager") as manager:
+            manager.return_value.cf_client = cf_client
+            assert command._get_stack_status(profile) == {"auth": {"status": "NOT_FOUND", "last_updated": None}}
+            assert command._get_endpoints(profile) == {}
+
+        cf_client.describe_stacks.assert_called_once()
+
+    def test_listed_stacks_skip_describes_for_missing_stacks(self):
+        """Test that one list_stacks call gives stack status and limits describes to existing stacks."""
+        command = StatusCommand()
+        profile = make_profile()
+        cf_client = MagicMock()
+        cf_client.get_paginator.return_value.paginate.return_value = [
+            {"StackSummaries": [{"StackName": "test-pool-stack", "StackStatus": "UPDATE_COMPLETE"}]},
+            {"StackSummaries": [{"StackName": "other-stack", "StackStatus": "CREATE_COMPLETE"}]},
+        ]
+        cf_client.describe_stacks.return_value = {
+            "Stacks": [
+                {"StackStatus": "UPDATE_COMPLETE", "Outputs": [{"OutputKey": "IdentityPoolId", "OutputValue": "pool"}]}
+            ]
+        }
+
+        with patch("claude_code_with_bedrock.cli.commands.status.CloudFormationManager") as manager:
+            manager.return_value.cf_client = cf_client
+            stacks = command._get_stack_status(profile)
+            endpoints = command._get_endpoints(profile)
+
+        assert stacks["auth"]["status"] == "UPDATE_COMPLETE"
+        assert stacks["monitoring"]["status"] == "NOT_FOUND"
+        assert stacks["dashboard"]["status"] == "NOT_FOUND"
+        assert endpoints["identity_pool_id"] == "pool"
+        cf_client.get_paginator.assert_called_once_with("list_stacks")
+        cf_client.describe_stacks.assert_called_once_with(StackName="test-pool-stack")
+
+    def test_json_status_is_plain_json(self, capsys):
+        """Test that --json output is parseable JSON with no Rich line wrapping."""
+        command = StatusCommand()
+        profile = make_profile(monitoring_enabled=False)
+        cf_client = MagicMock()
+        cf_client.get_paginator.return_value.paginate.return_value = [{"StackSummaries": []}]
+
+        with patch("claude_code_with_bedrock.cli.commands.status.CloudFormationManager") as manager:
+            manager.return_value.cf_client = cf_client
+            assert command._show_json_status(profile) == 0
+
+        status = json.loads(capsys.readouterr().out)
+        assert status["profile"] == "test"
+        assert status["stacks"] == {"auth": {"status": "NOT_FOUND", "last_updated": None}}
+
+    def test_rich_status_shows_missing_stacks_without_timestamp(self, capsys):
+        """Test that stacks that were not found show N/A as their last update."""
+        command = StatusCommand()
+        profile = make_profile(monitoring_enabled=False)
+        cf_client = MagicMock()
+        cf_client.get_paginator.return_value.paginate.return_value = [{"StackSummaries": []}]
+
+        with patch("claude_code_with_bedrock.cli.commands.status.CloudFormationManager") as manager:
+            manager.return_value.cf_client = cf_client
+            assert command._show_rich_status(profile, detailed=False) == 0
+
+        stack_section = capsys.readouterr().out.split("Stack Status")[1].split("Endpoints")[0]
+        assert "NOT_FOUND" in stack_section
+        assert "N/A" in stack_section
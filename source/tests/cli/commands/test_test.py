@@ -0,0 +1,285 @@
+# ABOUTME: Unit tests for the package test command
+# ABOUTME: Tests the boto3-based authentication and Bedrock checks without calling AWS
+
+"""Tests for the test command."""
+
+import io
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from botocore.exceptions import ClientError, EndpointConnectionError
+
+from claude_code_with_bedrock.cli.commands import test as test_command
+
+
+def make_session(identity=None, models=None, bedrock_error=None) -> MagicMock:
+    """Build a fake boto3 session whose STS and Bedrock clients return canned responses."""
+    sts = MagicMock()
+    sts.get_caller_identity.return_value = identity or {
+        "UserId": "AROAEXAMPLE:user@example.com",
+        "Account": "123456789012",
+        "Arn": "arn:aws:sts::123456789012:assumed-role/BedrockCognitoFederatedRole/user@example.com",
+    }
+    bedrock = MagicMock()
+    if bedrock_error:
+        bedrock.list_foundation_models.side_effect = bedrock_error
+    else:
+        bedrock.list_foundation_models.return_value = {"modelSummaries": [{"modelId": m} for m in models or []]}
+
+    session = MagicMock()
+    session.profile_name = "ccwb-test-1234"
+    session.client.side_effect = lambda service, **kwargs: sts if service == "sts" else bedrock
+    return session
+
+
+def access_denied(message: str) -> ClientError:
+    """Build an AccessDeniedException as raised by boto3."""
+    return ClientError({"Error": {"Code": "AccessDeniedException", "Message": message}}, "ListFoundationModels")
+
+
+class TestTestCommandChecks:
+    """Tests for the individual checks run by the test command."""
+
+    def test_authentication_uses_the_session(self):
+        """Test that authentication is verified through the session's STS client."""
+        session = make_session()
+
+        result = test_command.TestCommand()._test_authentication(session)
+
+        assert result["status"] == "✓"
+        assert result["details"].startswith("Authenticated as AROAEXAMPLE")
+
+    def test_authentication_times_out_when_the_credential_process_hangs(self):
+        """Test that a credential process that never returns is reported as timed out."""
+        session = make_session()
+        release = threading.Event()
+        session.client("sts").get_caller_identity.side_effect = lambda: release.wait(5)
+
+        try:
+            with patch.object(test_command, "AUTH_TIMEOUT", 0.1):
+                result = test_command.TestCommand()._test_authentication(session)
+        finally:
+            release.set()
+
+        assert result == {"status": "✗", "details": "Authentication timed out"}
+
+    def test_bedrock_access_lists_claude_models(self):
+        """Test that only Claude models are counted when the API test is skipped."""
+        session = make_session(models=["anthropic.claude-sonnet-4-5-20250929-v1:0", "anthropic.other-model"])
+
+        result = test_command.TestCommand()._test_bedrock_access(session, "us-east-1", with_api=False)
+
+        assert result == {"status": "✓", "details": "Found 1 Claude models"}
+
+    def test_bedrock_access_denied_names_the_role(self):
+        """Test that a permission error reports the role that lacks access."""
+        session = make_session(
+            bedrock_error=access_denied("User is not authorized to perform: bedrock:ListFoundationModels")
+        )
+
+        result = test_command.TestCommand()._test_bedrock_access(session, "us-east-1", with_api=False)
+
+        assert result == {
+            "status": "✗",
+            "details": "Role BedrockCognitoFederatedRole lacks bedrock:ListFoundationModels permission",
+        }
+
+    def test_caller_identity_is_fetched_once(self):
+        """Test that authentication, role and Bedrock checks share one STS call."""
+        session = make_session(models=["anthropic.claude-sonnet-4-5-20250929-v1:0"])
+        profile = MagicMock(identity_pool_name="test-pool")
+        command = test_command.TestCommand()
+
+        with patch.object(command, "_get_expected_account", return_value=None):
+            command._test_authentication(session)
+            command._test_iam_role(session, profile)
+            command._test_bedrock_access(session, "us-east-1", with_api=False)
+            command._test_bedrock_access(session, "us-west-2", with_api=False)
+
+        sts = session.client("sts")
+        sts.get_caller_identity.assert_called_once_with()
+
+    def test_bedrock_clients_are_created_once_per_region(self):
+        """Test that concurrent region checks share one client per region."""
+        session = make_session(models=["anthropic.claude-sonnet-4-5-20250929-v1:0"])
+        command = test_command.TestCommand()
+        regions = ["us-east-1", "us-east-2", "us-west-2"] * 3
+
+        with test_command.ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(lambda r: command._test_bedrock_access(session, r, with_api=False), regions))
+
+        assert all(result["status"] == "✓" for result in results)
+        bedrock_regions = sorted(
+            call.kwargs["region_name"] for call in session.client.call_args_list if call.args == ("bedrock",)
+        )
+        assert bedrock_regions == ["us-east-1", "us-east-2", "us-west-2"]
+
+    def test_model_invocation_reads_the_response_body(self):
+        """Test that the model is invoked through bedrock-runtime and the reply text is returned."""
+        session = make_session()
+        runtime = session.client("bedrock-runtime", region_name="us-east-1")
+        runtime.invoke_model.return_value = {"body": io.BytesIO(b'{"content": [{"text": " test successful "}]}')}
+
+        result = test_command.TestCommand()._test_model_invocation(session, "us-east-1", "us.anthropic.claude-v1")
+
+        assert result == {"success": True, "response": "test successful"}
+        assert runtime.invoke_model.call_args.kwargs["modelId"] == "us.anthropic.claude-v1"
+
+    def test_model_invocation_maps_throttling(self):
+        """Test that a ThrottlingException is reported as rate limiting."""
+        session = make_session()
+        runtime = session.client("bedrock-runtime", region_name="us-east-1")
+        runtime.invoke_model.side_effect = ClientError(
+            {"Error": {"Code": "ThrottlingException", "Message": "Too many requests"}}, "InvokeModel"
+        )
+
+        result = test_command.TestCommand()._test_model_invocation(session, "us-east-1", "us.anthropic.claude-v1")
+
+        assert result == {"success": False, "error": "Rate limited"}
+
+    def test_aws_profile_is_looked_up_by_section(self, tmp_path, monkeypatch):
+        """Test that the AWS profile check matches whole config sections only."""
+        aws_dir = tmp_path / ".aws"
+        aws_dir.mkdir()
+        (aws_dir / "config").write_text(
+            "[profile ccwb-test-1234]\ncredential_process = /opt/credential-process --profile %s\n"
+            "[profile other]\n# [profile commented-out]\n"
+        )
+        monkeypatch.delenv("AWS_CONFIG_FILE", raising=False)
+        monkeypatch.setenv("HOME", str(tmp_path))
+        command = test_command.TestCommand()
+
+        assert command._test_aws_profile("ccwb-test-1234")["status"] == "✓"
+        assert command._test_aws_profile("commented-out")["status"] == "✗"
+
+        assert command._aws_config.get("profile ccwb-test-1234", "credential_process").endswith("%s")
+
+    def test_model_list_is_fetched_once_per_region(self):
+        """Test that repeated checks of a region reuse its Claude model list."""
+        session = make_session(models=["anthropic.claude-sonnet-4-5-20250929-v1:0"])
+        command = test_command.TestCommand()
+
+        for _ in range(3):
+            assert command._test_bedrock_access(session, "us-east-1", with_api=False)["status"] == "✓"
+
+        bedrock = session.client("bedrock", region_name="us-east-1")
+        bedrock.list_foundation_models.assert_called_once_with(byProvider="Anthropic")
+
+    def test_regions_keep_order(self):
+        """Test that concurrent region results are reported in the configured region order."""
+        session = make_session(models=["anthropic.claude-sonnet-4-5-20250929-v1:0"])
+        regions = ["us-west-2", "us-east-1", "us-east-2"]
+
+        rows = test_command.TestCommand()._test_regions(session, regions, with_api=False)
+
+        assert rows == [(f"Bedrock - {region}", "✓", "Found 1 Claude models") for region in regions]
+
+    def test_regions_stop_after_access_denied(self):
+        """Test that regions not yet started are skipped once access is denied in one region."""
+        denied = access_denied("User is not authorized to perform: bedrock:ListFoundationModels")
+        calls = []
+
+        def list_foundation_models(**kwargs):
+            # Later regions are slow, so the pool is shut down before a third one can start
+            calls.append(kwargs)
+            if len(calls) > 1:
+                time.sleep(0.1)
+            raise denied
+
+        session = make_session(bedrock_error=list_foundation_models)
+        regions = ["us-east-1", "us-east-2", "us-west-1", "us-west-2"]
+
+        with patch.object(test_command, "MAX_REGION_WORKERS", 1):
+            rows = test_command.TestCommand()._test_regions(session, regions, with_api=False)
+
+        assert rows[0] == (
+            "Bedrock - us-east-1",
+            "✗",
+            "Role BedrockCognitoFederatedRole lacks bedrock:ListFoundationModels permission",
+        )
+        assert rows[-1] == ("Bedrock - us-west-2", "-", "Skipped (access denied in another region)")
+        assert len(calls) <= 2
+
+    def test_bedrock_errors_are_classified_by_code(self):
+        """Test that list_foundation_models errors are described from their error code."""
+        session = make_session(
+            bedrock_error=ClientError(
+                {"Error": {"Code": "UnrecognizedClientException", "Message": "The security token is invalid"}},
+                "ListFoundationModels",
+            )
+        )
+
+        result = test_command.TestCommand()._test_bedrock_access(session, "us-east-1", with_api=False)
+
+        assert result == {"status": "✗", "details": "Invalid credentials or role"}
+
+    def test_unreachable_bedrock_endpoint_fails_fast(self):
+        """Test that a region whose Bedrock endpoint cannot be reached is reported as unreachable."""
+        session = make_session(
+            bedrock_error=EndpointConnectionError(endpoint_url="https://bedrock.xx-east-1.amazonaws.com/")
+        )
+
+        result = test_command.TestCommand()._test_bedrock_access(session, "xx-east-1", with_api=False)
+
+        assert result == {"status": "✗", "details": "Bedrock endpoint unreachable in xx-east-1"}
+        config = session.client.call_args_list[-1].kwargs["config"]
+        assert config.connect_timeout == 3
+
+    def test_temporary_aws_profile_round_trip(self, tmp_path, monkeypatch):
+        """Test that the test profile is appended to and removed from AWS_CONFIG_FILE, leaving the rest intact."""
+        aws_config = tmp_path / "custom-aws-config"
+        original = "# managed by hand\n[default]\nregion = us-east-1\n\n[profile other]\nregion = eu-west-1\n"
+        aws_config.write_text(original)
+        monkeypatch.setenv("AWS_CONFIG_FILE", str(aws_config))
+        monkeypatch.setenv("HOME", str(tmp_path / "home"))
+        command = test_command.TestCommand()
+
+        assert command._add_aws_profile("ccwb-test-1234", {"credential_process": "/bin/true", "region": "us-west-2"})
+        assert command._test_aws_profile("ccwb-test-1234")["status"] == "✓"
+        command._remove_aws_profile("ccwb-test-1234")
+
+        assert aws_config.read_text() == original
+        assert not (tmp_path / "home").exists()
+
+    def test_interrupted_profile_removal_keeps_the_aws_config(self, tmp_path, monkeypatch):
+        """Test that a write interrupted while removing the test profile leaves the AWS config file intact."""
+        aws_config = tmp_path / "aws-config"
+        original = "[default]\nregion = us-east-1\n\n[profile ccwb-test-1234]\nregion = us-west-2\n"
+        aws_config.write_text(original)
+        monkeypatch.setenv("AWS_CONFIG_FILE", str(aws_config))
+
+        with patch("claude_code_with_bedrock.config.os.replace", side_effect=KeyboardInterrupt):
+            with pytest.raises(KeyboardInterrupt):
+                test_command.TestCommand()._remove_aws_profile("ccwb-test-1234")
+
+        assert aws_config.read_text() == original
+        assert list(tmp_path.iterdir()) == [aws_config]
+
+    def test_temporary_aws_profile_is_removed_when_the_run_fails(self, tmp_path, monkeypatch):
+        """Test that the temporary profile is removed from the AWS config file on an early failure."""
+        package_dir = tmp_path / "dist"
+        package_dir.mkdir()
+        (package_dir / "install.sh").touch()
+        (package_dir / "config.json").write_text('{"test": {"aws_region": "us-east-1"}}')
+        binary = package_dir / "credential-process-linux-x64"
+        binary.write_text("#!/bin/sh\necho 1.0\n")
+        binary.chmod(0o755)
+        aws_config = tmp_path / "aws-config"
+        aws_config.write_text("[default]\nregion = us-east-1\n")
+        monkeypatch.setenv("AWS_CONFIG_FILE", str(aws_config))
+        monkeypatch.chdir(tmp_path)
+
+        command = test_command.TestCommand()
+        config = MagicMock(active_profile="test")
+        config.get_profile.return_value = None
+        with (
+            patch.object(test_command.Config, "load", return_value=config),
+            patch.object(command, "option", return_value=None),
+            patch.object(test_command.platform, "system", return_value="Linux"),
+            patch.object(test_command.platform, "machine", return_value="x86_64"),
+        ):
+            assert command.handle() == 1
+
+        assert aws_config.read_text() == "[default]\nregion = us-east-1\n"
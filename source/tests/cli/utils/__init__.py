@@ -0,0 +1,2 @@
+# ABOUTME: Test suite for CLI utility modules
+# ABOUTME: Contains tests for shared helpers used by the CLI commands
@@ -0,0 +1,146 @@
+# ABOUTME: Unit tests for the AWS CLI utility helpers
+# ABOUTME: Tests region caching, Bedrock probing and VPC discovery without calling AWS
+
+"""Tests for AWS CLI utilities."""
+
+from unittest.mock import patch
+
+import pytest
+
+from claude_code_with_bedrock.cli.utils.aws import (
+    CLOUDFORMATION_CLIENT_CONFIG,
+    check_bedrock_access,
+    fetch_stack_outputs,
+    get_all_vpcs_and_subnets,
+    get_cloudformation_client,
+    get_current_region,
+    get_stack_outputs,
+    invalidate_region_cache,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_region_cache():
+    """Keep the cached region and clients from leaking between tests."""
+    invalidate_region_cache()
+    get_cloudformation_client.cache_clear()
+    yield
+    invalidate_region_cache()
+    get_cloudformation_client.cache_clear()
+
+
+class TestGetCurrentRegion:
+    """Tests for get_current_region caching."""
+
+    def test_region_is_resolved_once(self):
+        """Test that repeated calls reuse the first resolved region."""
+        with patch("claude_code_with_bedrock.cli.utils.aws.boto3.Session") as mock_session:
+            mock_session.return_value.region_name = "eu-west-1"
+
+            assert get_current_region() == "eu-west-1"
+            assert get_current_region() == "eu-west-1"
+            assert mock_session.call_count == 1
+
+    def test_invalidate_region_cache(self):
+        """Test that invalidating the cache picks up a changed region."""
+        with patch("claude_code_with_bedrock.cli.utils.aws.boto3.Session") as mock_session:
+            mock_session.return_value.region_name = "eu-west-1"
+            assert get_current_region() == "eu-west-1"
+
+            mock_session.return_value.region_name = None
+            invalidate_region_cache()
+            assert get_current_region() == "us-east-1"
+            assert mock_session.call_count == 2
+
+
+class TestGetAllVpcsAndSubnets:
+    """Tests for fetching VPCs and subnets together."""
+
+    def test_subnets_are_grouped_by_vpc(self):
+        """Test that one unfiltered subnet listing is grouped under each VPC."""
+        with patch("claude_code_with_bedrock.cli.utils.aws.boto3.client") as mock_client:
+            ec2 = mock_client.return_value
+            ec2.describe_vpcs.return_value = {
+                "Vpcs": [
+                    {"VpcId": "vpc-b", "CidrBlock": "10.1.0.0/16", "State": "available"},
+                    {"VpcId": "vpc-a", "CidrBlock": "10.0.0.0/16", "State": "available", "IsDefault": True},
+                ]
+            }
+            ec2.describe_subnets.return_value = {
+                "Subnets": [
+                    {
+                        "SubnetId": f"subnet-{n}",
+                        "VpcId": vpc_id,
+                        "CidrBlock": "10.0.0.0/24",
+                        "AvailabilityZone": az,
+                        "AvailableIpAddressCount": 250,
+                    }
+                    for n, (vpc_id, az) in enumerate(
+                        [("vpc-a", "us-east-1b"), ("vpc-a", "us-east-1a"), ("vpc-b", "us-east-1c")]
+                    )
+                ]
+            }
+
+            result = get_all_vpcs_and_subnets("us-east-1")
+
+            ec2.describe_subnets.assert_called_once_with()
+            assert list(result) == ["vpc-a", "vpc-b"]
+            vpc, subnets = result["vpc-a"]
+            assert vpc["is_default"] is True
+            assert [s["id"] for s in subnets] == ["subnet-1", "subnet-0"]
+            assert [s["id"] for s in result["vpc-b"][1]] == ["subnet-2"]
+
+    def test_errors_return_empty_mapping(self):
+        """Test that an API failure is reported as no VPCs."""
+        with patch("claude_code_with_bedrock.cli.utils.aws.boto3.client") as mock_client:
+            mock_client.return_value.describe_vpcs.side_effect = Exception("AccessDenied")
+            assert get_all_vpcs_and_subnets("us-east-1") == {}
+
+
+class TestCheckBedrockAccess:
+    """Tests for the Bedrock access probe."""
+
+    def test_probe_lists_only_anthropic_models(self):
+        """Test that the probe filters models server-side."""
+        with patch("claude_code_with_bedrock.cli.utils.aws.boto3.client") as mock_client:
+            bedrock = mock_client.return_value
+            bedrock.list_foundation_models.return_value = {
+                "modelSummaries": [{"modelId": "anthropic.claude-sonnet-4-5-20250929-v1:0"}]
+            }
+
+            assert check_bedrock_access("us-east-1") is True
+            bedrock.list_foundation_models.assert_called_once_with(byProvider="Anthropic")
+
+            bedrock.list_foundation_models.return_value = {"modelSummaries": []}
+            assert check_bedrock_access("us-east-1") is False
+
+
+class TestCloudFormationClient:
+    """Tests for the shared CloudFormation client."""
+
+    def test_client_is_shared_per_region(self):
+        """Test that stack lookups in one region reuse a single configured client."""
+        with patch("claude_code_with_bedrock.cli.utils.aws.boto3.client") as mock_client:
+            mock_client.return_value.describe_stacks.return_value = {
+                "Stacks": [{"Outputs": [{"OutputKey": "IdentityPoolId", "OutputValue": "pool"}]}]
+            }
+
+            assert get_stack_outputs("auth-stack", "us-east-1") == {"IdentityPoolId": "pool"}
+            assert get_stack_outputs("auth-stack", "us-east-1") == {"IdentityPoolId": "pool"}
+            get_stack_outputs("auth-stack", "eu-west-1")
+
+            assert mock_client.call_count == 2
+            mock_client.assert_any_call("cloudformation", region_name="us-east-1", config=CLOUDFORMATION_CLIENT_CONFIG)
+            assert CLOUDFORMATION_CLIENT_CONFIG.retries["mode"] == "adaptive"
+
+    def test_fetch_stack_outputs_raises_while_get_stack_outputs_prints(self, capsys):
+        """Test that fetch_stack_outputs leaves errors to the caller and get_stack_outputs reports them."""
+        with patch("claude_code_with_bedrock.cli.utils.aws.boto3.client") as mock_client:
+            mock_client.return_value.describe_stacks.side_effect = RuntimeError("stack missing")
+
+            with pytest.raises(RuntimeError, match="stack missing"):
+                fetch_stack_outputs("auth-stack", "us-east-1")
+            assert capsys.readouterr().out == ""
+
+            assert get_stack_outputs("auth-stack", "us-east-1") == {}
+            assert "Error getting stack outputs: stack missing" in capsys.readouterr().out
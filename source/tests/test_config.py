@@ -8,7 +8,9 @@ import tempfile
 from pathlib import Path
 from unittest.mock import patch
 
-from claude_code_with_bedrock.config import Config, Profile
+import pytest
+
+from claude_code_with_bedrock.config import Config, Profile, atomic_write_text, dumps_json
 
 
 class TestProfileModel:
@@ -62,6 +64,30 @@ class TestProfileModel:
         assert profile.cross_region_profile == "us"
         assert profile.allowed_bedrock_regions == ["us-east-1", "us-east-2", "us-west-2"]
 
+    @pytest.mark.parametrize(
+        "domain,expected",
+        [
+            ("test.okta.com", "okta"),
+            ("https://login.microsoftonline.com/tenant/v2.0", "azure"),
+            ("okta.com.evil.com", None),
+            ("keycloak.example.com", None),
+        ],
+    )
+    def test_from_dict_detects_known_provider_type(self, domain, expected):
+        """Test that a missing provider_type is filled in only for known provider domains."""
+        data = {
+            "name": "test",
+            "provider_domain": domain,
+            "client_id": "test-client",
+            "credential_storage": "session",
+            "aws_region": "us-east-1",
+            "identity_pool_name": "test-pool",
+        }
+
+        profile = Profile.from_dict(data)
+
+        assert profile.provider_type == expected
+
     def test_migration_us_regions_to_cross_region_profile(self):
         """Test that existing US regions configs get 'us' cross-region profile."""
         # Legacy config without cross_region_profile but with US regions
@@ -117,6 +143,24 @@ class TestProfileModel:
         assert result["cross_region_profile"] == "us"
         assert result["allowed_bedrock_regions"] == ["us-east-1", "us-east-2", "us-west-2"]
 
+    def test_resolved_stack_names_prefer_configured_names(self):
+        """Test that configured stack names override the names derived from the identity pool."""
+        profile = Profile(
+            name="test",
+            provider_domain="test.okta.com",
+            client_id="test-client",
+            credential_storage="session",
+            aws_region="us-east-1",
+            identity_pool_name="test-pool",
+            stack_names={"auth": "custom-auth"},
+        )
+
+        names = profile.resolved_stack_names
+
+        assert names["auth"] == "custom-auth"
+        assert names["monitoring"] == "test-pool-otel-collector"
+        assert names["dashboard"] == "test-pool-dashboard"
+
 
 class TestConfigManager:
     """Tests for the Config manager."""
@@ -192,3 +236,71 @@ class TestConfigManager:
                         assert profile is not None
                         # Should auto-detect US profile from regions
                         assert profile.cross_region_profile == "us"
+
+
+class TestAtomicWrite:
+    """Tests for atomic configuration file writes."""
+
+    def test_atomic_write_replaces_file(self):
+        """Test that the target is replaced and no temporary file is left behind."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            target = Path(tmpdir) / "config.json"
+            target.write_text('{"old": true}')
+
+            atomic_write_text(target, '{"new": true}')
+
+            assert json.loads(target.read_text()) == {"new": True}
+            assert list(Path(tmpdir).iterdir()) == [target]
+
+    def test_each_write_uses_its_own_temporary_file(self):
+        """Test that concurrent writers to one file never share a temporary file."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            target = Path(tmpdir) / "config.json"
+
+            with patch("claude_code_with_bedrock.config.os.replace") as mock_replace:
+                atomic_write_text(target, '{"first": true}')
+                atomic_write_text(target, '{"second": true}')
+
+            first, second = (call.args[0] for call in mock_replace.call_args_list)
+            assert first != second
+            assert first.parent == second.parent == target.parent
+            assert first.name.startswith(".config.json.")
+            assert json.loads(first.read_text()) == {"first": True}
+            assert json.loads(second.read_text()) == {"second": True}
+
+    def test_interrupted_write_keeps_original(self):
+        """Test that a failed write leaves the original file intact."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            target = Path(tmpdir) / "config.json"
+            target.write_text('{"old": true}')
+
+            with patch("claude_code_with_bedrock.config.os.replace", side_effect=KeyboardInterrupt):
+                with pytest.raises(KeyboardInterrupt):
+                    atomic_write_text(target, '{"new": true}')
+
+            assert json.loads(target.read_text()) == {"old": True}
+            assert list(Path(tmpdir).iterdir()) == [target]
+
+
+class TestDumpsJson:
+    """Tests for JSON serialization of config and progress files."""
+
+    DATA = {"name": "prod", "aws": {"region": "eu-west-1", "regions": ["eu-west-1", "eu-west-3"]}, "note": "Zürich"}
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_output_matches_stdlib_json(self, use_orjson):
+        """Test that the output is identical with and without orjson installed."""
+        import claude_code_with_bedrock.config as config_module
+
+        if use_orjson:
+            pytest.importorskip("orjson")
+            orjson_module = config_module.orjson
+        else:
+            orjson_module = None
+
+        with patch.object(config_module, "orjson", orjson_module):
+            assert dumps_json(self.DATA) == json.dumps(self.DATA, separators=(",", ":"), ensure_ascii=False)
+            assert dumps_json(self.DATA, indent=True) == json.dumps(self.DATA, indent=2, ensure_ascii=False)
+            assert dumps_json(self.DATA, sort_keys=True) == json.dumps(
+                self.DATA, separators=(",", ":"), sort_keys=True, ensure_ascii=False
+            )
@@ -13,6 +13,7 @@ from claude_code_with_bedrock.models import (
     get_default_region_for_profile,
     get_destination_regions_for_model_profile,
     get_model_id_for_profile,
+    get_model_key_for_model_id,
     get_profile_description,
     get_source_regions_for_model_profile,
 )
@@ -146,6 +147,18 @@ class TestModelConfiguration:
         with pytest.raises(ValueError, match="not available in profile"):
             get_model_id_for_profile("opus-4-1", "europe")  # Opus 4.1 not available in Europe
 
+    def test_get_model_key_for_model_id(self):
+        """Test resolving a model ID from any profile back to its model key."""
+        assert get_model_key_for_model_id("us.anthropic.claude-opus-4-6-v1") == "opus-4-6"
+        assert get_model_key_for_model_id("eu.anthropic.claude-sonnet-4-20250514-v1:0") == "sonnet-4"
+
+        # Every profile's model ID maps back to its own model
+        for model_key, model_info in CLAUDE_MODELS.items():
+            for profile_config in model_info["profiles"].values():
+                assert get_model_key_for_model_id(profile_config["model_id"]) == model_key
+
+        assert get_model_key_for_model_id("unknown.model-id") is None
+
     def test_get_default_region_for_profile(self):
         """Test getting default regions for profiles."""
         assert get_default_region_for_profile("us") == "us-east-1"
@@ -0,0 +1,98 @@
+# ABOUTME: Unit tests for wizard progress persistence
+# ABOUTME: Tests journaled step saves, replay on resume, and legacy file handling
+
+"""Tests for WizardProgress."""
+
+import json
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from claude_code_with_bedrock.cli.utils.progress import WizardProgress
+
+
+@pytest.fixture
+def home(tmp_path):
+    """Point the progress file at a temporary home directory."""
+    with patch("claude_code_with_bedrock.cli.utils.progress.Path.home", return_value=tmp_path):
+        yield tmp_path
+
+
+class TestWizardProgress:
+    """Tests for saving and resuming wizard progress."""
+
+    def test_save_step_appends_only_changed_keys(self, home):
+        """Test that each save writes only the keys changed in that step."""
+        progress = WizardProgress("init")
+        config = {"okta": {"domain": "company.okta.com"}}
+        progress.save_step("oidc_complete", config)
+
+        config["aws"] = {"region": "us-east-1"}
+        progress.save_step("aws_complete", config)
+
+        records = [json.loads(line) for line in progress.progress_file.read_text().splitlines()]
+        assert [r["step"] for r in records] == ["oidc_complete", "aws_complete"]
+        assert records[0]["data"] == {"okta": {"domain": "company.okta.com"}}
+        assert records[1]["data"] == {"aws": {"region": "us-east-1"}}
+
+    def test_resume_replays_journal(self, home):
+        """Test that a new session rebuilds the full state from the journal."""
+        progress = WizardProgress("init")
+        progress.save_step("oidc_complete", {"okta": {"domain": "company.okta.com"}})
+        progress.save_step("aws_complete", {"aws": {"region": "eu-west-1"}})
+
+        resumed = WizardProgress("init")
+        assert resumed.get_last_step() == "aws_complete"
+        assert resumed.get_saved_data() == {
+            "okta": {"domain": "company.okta.com"},
+            "aws": {"region": "eu-west-1"},
+        }
+        # The journal is compacted into a single record on load
+        assert len(resumed.progress_file.read_text().splitlines()) == 1
+
+    def test_torn_trailing_record_is_ignored(self, home):
+        """Test that an interrupted write does not lose earlier steps."""
+        progress = WizardProgress("init")
+        progress.save_step("oidc_complete", {"okta": {"domain": "company.okta.com"}})
+        with open(progress.progress_file, "a") as f:
+            f.write('{"step":"aws_complete","data":{"aws"')
+
+        resumed = WizardProgress("init")
+        assert resumed.get_last_step() == "oidc_complete"
+        assert resumed.get_saved_data() == {"okta": {"domain": "company.okta.com"}}
+
+    def test_legacy_progress_file_is_loaded(self, home):
+        """Test that a pretty-printed single-object progress file still resumes."""
+        progress_file = home / ".claude-code-with-bedrock" / ".init_progress.json"
+        progress_file.parent.mkdir()
+        progress_file.write_text(
+            json.dumps(
+                {
+                    "step": "aws_complete",
+                    "data": {"aws": {"region": "us-west-2"}},
+                    "timestamp": datetime.now().isoformat(),
+                },
+                indent=2,
+            )
+        )
+
+        progress = WizardProgress("init")
+        progress.save_step("monitoring_complete", {"monitoring": {"enabled": True}})
+
+        resumed = WizardProgress("init")
+        assert resumed.get_last_step() == "monitoring_complete"
+        assert resumed.get_saved_data() == {"aws": {"region": "us-west-2"}, "monitoring": {"enabled": True}}
+
+    def test_stale_progress_is_discarded(self, home):
+        """Test that progress older than a day is not resumed or replayed later."""
+        progress_file = home / ".claude-code-with-bedrock" / ".init_progress.json"
+        progress_file.parent.mkdir()
+        stale = (datetime.now() - timedelta(days=2)).isoformat()
+        progress_file.write_text(json.dumps({"step": "aws_complete", "data": {"aws": {}}, "timestamp": stale}))
+
+        progress = WizardProgress("init")
+        assert not progress.has_saved_progress()
+
+        progress.save_step("oidc_complete", {"okta": {"domain": "company.okta.com"}})
+        assert WizardProgress("init").get_saved_data() == {"okta": {"domain": "company.okta.com"}}
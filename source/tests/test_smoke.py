@@ -241,6 +241,20 @@ class TestCommandImports:
         except Exception as e:
             pytest.fail(f"Failed to import main CLI module: {e}")
 
+    def test_all_lazy_commands_resolve(self):
+        """Test that every lazily registered command loads under its registered name.
+
+        Commands are imported on first use, so a typo in the command table
+        would otherwise only surface when a user runs that command.
+        """
+        from claude_code_with_bedrock.cli import COMMANDS, create_application
+
+        app = create_application()
+        for name in COMMANDS:
+            command = app.find(name)
+            assert isinstance(command, Command), f"{name} did not resolve to a Command"
+            assert command.name == name, f"{name} resolved to command named {command.name}"
+
     def test_all_quota_commands_registered(self):
         """Test that all quota commands are properly defined.
 
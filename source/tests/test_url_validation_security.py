@@ -201,6 +201,34 @@ class TestURLValidationSecurity:
             assert detect_provider_type_secure(domain) == expected, f"Backward compatibility broken for {domain}"
 
 
+class TestSharedProviderDetection:
+    """Test the shipped provider detection used by the CLI"""
+
+    def test_known_provider_hostnames(self):
+        """Test exact-domain and subdomain matches for each known provider"""
+        from claude_code_with_bedrock.utils.url_validation import get_known_provider_type
+
+        cases = [
+            ("okta.com", "okta"),
+            ("Company.OKTA.com", "okta"),
+            ("your-name.auth0.com", "auth0"),
+            ("login.microsoftonline.com", "azure"),
+            ("sts.windows.net", "azure"),
+            ("my-app.auth-fips.us-gov-west-1.amazoncognito.com", "cognito"),
+        ]
+        for hostname, expected in cases:
+            assert get_known_provider_type(hostname) == expected, f"Failed for {hostname}"
+
+    def test_bypass_attempts_are_not_matched(self):
+        """Test that lookalike hostnames are not classified as a known provider"""
+        from claude_code_with_bedrock.utils.url_validation import detect_provider_type_secure, get_known_provider_type
+
+        for hostname in ["okta.com.evil.com", "notokta.com", "evil-auth0.com", "com", ""]:
+            assert get_known_provider_type(hostname) is None, f"Bypass succeeded for {hostname}"
+        assert detect_provider_type_secure("evil.com/okta.com") == "oidc"
+        assert detect_provider_type_secure("https://company.okta.com/oauth2/default") == "okta"
+
+
 class TestCredentialSanitization:
     """Test cases for credential logging sanitization"""
 